@@ -2,6 +2,12 @@
 Entry point for the FinPlan application.
 Ensures proper package setup when launched as a standalone script,
 initializes the GUI, and starts the Qt event loop.
+
+With a command argument (e.g. `python -m FinPlan batch DIR`) the headless
+CLI in cli.py runs instead; Qt is then never imported.
+
+`--profile-startup` (or FINPLAN_PROFILE_STARTUP=1) prints import and
+construction times once the main window is up, see startup_profile.py.
 """
 
 import os
@@ -14,19 +20,58 @@ if __name__ == "__main__" and __package__ is None:
     sys.path.insert(0, parent)
     __package__ = "FinPlan"
 
-from PyQt5.QtWidgets import QApplication
-from .view.main_window import MainWindow
-from .controller.fin_controller import FinController
+from . import startup_profile
+
+HEADLESS_COMMANDS = ("batch", "convert", "import", "export", "goal", "simulate", "rule")  # subcommands handled by cli.main
+PROFILE_FLAG = "--profile-startup"
+
 
 def main():
     """
     Instantiate the QApplication, create and show the main window,
     then run the Qt event loop until the app exits.
     """
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
+    if len(sys.argv) > 1 and sys.argv[1] in HEADLESS_COMMANDS + ("-h", "--help"):
+        from .cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    if PROFILE_FLAG in sys.argv or startup_profile.enabled_by_environment():
+        if PROFILE_FLAG in sys.argv:
+            sys.argv.remove(PROFILE_FLAG)
+        startup_profile.enable()
+    phase = startup_profile.phase
+
+    # GUI imports are deferred so headless commands never load Qt
+    with phase("import PyQt5"):
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import QTimer
+    with phase("import main window"):
+        from .view.main_window import MainWindow
+
+    with phase("QApplication"):
+        app = QApplication(sys.argv)
+    with phase("MainWindow"):
+        window = MainWindow()
+    with phase("show"):
+        window.show()
+    startup_profile.milestone("window shown")
+
+    # Flush pending autosave changes when the app quits and on SIGTERM/SIGHUP;
+    # let Python run signal handlers while Qt owns the event loop
+    if window.controller is not None:
+        from .model.autosave import install_exit_handlers
+        app.aboutToQuit.connect(window.controller.model.flush)
+        install_exit_handlers(window.controller.model.flush)
+    signal_pump = QTimer()
+    signal_pump.timeout.connect(lambda: None)
+    signal_pump.start(500)
+
+    if startup_profile.is_enabled():
+        def first_frame():
+            startup_profile.milestone("event loop running (first window frame)")
+            startup_profile.report()
+        QTimer.singleShot(0, first_frame)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
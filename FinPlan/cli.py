@@ -0,0 +1,460 @@
+"""
+Headless command line interface.
+
+    python -m FinPlan batch DIR [DIR|FILE ...] [-o report.csv] [--format csv|json]
+                            [--horizon N] [--workers N]
+    python -m FinPlan convert SRC DST
+    python -m FinPlan import FILE [WORKBOOK] [--map LABEL=CATEGORY ...] [--replace]
+    python -m FinPlan export {ledger,forecast,chart} WORKBOOK OUT [--format csv|columnar]
+    python -m FinPlan goal {income,expenses,funding} WORKBOOK [--until YYYY-MM] [--runway N]
+    python -m FinPlan rule {list,add,remove} WORKBOOK [--category C --amount A --start YYYY-MM ...]
+
+batch runs the forecast metrics and chart series of every scenario for
+each workbook file and writes one consolidated report. Workbooks are
+processed in parallel worker processes. convert translates a workbook
+between the JSON and the binary (.fpb) snapshot format. import streams a
+CSV or XLSX ledger export into a workbook (see model/importer.py); export
+streams a workbook's ledger, forecast metrics or chart series to CSV or a
+columnar binary file (.fpc, see model/exporter.py). goal solves for the
+income level, expense level or funding that keeps a workbook solvent
+through a month (see model/goal_seek.py). rule manages the recurring
+income/expense rules of a workbook (see model/recurring.py). Only the model
+package is imported, so PyQt5 and matplotlib are neither needed nor loaded.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+from .model.constants import SCENARIO_FACTORS, DEFAULT_HORIZON, MAX_HORIZON, DEFAULT_EXPENSE_CATEGORIES
+from .model.binary_store import convert, open_store
+from .model.data_store import DataStore
+from .model.fin_model import FinModel
+from .model.importer import LedgerImporter, ImportProgress
+from .model.exporter import EXPORTS, export
+from .model.goal_seek import GOALS
+from .model.recurring import RecurringRule
+from .model.category import Category
+from .model.sweep import INCOME_GROUPS, EXPENSE_GROUPS
+
+REPORT_FIELDS = [
+    "workbook", "scenario", "type", "month",
+    "net_cash_flow", "closing_balance", "runway",
+]
+
+
+def find_workbooks(paths: list) -> list[Path]:
+    """
+    Expand directories into the workbook files (JSON or binary) they contain.
+
+    :param paths: directories and/or individual files
+    :return: sorted list of workbook paths
+    """
+    found = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            found.extend(f for pattern in ("*.json", "*.fpb")
+                         for f in p.glob(pattern) if f.is_file())
+        else:
+            found.append(p)
+    return sorted(set(found))
+
+
+def forecast_workbook(path: Path, horizon: int = DEFAULT_HORIZON) -> dict:
+    """
+    Compute metrics and chart series of every scenario for one workbook.
+
+    :param path: workbook file (JSON or binary)
+    :param horizon: months in the forecast window
+    :return: {"file", "period_start", "scenarios": {name: {"metrics", "chart"}}}
+        or {"file", "error"} if the workbook could not be processed
+    """
+    try:
+        model = FinModel(store=open_store(path))
+        model.set_horizon(horizon)
+        scenarios = {}
+        for name in SCENARIO_FACTORS:
+            headers, net_row, close_row, runway_row = model.generate_forecast_metrics(name)
+            net_flows, runways = model.get_chart_data(name)
+            scenarios[name] = {
+                "metrics": {
+                    "months": headers,
+                    "net_cash_flow": net_row,
+                    "closing_balance": close_row,
+                    "runway": runway_row,
+                },
+                "chart": {"net_flows": net_flows, "runways": runways},
+            }
+    except Exception as exc:
+        return {"file": str(path), "error": f"{type(exc).__name__}: {exc}"}
+
+    return {
+        "file": str(path),
+        "period_start": model.period_start.isoformat() if model.period_start else None,
+        "scenarios": scenarios,
+    }
+
+
+def _forecast_task(args):
+    """Worker-process entry point: unpack (path, horizon)."""
+    return forecast_workbook(*args)
+
+
+def report_rows(result: dict):
+    """
+    Flatten one workbook result into report rows.
+
+    Actual months come from the chart history (no closing balance), forecast
+    months from the metrics table.
+    """
+    for name, data in result.get("scenarios", {}).items():
+        chart = data["chart"]
+        for (kind, label, net), (_, _, runway) in zip(chart["net_flows"], chart["runways"]):
+            if kind != "actual":
+                continue
+            yield {
+                "workbook": result["file"], "scenario": name, "type": "actual",
+                "month": label, "net_cash_flow": net, "closing_balance": "",
+                "runway": round(runway, 2),
+            }
+        m = data["metrics"]
+        for label, net, close, runway in zip(
+            m["months"], m["net_cash_flow"], m["closing_balance"], m["runway"]
+        ):
+            yield {
+                "workbook": result["file"], "scenario": name, "type": "forecast",
+                "month": label, "net_cash_flow": net, "closing_balance": close,
+                "runway": runway,
+            }
+
+
+def write_report(results: list[dict], out, fmt: str):
+    """
+    Write the consolidated report.
+
+    :param results: forecast_workbook() results
+    :param out: text stream
+    :param fmt: "csv" or "json"
+    """
+    if fmt == "json":
+        json.dump({
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "workbooks": [r for r in results if "error" not in r],
+            "errors": [r for r in results if "error" in r],
+        }, out, indent=2)
+        out.write("\n")
+        return
+
+    writer = csv.DictWriter(out, fieldnames=REPORT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for result in results:
+        writer.writerows(report_rows(result))
+
+
+def run_batch(paths: list, horizon: int = DEFAULT_HORIZON,
+              workers: Optional[int] = None) -> list[dict]:
+    """
+    Forecast many workbooks, in parallel when more than one worker is available.
+
+    :param paths: directories and/or workbook files
+    :param horizon: months in the forecast window
+    :param workers: worker processes (default: one per core)
+    :return: results in workbook path order
+    """
+    files = find_workbooks(paths)
+    tasks = [(f, horizon) for f in files]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return [_forecast_task(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_forecast_task, tasks))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for the headless commands."""
+    parser = argparse.ArgumentParser(prog="python -m FinPlan", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="forecast every workbook in one or more directories")
+    batch.add_argument("paths", nargs="+", help="directories of workbook files, or files")
+    batch.add_argument("-o", "--output", help="report file (default: stdout)")
+    batch.add_argument("--format", choices=("csv", "json"),
+                       help="report format (default: from the output suffix, else csv)")
+    batch.add_argument("--horizon", type=int, default=DEFAULT_HORIZON,
+                       help=f"forecast months, 1..{MAX_HORIZON} (default: {DEFAULT_HORIZON})")
+    batch.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+
+    conv = commands.add_parser("convert", help="convert a workbook between JSON and binary (.fpb)")
+    conv.add_argument("src", help="existing workbook file")
+    conv.add_argument("dst", help="file to write; the suffix .fpb selects the binary format")
+
+    imp = commands.add_parser("import", help="import a CSV/XLSX ledger export into a workbook")
+    imp.add_argument("file", help="CSV (.csv, .tsv, .txt) or Excel (.xlsx) export")
+    imp.add_argument("workbook", nargs="?", default=str(DataStore.FILE),
+                     help=f"workbook to import into (default: {DataStore.FILE})")
+    imp.add_argument("--column", action="append", default=[], metavar="FIELD=HEADER",
+                     help="header of an entry field (date, category, direction, amount, type)")
+    imp.add_argument("--map", action="append", default=[], metavar="LABEL=CATEGORY",
+                     help="translate an export category label to a FinPlan category")
+    imp.add_argument("--default-category", help="category for labels that do not match")
+    imp.add_argument("--type", choices=("actual", "forecast"), default="actual",
+                     help="entry type when the file has no type column (default: actual)")
+    imp.add_argument("--replace", action="store_true",
+                     help="replace existing monthly amounts instead of adding to them")
+    imp.add_argument("--decimal-comma", action="store_true", help="amounts use ',' as decimal separator")
+    imp.add_argument("--date-format", help="strptime format of the date column (default: ISO)")
+    imp.add_argument("--sheet", help="XLSX sheet name (default: first sheet)")
+    imp.add_argument("--strict", action="store_true", help="abort on the first invalid row")
+
+    exp = commands.add_parser("export", help="export ledger, forecast metrics or chart series")
+    exp.add_argument("what", choices=tuple(EXPORTS), help="data to export")
+    exp.add_argument("workbook", help="workbook file (JSON or binary)")
+    exp.add_argument("output", help="file to write; the suffix .fpc selects the columnar format")
+    exp.add_argument("--format", choices=("csv", "columnar"),
+                     help="output format (default: from the output suffix, else csv)")
+    exp.add_argument("--scenario", action="append", choices=tuple(SCENARIO_FACTORS),
+                     help="scenario for forecast/chart exports (repeatable; default: all)")
+    exp.add_argument("--horizon", type=int, default=DEFAULT_HORIZON,
+                     help=f"forecast months, 1..{MAX_HORIZON} (default: {DEFAULT_HORIZON})")
+
+    goal = commands.add_parser("goal", help="find the income, expense level or funding that meets a runway target")
+    goal.add_argument("goal", choices=GOALS,
+                      help="minimum income factor, maximum expense factor or minimum funding")
+    goal.add_argument("workbook", help="workbook file (JSON or binary)")
+    goal.add_argument("--until", help="last month the target must hold, YYYY-MM (default: end of the window)")
+    goal.add_argument("--runway", type=float, default=0.0,
+                      help="runway months to keep (default: 0, a non-negative balance)")
+    goal.add_argument("--scenario", choices=tuple(SCENARIO_FACTORS), default="baseline",
+                      help="scenario whose factors are kept fixed (default: baseline)")
+    goal.add_argument("--group", action="append", choices=INCOME_GROUPS + EXPENSE_GROUPS,
+                      help="category group the solved factor applies to (repeatable; default: all)")
+
+    sim = commands.add_parser("simulate", help="Monte Carlo forecast: closing balance and runway percentiles")
+    sim.add_argument("workbook", help="workbook file (JSON or binary)")
+    sim.add_argument("--scenario", choices=tuple(SCENARIO_FACTORS), default="baseline",
+                     help="scenario whose factors set the mean amounts (default: baseline)")
+    sim.add_argument("--paths", type=int, default=10000, help="simulated paths (default: 10000)")
+    sim.add_argument("--seed", type=int, help="seed for reproducible results")
+    sim.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    sim.add_argument("--horizon", type=int, default=DEFAULT_HORIZON,
+                     help=f"forecast months, 1..{MAX_HORIZON} (default: {DEFAULT_HORIZON})")
+
+    rule = commands.add_parser("rule", help="list, add or remove recurring income/expense rules")
+    rule.add_argument("action", choices=("list", "add", "remove"))
+    rule.add_argument("workbook", help="workbook file (JSON or binary)")
+    rule.add_argument("--category", choices=[c.value for c in Category], metavar="CATEGORY",
+                      help="category of the rule (its direction follows from it)")
+    rule.add_argument("--amount", help="amount per occurrence in the first year")
+    rule.add_argument("--start", help="first month, YYYY-MM")
+    rule.add_argument("--end", help="last month, YYYY-MM (default: open-ended)")
+    rule.add_argument("--every", type=int, default=1, help="interval in months (default: 1)")
+    rule.add_argument("--growth", default="0", help="yearly growth rate, e.g. 0.05 for +5%% (default: 0)")
+    rule.add_argument("--index", type=int, help="rule number to remove, as shown by list")
+    return parser
+
+
+def _pairs(values: list, option: str) -> dict:
+    """Parse repeated KEY=VALUE options."""
+    pairs = {}
+    for value in values:
+        key, sep, target = value.partition("=")
+        if not sep:
+            raise ValueError(f"{option} expects KEY=VALUE, got {value!r}")
+        pairs[key.strip()] = target.strip()
+    return pairs
+
+
+def _print_progress(p: ImportProgress):
+    done = f"{p.fraction:6.1%}" if p.fraction is not None else ""
+    print(f"\r{done} {p.rows:>10,} rows  {p.rows_per_second:>10,.0f} rows/s  {p.errors:,} invalid",
+          end="", file=sys.stderr, flush=True)
+
+
+def run_import(args) -> int:
+    """Run the import command; return the exit code."""
+    try:
+        importer = LedgerImporter(
+            mapping=_pairs(args.column, "--column"),
+            category_map=_pairs(args.map, "--map"),
+            default_category=args.default_category,
+            entry_type=args.type,
+            replace=args.replace,
+            decimal_separator="," if args.decimal_comma else ".",
+            date_format=args.date_format,
+            max_errors=0 if args.strict else None,
+            progress=_print_progress if sys.stderr.isatty() else None,
+        )
+        model = FinModel(store=open_store(Path(args.workbook)))
+        open_args = {"sheet": args.sheet} if args.sheet else {}
+        result = importer.import_into(model, args.file, **open_args)
+    except (OSError, ValueError, KeyError) as exc:  # LedgerImportError is a ValueError
+        if sys.stderr.isatty():
+            print(file=sys.stderr)
+        print(f"{args.file}: {exc}", file=sys.stderr)
+        return 1
+
+    if importer.progress:
+        print(file=sys.stderr)
+    for number, message in result.error_samples:
+        print(f"{args.file}:{number}: {message}", file=sys.stderr)
+    if result.errors > len(result.error_samples):
+        print(f"... {result.errors - len(result.error_samples)} more invalid rows", file=sys.stderr)
+    print(f"{result.imported:,} of {result.rows:,} rows imported into {args.workbook} "
+          f"as {result.entries_written} monthly entries in {result.seconds:.2f} s "
+          f"({result.rows_per_second:,.0f} rows/s)", file=sys.stderr)
+    return 1 if result.errors else 0
+
+
+def run_export(args) -> int:
+    """Run the export command; return the exit code."""
+    if not 1 <= args.horizon <= MAX_HORIZON:
+        print(f"--horizon must be between 1 and {MAX_HORIZON}", file=sys.stderr)
+        return 2
+    try:
+        model = FinModel(store=open_store(Path(args.workbook)))
+        model.set_horizon(args.horizon)
+        rows = export(model, args.what, args.output, args.format, args.scenario)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"{args.workbook}: {type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
+    print(f"{rows:,} {args.what} rows written to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _month(text: str):
+    """Parse a YYYY-MM month argument."""
+    return datetime.strptime(text, "%Y-%m").date()
+
+
+def run_goal(args) -> int:
+    """Run the goal command; return the exit code (1 if the target cannot be met)."""
+    try:
+        until = _month(args.until) if args.until else None
+        model = FinModel(store=open_store(Path(args.workbook)))
+        result = model.solve_goal(args.goal, until, args.runway, args.scenario,
+                                  tuple(args.group) if args.group else None)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"{args.workbook}: {type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
+
+    target = f"{args.runway:g} months of runway" if args.runway else "a non-negative balance"
+    through = result.months[-1].strftime("%b %Y")
+    if not result.feasible:
+        print(f"No {args.goal} level keeps {target} through {through}", file=sys.stderr)
+        return 1
+    if args.goal == "funding":
+        print(f"Funding of {result.value} keeps {target} through {through}")
+    else:
+        bound = "Minimum income" if args.goal == "income" else "Maximum expense"
+        print(f"{bound} factor {result.value:.4f} keeps {target} through {through}")
+    print(f"Closing balance {result.closing[-1]:.2f}, runway {result.runway[-1]:.2f} months in {through}")
+    return 0
+
+
+def run_simulate(args) -> int:
+    """Run the simulate command; return the exit code."""
+    try:
+        model = FinModel(store=open_store(Path(args.workbook)))
+        model.set_horizon(args.horizon)
+        result = model.simulate(args.scenario, args.paths, args.seed, args.workers)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"{args.workbook}: {type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
+
+    closing = result.closing_percentiles()
+    insolvent = result.insolvency()
+    print(f"{'month':<10}" + "".join(f"{f'P{q}':>14}" for q in closing) + f"{'insolvent':>11}")
+    for i, month in enumerate(result.months):
+        print(f"{month:%b %Y}  " + "".join(f"{values[i]:>14,.2f}" for values in closing.values())
+              + f"{insolvent[i]:>11.1%}")
+    runway = ", ".join(f"P{q} {value:.2f}" for q, value in result.runway_percentiles().items())
+    print(f"Runway months at the window end over {result.paths:,} paths: {runway}")
+    return 0
+
+
+def run_rule(args) -> int:
+    """Run the rule command; return the exit code."""
+    try:
+        model = FinModel(store=open_store(Path(args.workbook)))
+        if args.action == "add":
+            if not (args.category and args.amount and args.start):
+                raise ValueError("add needs --category, --amount and --start")
+            try:
+                amount, growth = Decimal(args.amount), Decimal(args.growth)
+            except ArithmeticError:
+                raise ValueError("--amount and --growth must be numbers") from None
+            direction = "expense" if args.category in DEFAULT_EXPENSE_CATEGORIES else "income"
+            model.add_rule(RecurringRule(
+                category=Category(args.category), direction=direction,
+                amount=amount, start=_month(args.start),
+                end=_month(args.end) if args.end else None,
+                every=args.every, growth=growth,
+            ))
+        elif args.action == "remove":
+            if args.index is None or not 0 <= args.index < len(model.rules):
+                raise ValueError(f"--index must be between 0 and {len(model.rules) - 1}")
+            model.remove_rule(args.index)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"{args.workbook}: {type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
+
+    for i, r in enumerate(model.rules):
+        until = f" until {r.end:%Y-%m}" if r.end else ""
+        every = f" every {r.every} months" if r.every > 1 else " monthly"
+        growth = f", {r.growth:+.2%} a year" if r.growth else ""
+        print(f"{i}: {r.direction} {r.category.value} {r.amount}{every} from {r.start:%Y-%m}{until}{growth}")
+    return 0
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Run a headless command.
+
+    :param argv: arguments without the program name (default: sys.argv[1:])
+    :return: process exit code (1 if any workbook failed)
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == "import":
+        return run_import(args)
+    if args.command == "export":
+        return run_export(args)
+    if args.command == "goal":
+        return run_goal(args)
+    if args.command == "simulate":
+        return run_simulate(args)
+    if args.command == "rule":
+        return run_rule(args)
+    if args.command == "convert":
+        try:
+            convert(args.src, args.dst)
+        except (OSError, ValueError, KeyError) as exc:
+            print(f"{args.src}: {type(exc).__name__}: {exc}", file=sys.stderr)
+            return 1
+        return 0
+
+    if not 1 <= args.horizon <= MAX_HORIZON:
+        print(f"--horizon must be between 1 and {MAX_HORIZON}", file=sys.stderr)
+        return 2
+
+    results = run_batch(args.paths, args.horizon, args.workers)
+    if not results:
+        print("No workbook files found", file=sys.stderr)
+        return 1
+
+    fmt = args.format or ("json" if args.output and args.output.endswith(".json") else "csv")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write_report(results, out, fmt)
+    else:
+        write_report(results, sys.stdout, fmt)
+
+    errors = [r for r in results if "error" in r]
+    for r in errors:
+        print(f"{r['file']}: {r['error']}", file=sys.stderr)
+    return 1 if errors else 0
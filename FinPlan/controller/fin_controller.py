@@ -10,14 +10,22 @@ from ..model.constants import (
     DEFAULT_EXPENSE_CATEGORIES,
     DEFAULT_INCOME_GUARANTEED_CATEGORIES,
     DEFAULT_INCOME_EXPECTED_CATEGORIES,
+    FORECAST_PAGE_SIZE,
+    SCENARIO_FACTORS,
 )
+from ..model.sweep import factor_range
 from .ui_controller import UIController
+from .worker import ModelWorker
 
 
 class FinController:
     """
     Main controller connecting UI events to data model logic:
     - Manages user interaction with period, entries, forecast and UI state
+
+    Forecast computation and writes run on a background worker (see
+    worker.py); the GUI thread touches the model only while holding
+    model.lock.
     """
 
     def __init__(self, view):
@@ -27,7 +35,15 @@ class FinController:
         self.view = view
         self.model = FinModel()
         self.ui_controller = UIController(view)
+        self.worker = ModelWorker(self.model.lock, view)
+        # Edits are written once typing pauses; failed writes are retried
+        autosave_failed = self._warn_on_error("Autosave Failed", "Changes could not be saved and will be retried")
+        self.model.enable_autosave(on_error=lambda e: self.worker.call_soon(lambda: autosave_failed(e)))
+        self.worker.busyChanged.connect(self.ui_controller.set_busy)
         self._pending_shift = False  # becomes True after prepare() is called
+        self._sweep_key = None       # (version, offset, horizon) of the shown heatmap
+        self._sweep = None           # SweepResult shown in the heatmap
+        self._sweep_marker = None    # scenario marker shown in the heatmap
 
         # Category lists used for input grid
         self.expense_categories = DEFAULT_EXPENSE_CATEGORIES
@@ -35,8 +51,10 @@ class FinController:
 
         self.current_exp_month = None  # selected month for expenses
         self.current_inc_month = None  # selected month for incomes
+        self.page = 0                  # output page within the horizon
 
         ip = view.input_panel
+        op = view.output_panel
 
         # Connect control buttons to logic handlers
         ip.confirmMonthBtn.clicked.connect(self.on_confirm_period)
@@ -49,9 +67,14 @@ class FinController:
 
         ip.scenario_label.setText("baseline")  # initial scenario
 
-        # Month selection buttons
-        for btn in ip.month_buttons:
-            btn.clicked.connect(lambda _, b=btn: self.on_select_month(b))
+        # Month selection buttons and horizon length
+        ip.month_group.buttonClicked.connect(self.on_select_month)
+        ip.horizonSpin.setValue(self.model.horizon)
+        ip.horizonSpin.valueChanged.connect(self.on_change_horizon)
+
+        # Paging through long horizons
+        op.prevPageBtn.clicked.connect(lambda: self.on_change_page(-1))
+        op.nextPageBtn.clicked.connect(lambda: self.on_change_page(1))
 
         # Submit actions
         ip.submitExpensesBtn.clicked.connect(self.on_submit_expenses)
@@ -77,13 +100,15 @@ class FinController:
     def on_confirm_period(self):
         """Triggered when user clicks Confirm; saves start date and initializes UI"""
         dt = self.view.input_panel.startDateEdit.date().toPyDate()
-        self.model.set_period_start(dt)
+        with self.model.lock:
+            self.model.set_period_start(dt)
         self._init_after_period()
         self.ui_controller.enable_main_buttons()
 
     def _init_after_period(self):
         """Setup UI elements and load values for the selected month"""
-        months = self.model.get_active_months()
+        with self.model.lock:
+            months = self.model.get_active_months()
         labels = [m.strftime("%B %Y") for m in months]
         self.ui_controller.init_after_period(labels, months[0])
 
@@ -95,19 +120,27 @@ class FinController:
     def _load_inputs_for(self, month: date):
         """Load input field values for a specific month from the model"""
         ip = self.view.input_panel
-        md = self.model.months.get(month)
+        with self.model.lock:
+            md = self.model.month_view(month)
 
-        if not md:
-            ip.clear_expense_inputs()
-            ip.clear_income_inputs()
-            return
+            if not md:
+                ip.clear_expense_inputs()
+                ip.clear_income_inputs()
+                return
 
-        exp_vals = {e.category.value: e.amount for e in md.entries if e.direction == "expense"}
-        inc_vals = {e.category.value: e.amount for e in md.entries if e.direction == "income"}
+            exp_vals = {name: self._entry_amount(md, name, "expense") for name in self.expense_categories}
+            inc_vals = {name: self._entry_amount(md, name, "income") for name in self.income_categories}
 
         ip.set_expense_values(exp_vals)
         ip.set_income_values(inc_vals)
 
+    @staticmethod
+    def _entry_amount(md, name: str, direction: str):
+        """Return the forecast (or else actual) amount of a category, or ''"""
+        category = Category(name)
+        entry = md.get(category, direction, "forecast") or md.get(category, direction, "actual")
+        return entry.amount if entry else ""
+
     def get_current_inputs(self):
         """Reads user input from input fields and returns dict with decimals"""
         ip = self.view.input_panel
@@ -132,39 +165,75 @@ class FinController:
         btn.setChecked(True)
 
         idx = ip.month_buttons.index(btn)
-        month = self.model.get_active_months()[idx]
+        with self.model.lock:
+            month = self.model.get_active_months()[idx]
 
         self.current_exp_month = month
         self.current_inc_month = month
 
         self._load_inputs_for(month)
 
-    def on_submit_expenses(self):
-        """Submit expenses for current month as forecast entries"""
-        inputs = self.get_current_inputs()["expenses"]
-        month = self.current_exp_month or self.model.get_active_months()[0]
+    def on_change_horizon(self, months: int):
+        """Triggered when the horizon spin box changes; rebuilds the window"""
+        with self.model.lock:
+            self.model.set_horizon(months)
+            active = self.model.get_active_months() if self.model.period_start else None
+        self.page = 0
+        if active is None:
+            return
 
-        for name, amount in inputs.items():
-            entry = Entry(date=month, category=Category(name), direction="expense", amount=amount, type="forecast")
-            self.model.upsert_entry(entry)
+        ip = self.view.input_panel
+        ip.set_month_buttons_labels([m.strftime("%B %Y") for m in active])
+        ip.clear_month_buttons_selection()
+        if self.current_exp_month not in active:
+            self.current_exp_month = self.current_inc_month = active[0]
+            self._load_inputs_for(active[0])
+        ip.month_buttons[active.index(self.current_exp_month)].setChecked(True)
+
+        if ip.refreshOutputBtn.isEnabled():
+            self.refresh()
+
+    def _page_count(self) -> int:
+        """Number of output pages needed for the current horizon"""
+        return max(1, -(-self.model.horizon // FORECAST_PAGE_SIZE))
+
+    def on_change_page(self, step: int):
+        """Show the previous/next page of the forecast outputs"""
+        self.page = min(max(self.page + step, 0), self._page_count() - 1)
+        self.refresh()
 
-        self._load_inputs_for(month)
+    def on_submit_expenses(self):
+        """Submit expenses for current month as forecast entries"""
+        self._submit_entries("expense", self.get_current_inputs()["expenses"], self.current_exp_month)
 
     def on_submit_incomes(self):
         """Submit incomes for current month as forecast entries"""
-        inputs = self.get_current_inputs()["incomes"]
-        month = self.current_inc_month or self.model.get_active_months()[0]
+        self._submit_entries("income", self.get_current_inputs()["incomes"], self.current_inc_month)
 
-        for name, amount in inputs.items():
-            entry = Entry(date=month, category=Category(name), direction="income", amount=amount, type="forecast")
-            self.model.upsert_entry(entry)
+    def _submit_entries(self, direction: str, inputs: dict, month: date):
+        """Write one month's forecast entries in the background, then reload the inputs"""
+        if month is None:
+            with self.model.lock:
+                month = self.model.get_active_months()[0]
 
-        self._load_inputs_for(month)
+        def write():
+            with self.model.batch():  # single write for all categories
+                for name, amount in inputs.items():
+                    entry = Entry(date=month, category=Category(name), direction=direction, amount=amount, type="forecast")
+                    self.model.upsert_entry(entry)
+
+        self.worker.submit(write, lambda _: self._load_inputs_for(month),
+                           self._warn_on_error("Save Failed", "Failed to save data"))
+
+    def _warn_on_error(self, title: str, message: str):
+        """Return a worker error callback showing a warning dialog"""
+        return lambda e: self.ui_controller.show_warning(title, f"{message}: {e}")
 
     def on_prepare_period_shift(self):
         """Initiate shift process: ensure actual data for first month is ready"""
         try:
-            self.model.shift.prepare()
+            with self.model.lock:
+                self.model.shift.prepare()
         except PeriodShiftError as e:
             self.ui_controller.show_warning("Cannot Prepare Shift", str(e))
             return
@@ -174,7 +243,8 @@ class FinController:
             "Please enter actual values for the first month of the current period,\n"
             "save them using the Submit buttons, then press Recalculate Period."
         )
-        month = self.model.get_active_months()[0]
+        with self.model.lock:
+            month = self.model.get_active_months()[0]
         self.ui_controller.enter_pre_shift_mode(month)
         self._pending_shift = True
 
@@ -187,16 +257,19 @@ class FinController:
             )
             return
 
-        try:
+        def shift():
             self.model.shift.apply_shift()
-        except PeriodShiftError as e:
-            self.ui_controller.show_warning("Shift Failed", str(e))
-            return
+            first_month = self.model.period_start + relativedelta(months=self.model.window_offset)
+            return self.model.get_active_months(), first_month
 
-        months = self.model.get_active_months()
+        self.worker.submit(shift, self._show_shifted_period,
+                           lambda e: self.ui_controller.show_warning("Shift Failed", str(e)))
+
+    def _show_shifted_period(self, result):
+        """Update the UI once a period shift has been applied"""
+        months, first_month = result
         labels = [m.strftime("%B %Y") for m in months]
-        first_month_label = (self.model.period_start + relativedelta(months=self.model.window_offset)).strftime("%B %Y")
-        self.ui_controller.refresh_ui_after_shift(labels, months, first_month_label)
+        self.ui_controller.refresh_ui_after_shift(labels, months, first_month.strftime("%B %Y"))
         self.current_exp_month = months[0]
         self.current_inc_month = months[0]
         self._load_inputs_for(months[0])
@@ -207,63 +280,89 @@ class FinController:
             return
 
         backup = self.ui_controller.confirm_dialog("Backup Data", "Save a backup before erasing?")
-        self.model.reset(backup)
+        self.worker.wait()  # let queued writes land before the file is replaced
+        with self.model.lock:
+            self.model.reset(backup)
         self.ui_controller.reset_ui_after_clear()
         self.current_exp_month = None
         self.current_inc_month = None
 
     def refresh(self):
-        """Refresh entries table, forecast table, and charts"""
-        self._refresh_entries_table()
-        self._refresh_forecast_table()
-        self._refresh_charts()
-
-    def _refresh_entries_table(self):
-        """Rebuild the forecast entries table"""
-        months = self.model.get_active_months()
-        headers = ["Category"] + [m.strftime("%b %Y") for m in months]
+        """
+        Refresh entries table, forecast table, charts and sensitivity heatmap.
 
-        all_cats_data = {}
+        The data is computed on the background worker; a newer refresh
+        supersedes one that has not delivered yet.
+        """
+        page = self.page
+        scenario_name = self.view.input_panel.scenario_label.text().lower()
+        self.view.output_panel.set_page_info(page, self._page_count())
+        heatmap_visible = self.view.output_panel.sensitivity_chart.isVisible()
+
+        def compute():
+            return (self._entries_table_data(page),
+                    self._forecast_table_data(scenario_name, page),
+                    self._chart_data(scenario_name, page),
+                    self._sweep_data() if heatmap_visible else None)
+
+        self.worker.submit(compute, self._show_refresh,
+                           self._warn_on_error("Refresh Failed", "Failed to compute the forecast"),
+                           key="refresh")
+
+    def _show_refresh(self, result):
+        """Show the tables and charts computed by refresh()"""
+        entries, forecast, charts, sweep = result
+        self.ui_controller.refresh_entries_table(*entries)
+        if forecast:
+            self.ui_controller.refresh_forecast_table(*forecast)
+        if charts:
+            self.ui_controller.refresh_charts(*charts)
+
+        factors = SCENARIO_FACTORS.get(self.view.input_panel.scenario_label.text().lower())
+        marker = (float(factors["expenses"]), float(factors["income"])) if factors else None
+        if sweep is not None:
+            self._sweep_key, self._sweep = sweep
+        elif marker == self._sweep_marker:
+            return  # heatmap hidden or already up to date
+        if self._sweep is not None and self._sweep.months:
+            self._sweep_marker = marker
+            self.ui_controller.refresh_sensitivity(self._sweep, marker)
+
+    def _entries_table_data(self, page: int):
+        """Return headers and rows of the forecast entries table"""
+        start = page * FORECAST_PAGE_SIZE
+        months = self.model.get_active_months()[start:start + FORECAST_PAGE_SIZE]
+        headers = ["Category"] + [m.strftime("%b %Y") for m in months]
 
-        for month in months:
-            md = self.model.months.get(month)
-            if not md:
-                continue
-            for e in md.entries:
-                if e.type != "forecast":
-                    continue
-                cat = e.category.value
-                all_cats_data.setdefault(cat, {}).setdefault(month, 0)
-                all_cats_data[cat][month] += e.amount
+        month_data = [self.model.month_view(month) for month in months]
 
         rows = []
         groups = [
-            ("Expenses", DEFAULT_EXPENSE_CATEGORIES),
-            ("Guaranteed Income", DEFAULT_INCOME_GUARANTEED_CATEGORIES),
-            ("Expected Income", DEFAULT_INCOME_EXPECTED_CATEGORIES),
+            ("Expenses", "expense", DEFAULT_EXPENSE_CATEGORIES),
+            ("Guaranteed Income", "income", DEFAULT_INCOME_GUARANTEED_CATEGORIES),
+            ("Expected Income", "income", DEFAULT_INCOME_EXPECTED_CATEGORIES),
         ]
 
-        for group_name, group_cats in groups:
+        for group_name, direction, group_cats in groups:
             rows.append((group_name, None))
             for cat in group_cats:
-                if cat in all_cats_data:
-                    row = [cat]
-                    for month in months:
-                        val = all_cats_data[cat].get(month, "")
-                        row.append(str(val))
-                    rows.append(row)
+                category = Category(cat)
+                entries = [md.get(category, direction, "forecast") if md else None for md in month_data]
+                if any(entries):
+                    rows.append([cat] + [str(e.amount) if e else "" for e in entries])
 
-        self.ui_controller.refresh_entries_table(headers, rows)
+        return headers, rows
 
-    def _refresh_forecast_table(self):
-        """Update forecast metrics table (cashflow, closing balance, runway)"""
-        scenario_name = self.view.input_panel.scenario_label.text().lower()
+    def _forecast_table_data(self, scenario_name: str, page: int):
+        """Return headers and rows of the forecast metrics table (cashflow, closing balance, runway), or None"""
         if scenario_name not in ("baseline", "optimistic", "pessimistic"):
-            return
+            return None
 
-        headers, net_row, close_row, runway_row = self.model.generate_forecast_metrics(scenario_name, months=3)
+        headers, net_row, close_row, runway_row = self.model.generate_forecast_metrics(
+            scenario_name, months=FORECAST_PAGE_SIZE, offset=page * FORECAST_PAGE_SIZE
+        )
         if not headers:
-            return
+            return None
 
         rows = [
             ["Net Cash Flow"] + net_row,
@@ -272,16 +371,28 @@ class FinController:
         ]
 
         headers = ["Metric"] + headers
-        self.ui_controller.refresh_forecast_table(headers, rows)
+        return headers, rows
 
-    def _refresh_charts(self):
-        """Refresh matplotlib charts for cashflow and runway"""
-        scenario_name = self.view.input_panel.scenario_label.text().lower()
-        net_flows, runways = self.model.get_chart_data(scenario_name)
+    def _chart_data(self, scenario_name: str, page: int):
+        """Return net cash flow and runway chart series, or None"""
+        net_flows, runways = self.model.get_chart_data(
+            scenario_name, months=FORECAST_PAGE_SIZE, offset=page * FORECAST_PAGE_SIZE
+        )
         if not net_flows:
-            return
+            return None
 
-        self.ui_controller.refresh_charts(net_flows, runways)
+        return net_flows, runways
+
+    def _sweep_data(self):
+        """
+        Return (key, SweepResult) over the default income x expense factor
+        grid, or None if the heatmap already shows this ledger version and
+        window
+        """
+        key = (self.model.version, self.model.window_offset, self.model.horizon)
+        if key == self._sweep_key:
+            return None
+        return key, self.model.sweep(factor_range(), factor_range())
 
     def on_change_scenario(self):
         """Cycle through forecast scenarios"""
@@ -293,10 +404,11 @@ class FinController:
         self.refresh()
 
     def on_save_and_exit(self):
-        """Save all data and close the app"""
-        try:
-            self.model.store.save(self.model.period_start, self.model.window_offset, self.model.months)
-        except Exception as e:
-            self.ui_controller.show_warning("Save Failed", f"Failed to save data: {e}")
-            return
-        self.view.close()
\ No newline at end of file
+        """Write pending changes and close the app"""
+        self.worker.submit(self.model.flush, lambda _: self.view.close(),
+                           self._warn_on_error("Save Failed", "Failed to save data"))
+
+    def shutdown(self):
+        """Finish queued background work and write pending changes before the app quits"""
+        self.worker.pool.waitForDone()
+        self.model.autosave.stop()
\ No newline at end of file
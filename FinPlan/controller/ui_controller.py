@@ -1,5 +1,5 @@
-from PyQt5.QtWidgets import QMessageBox, QTableWidgetItem
-from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtCore import Qt
 
 class UIController:
     """
@@ -45,6 +45,7 @@ class UIController:
         ip = self.input_panel
         ip.enable_date_selection(False)
         ip.enable_month_buttons(False)
+        ip.horizonSpin.setEnabled(False)
         ip.confirmMonthBtn.setEnabled(False)
         ip.nextPeriodBtn.setEnabled(False)
         ip.recalcPeriodBtn.setEnabled(True)
@@ -67,6 +68,7 @@ class UIController:
         ip.month_buttons[0].setChecked(True)
         ip.start_label.setText(first_month_label)
         ip.enable_month_buttons(True)
+        ip.horizonSpin.setEnabled(True)
         ip.nextPeriodBtn.setEnabled(True)
         ip.recalcPeriodBtn.setEnabled(False)
         ip.submitExpensesBtn.setEnabled(True)
@@ -98,6 +100,16 @@ class UIController:
         ip.saveExitBtn.setEnabled(False)
         ip.clearDataBtn.setEnabled(False)
 
+    def set_busy(self, busy: bool):
+        """
+        Show or hide the busy indicator (background work in progress).
+        """
+        self.output_panel.set_busy(busy)
+        if busy:
+            self.output_panel.setCursor(Qt.BusyCursor)
+        else:
+            self.output_panel.unsetCursor()
+
     def show_warning(self, title, message):
         """
         Display a warning dialog.
@@ -125,24 +137,7 @@ class UIController:
         """
         Populate the forecast entries table with grouped headers.
         """
-        table = self.output_panel.entries_table
-        table.clear()
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            if len(row) == 1:
-                item = QTableWidgetItem(row[0])
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-                item.setBackground(QBrush(QColor(220, 220, 220)))
-                table.setSpan(i, 0, 1, len(headers))
-                table.setItem(i, 0, item)
-            else:
-                for j, val in enumerate(row):
-                    table.setItem(i, j, QTableWidgetItem(val))
-        table.resizeColumnsToContents()
+        self.output_panel.set_entries_data(headers, rows)
 
     def refresh_forecast_table(self, headers, rows):
         """
@@ -152,40 +147,29 @@ class UIController:
 
     def refresh_charts(self, net_flows, runways):
         """
-        Redraw Net Cash Flow and Runway charts.
-        """
-        self.plot_chart(self.output_panel.figure1, self.output_panel.canvas1,
-                        "Net Cash Flow", net_flows)
-        self.plot_chart(self.output_panel.figure2, self.output_panel.canvas2,
-                        "Runway", runways)
-
-    def plot_chart(self, figure, canvas, title, data):
-        """
-        Render a line chart on provided figure and canvas.
-        """
-        figure.clear()
-        ax = figure.add_subplot(111)
-        self.plot_series(ax, title, data)
-        figure.tight_layout()
-        canvas.draw()
-
-    def plot_series(self, ax, title, data):
-        """
-        Plot actual vs forecast and connect with a dotted line.
-        """
-        x_all = list(range(len(data)))
-        actual = [(i, val) for i, (typ, _, val) in enumerate(data) if typ == "actual"]
-        forecast = [(i, val) for i, (typ, _, val) in enumerate(data) if typ == "forecast"]
-        ax.clear()
-        ax.set_title(title)
-        ax.grid(True)
-        ax.set_xticks(x_all)
-        ax.set_xlabel("Month")
-        if actual:
-            ax.plot(*zip(*actual), linestyle="-", marker="o")
-        if forecast:
-            ax.plot(*zip(*forecast), linestyle="--", marker="x")
-        if actual and forecast:
-            ax.plot([actual[-1][0], forecast[0][0]],
-                    [actual[-1][1], forecast[0][1]],
-                    linestyle=":", linewidth=2)
\ No newline at end of file
+        Update Net Cash Flow and Runway charts.
+        """
+        self.plot_chart(self.output_panel.chart1, "Net Cash Flow", net_flows)
+        self.plot_chart(self.output_panel.chart2, "Runway", runways)
+
+    def plot_chart(self, chart, title, data):
+        """
+        Show actual vs forecast data on a chart, connected with a dotted line.
+
+        The chart keeps its axes and lines; only their data is replaced, and
+        a full redraw happens only when the axis layout has to change.
+        """
+        chart.series.update(title, data)
+
+    def refresh_sensitivity(self, result, marker=None):
+        """
+        Show the runway at the end of the window for every factor pair
+        of a sensitivity sweep.
+
+        :param result: SweepResult of FinModel.sweep
+        :param marker: (expense factor, income factor) of the current scenario
+        """
+        self.output_panel.sensitivity_chart.heatmap.update(
+            "Runway (months)", result.income_factors[0], result.expense_factors[0],
+            result.final_runway(), marker
+        )
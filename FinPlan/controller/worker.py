@@ -0,0 +1,122 @@
+"""
+Background execution of model work (forecast computation, saving) off the
+GUI thread.
+
+ModelWorker runs tasks one at a time, in submission order, on a QThreadPool
+with a single thread, holding the model's lock while a task runs. Results
+come back to the GUI thread through a signal and are handed to the
+task's callback there.
+
+Tasks submitted with a key are coalesced: a newer task with the same key
+supersedes older ones. A superseded task is skipped if it has not started
+yet, and its result is dropped if it has.
+"""
+from itertools import count
+
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _Task(QRunnable):
+    def __init__(self, worker, task_id: int, key, generation: int, fn):
+        super().__init__()
+        self.worker = worker
+        self.task_id = task_id
+        self.key = key
+        self.generation = generation
+        self.fn = fn
+
+    def run(self):
+        worker = self.worker
+        if worker.is_stale(self.key, self.generation):
+            worker._done.emit(self.task_id, None, None, True)
+            return
+        try:
+            with worker.lock:
+                result = self.fn()
+        except Exception as e:
+            worker._done.emit(self.task_id, None, e, False)
+        else:
+            worker._done.emit(self.task_id, result, None, False)
+
+
+class ModelWorker(QObject):
+    """
+    Serial background executor for one FinModel.
+
+    Signals:
+      busyChanged(bool): True when the first task is queued, False when the
+        last one has been delivered
+    """
+    busyChanged = pyqtSignal(bool)
+    _done = pyqtSignal(int, object, object, bool)  # task id, result, error, skipped
+    _call = pyqtSignal(object)                     # callable to run on the GUI thread
+
+    def __init__(self, lock, parent=None):
+        """
+        :param lock: lock held while a task runs (the model's lock)
+        """
+        super().__init__(parent)
+        self.lock = lock
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)  # one task at a time, in order
+        self._generations = {}          # key -> generation of the newest task
+        self._callbacks = {}            # task id -> (key, generation, on_done, on_error)
+        self._ids = count()
+        self._done.connect(self._deliver)
+        self._call.connect(self._run_call)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._callbacks)
+
+    def is_stale(self, key, generation: int) -> bool:
+        """Return True if a newer task with the same key was submitted."""
+        return key is not None and self._generations.get(key) != generation
+
+    def submit(self, fn, on_done=None, on_error=None, key=None):
+        """
+        Queue fn() to run in the background.
+
+        :param fn: callable without arguments; runs with the lock held
+        :param on_done: called on the GUI thread with fn's result
+        :param on_error: called on the GUI thread with the exception
+            (default: re-raised there)
+        :param key: coalescing key; only the newest task per key delivers
+        """
+        generation = self._generations.get(key, 0) + 1
+        if key is not None:
+            self._generations[key] = generation
+        task_id = next(self._ids)
+        was_busy = self.busy
+        self._callbacks[task_id] = (key, generation, on_done, on_error)
+        if not was_busy:
+            self.busyChanged.emit(True)
+        self.pool.start(_Task(self, task_id, key, generation, fn))
+
+    def call_soon(self, fn):
+        """Run fn() on the GUI thread; safe to call from any thread."""
+        self._call.emit(fn)
+
+    def _run_call(self, fn):
+        fn()
+
+    def wait(self):
+        """Block until every queued task has run and delivered its result."""
+        while self._callbacks:
+            self.pool.waitForDone()
+            QCoreApplication.processEvents()  # deliver results (callbacks may queue more)
+
+    def _deliver(self, task_id: int, result, error, skipped: bool):
+        key, generation, on_done, on_error = self._callbacks.pop(task_id)
+        try:
+            if skipped or self.is_stale(key, generation):
+                return
+            if error is not None:
+                if on_error is None:
+                    raise error
+                on_error(error)
+            elif on_done is not None:
+                on_done(result)
+        finally:
+            if not self._callbacks:
+                self.busyChanged.emit(False)
@@ -0,0 +1,160 @@
+"""
+Debounced autosave for FinModel.
+
+With autosave enabled (FinModel.enable_autosave) mutations only mark the
+model dirty; an AutosaveScheduler then writes once the edits pause for
+`delay` seconds, or at the latest `max_delay` seconds after the first
+unsaved change. A burst of edits therefore costs one write.
+
+Every scheduler flushes at interpreter exit. A failed write keeps the
+changes pending and is retried after another `delay` seconds; the error is
+passed to the scheduler's on_error callback once per run of failures.
+
+install_exit_handlers() additionally flushes on SIGTERM/SIGHUP. It
+replaces process-wide signal handlers, so only the application entry point
+calls it (see __main__.py). sys.excepthook is left alone: PyQt5 aborts on
+an exception escaping a slot only while the default hook is installed.
+"""
+import atexit
+import os
+import signal
+import sys
+import threading
+import time
+import weakref
+from functools import partial
+from typing import Callable, Optional
+
+
+def report_error(error: Exception):
+    """Default on_error callback: print the failure to stderr."""
+    print(f"FinPlan autosave failed: {error}", file=sys.stderr)
+
+
+def _stop_at_exit(ref):
+    """atexit hook of a scheduler; holds it only weakly."""
+    scheduler = ref()
+    if scheduler is not None:
+        scheduler.stop()
+
+
+class AutosaveScheduler:
+    """
+    Background thread calling flush() after an idle interval.
+
+    Attributes:
+      delay: idle seconds after the last change before writing
+      max_delay: upper bound on how long a change stays unsaved
+      last_error: exception of the last failed flush (None after a success)
+    """
+
+    def __init__(self, flush: Callable[[], bool], delay: float, max_delay: Optional[float] = None,
+                 on_error: Callable[[Exception], None] = report_error):
+        """
+        :param flush: writes pending changes; returns True if it wrote
+        :param delay: idle interval in seconds
+        :param max_delay: longest deferral in seconds (default: no limit)
+        :param on_error: called with the exception when a flush starts
+            failing; runs on the scheduler thread
+        """
+        self.flush = flush
+        self.delay = delay
+        self.max_delay = max_delay
+        self.on_error = on_error
+        self.last_error = None
+        self._cond = threading.Condition()
+        self._due = None        # monotonic time of the next write
+        self._deadline = None   # latest allowed time (first change + max_delay)
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="FinPlan autosave", daemon=True)
+        self._thread.start()
+        self._exit_hook = partial(_stop_at_exit, weakref.ref(self))
+        atexit.register(self._exit_hook)
+
+    @property
+    def pending(self) -> bool:
+        """True while a write is scheduled."""
+        return self._due is not None
+
+    def schedule(self):
+        """Note a change: (re)start the idle countdown."""
+        with self._cond:
+            now = time.monotonic()
+            if self._deadline is None and self.max_delay is not None:
+                self._deadline = now + self.max_delay
+            due = now + self.delay
+            self._due = min(due, self._deadline) if self._deadline is not None else due
+            self._cond.notify()
+
+    def flush_now(self):
+        """Write pending changes immediately (exit paths, explicit saves)."""
+        with self._cond:
+            self._due = self._deadline = None
+        self._flush()
+
+    def stop(self, flush: bool = True):
+        """
+        Stop the scheduler thread.
+
+        :param flush: write pending changes first
+        """
+        atexit.unregister(self._exit_hook)
+        if flush:
+            self.flush_now()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped and (self._due is None or time.monotonic() < self._due):
+                    self._cond.wait(None if self._due is None else self._due - time.monotonic())
+                if self._stopped:
+                    return
+                self._due = self._deadline = None
+            self._flush()
+
+    def _flush(self):
+        try:
+            self.flush()
+        except Exception as e:
+            # Keep the changes pending and try again after another delay
+            with self._cond:
+                if self._due is None:
+                    self._due = time.monotonic() + self.delay
+                self._cond.notify()
+            if self.last_error is None:
+                self.on_error(e)
+            self.last_error = e
+        else:
+            self.last_error = None
+
+
+def install_exit_handlers(flush: Callable[[], object]):
+    """
+    Call flush() on SIGTERM/SIGHUP.
+
+    Call it once, from the main thread of the application entry point:
+    signal handlers can only be installed there, and a GUI event loop must
+    give Python a chance to run them (e.g. a periodic QTimer), see
+    __main__.py. Interpreter exit, including one caused by an unhandled
+    exception, is already covered by every AutosaveScheduler.
+
+    :param flush: writes pending changes, e.g. FinModel.flush
+    """
+    for name in ("SIGTERM", "SIGHUP"):
+        signum = getattr(signal, name, None)
+        if signum is None:
+            continue
+        previous = signal.getsignal(signum)
+
+        def handler(signum, frame, previous=previous):
+            flush()
+            if callable(previous):
+                previous(signum, frame)
+            elif previous == signal.SIG_DFL:
+                # Terminate as the signal would have without the handler
+                signal.signal(signum, previous)
+                os.kill(os.getpid(), signum)
+        signal.signal(signum, handler)
@@ -0,0 +1,57 @@
+from bisect import bisect_left
+from datetime import date
+from decimal import Decimal
+
+
+class BalanceIndex:
+    """
+    Sorted index of months holding actual entries, with prefix sums.
+
+    Built once per ledger version, it answers "balance and burn before
+    month X" with a binary search instead of a scan over the whole history.
+
+    Attributes:
+      months: sorted start dates of months that hold at least one actual
+      nets: net cash flow of each of those months
+      expenses: total expenses of each of those months
+      cum_net: cum_net[i] is the summed net flow of months[:i]
+      cum_expenses: cum_expenses[i] is the summed expenses of months[:i]
+      last_month: latest stored month (with or without actuals), or None
+    """
+
+    def __init__(self, months):
+        """
+        :param months: mapping of month start date to aggregates
+            (MonthlyData or MonthSummary)
+        """
+        self.months = []
+        self.nets = []
+        self.expenses = []
+        self.cum_net = [0]          # same start value as sum() over months
+        self.cum_expenses = [0]
+        self.last_month = None
+        for m in sorted(months):
+            self.last_month = m
+            md = months[m]
+            if not md.has_actuals:
+                continue
+            net, exp = md.net_cash_flow, md.total_expenses
+            self.months.append(m)
+            self.nets.append(net)
+            self.expenses.append(exp)
+            self.cum_net.append(self.cum_net[-1] + net)
+            self.cum_expenses.append(self.cum_expenses[-1] + exp)
+
+    def position(self, before: date) -> int:
+        """Return the number of actual months strictly before a date."""
+        return bisect_left(self.months, before)
+
+    def opening(self, before: date) -> tuple[Decimal, Decimal, int]:
+        """
+        Summarize actual months strictly before a date.
+
+        :param before: first month of the window
+        :return: (summed net flow, summed expenses, number of months)
+        """
+        i = self.position(before)
+        return self.cum_net[i], self.cum_expenses[i], i
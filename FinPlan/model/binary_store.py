@@ -0,0 +1,516 @@
+"""
+Binary columnar snapshot format (.fpb) for fast workbook load and save.
+
+Layout (little endian, every section starts on an 8-byte boundary):
+
+  header   struct HEADER: magic b"FPLB", version, reserved, number of
+           months, number of entries, meta length, text length
+  meta     UTF-8 JSON object (period_start, window_offset, extra keys)
+  months   int32[n_months]      month ordinals, in stored order
+  offsets  int64[n_months + 1]  first entry row of each month (month index)
+  month    int32[n_entries]     month ordinal of each entry
+  mantissa int64[n_entries]     amount = mantissa * 10 ** exponent
+  category int16[n_entries]     index into ledger.CATEGORIES
+  flags    uint8[n_entries]     ledger.INCOME | ledger.ACTUAL bits
+  exponent int8[n_entries]      decimal exponent, or TEXT_AMOUNT
+  text     UTF-8 JSON list of amount strings that do not fit the columns
+
+Amounts are stored as their exact decimal mantissa and exponent, so
+converting JSON -> binary -> JSON reproduces every amount string. The
+rare amounts that do not fit (more than 18 digits, exponent outside int8,
+negative zero) are kept verbatim in the text section and referenced by
+index through the mantissa column.
+
+Files are read through mmap and decoded column-wise with NumPy; each
+distinct amount and month becomes one shared Decimal/date object. The map
+is closed as soon as the snapshot has been decoded (Snapshot.close).
+"""
+import json
+import mmap
+import struct
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+from .data_store import DataStore
+from .journal_store import JournalDataStore
+from .entry import Entry, Direction, EntryType
+from .ledger import (
+    CATEGORIES, CATEGORY_CODES, INCOME, ACTUAL, Ledger, MonthSummary,
+    entry_flags, month_ordinal, ordinal_month, to_cents,
+)
+from .lazy_months import LazyMonths, MonthSource
+from .monthly_data import MonthlyData
+
+MAGIC = b"FPLB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQII")  # magic, version, reserved, months, entries, meta, text
+TEXT_AMOUNT = -128                    # exponent marker: amount lives in the text section
+INT64_DIGITS = 18                     # mantissas up to 18 digits always fit int64
+
+DIRECTIONS = {0: Direction.Expense, INCOME: Direction.Income}
+TYPES = {0: EntryType.Forecast, ACTUAL: EntryType.Actual}
+
+
+class BinaryFormatError(ValueError):
+    """Raised when a file is not a readable binary snapshot."""
+
+
+def _pad(n: int) -> int:
+    """Return n rounded up to the next multiple of 8."""
+    return (n + 7) & ~7
+
+
+def encode_amount(amount: Decimal, text: list) -> tuple[int, int]:
+    """
+    Split a Decimal into (mantissa, exponent) columns.
+
+    :param amount: value to encode
+    :param text: text section; receives the amount if it does not fit
+    :return: (mantissa, exponent) pair for the columns
+    """
+    sign, digits, exponent = amount.as_tuple()
+    if (isinstance(exponent, int) and -127 <= exponent <= 127
+            and len(digits) <= INT64_DIGITS and not (sign and not any(digits))):
+        mantissa = int("".join(map(str, digits)))
+        return (-mantissa if sign else mantissa), exponent
+    text.append(str(amount))
+    return len(text) - 1, TEXT_AMOUNT
+
+
+def decode_amount(mantissa: int, exponent: int, text: list) -> Decimal:
+    """Rebuild the Decimal stored by encode_amount()."""
+    if exponent == TEXT_AMOUNT:
+        return Decimal(text[mantissa])
+    return Decimal(mantissa).scaleb(exponent)  # exact: mantissa has <= 18 digits
+
+
+COLUMN_TYPES = (np.int32, np.int64, np.int16, np.uint8, np.int8)  # month .. exponent
+
+
+def _encode_entries(entries: list[Entry], text: list, amounts: dict) -> list:
+    """
+    Encode entries into the five entry columns.
+
+    :param text: text section (extended for amounts that do not fit)
+    :param amounts: cache amount string -> (mantissa, exponent)
+    :return: [month, mantissa, category, flags, exponent] arrays
+    """
+    rows = []
+    for e in entries:
+        key = str(e.amount)
+        if key not in amounts:
+            amounts[key] = encode_amount(e.amount, text)
+        mantissa, exponent = amounts[key]
+        rows.append((month_ordinal(e.date), mantissa, CATEGORY_CODES[e.category],
+                     entry_flags(e.direction, e.type), exponent))
+    columns = list(zip(*rows)) if rows else [()] * len(COLUMN_TYPES)
+    return [np.array(col, dtype=t) for col, t in zip(columns, COLUMN_TYPES)]
+
+
+def pack_snapshot(meta: dict, months: dict[date, MonthlyData]) -> bytes:
+    """
+    Serialize a workbook into the binary layout.
+
+    Months of a LazyMonths that were never loaded from a snapshot are
+    copied column-wise without decoding their entries.
+
+    :param meta: JSON-serializable meta section
+    :param months: mapping of month start date to MonthlyData
+    :return: file contents
+    """
+    source = months.source if isinstance(months, LazyMonths) else None
+    ordinals = np.empty(len(months), dtype=np.int32)
+    offsets = np.zeros(len(months) + 1, dtype=np.int64)
+    text = []
+    amounts = {}  # amount string -> (mantissa, exponent), each encoded once
+    chunks = []
+
+    for i, m in enumerate(months):
+        ordinals[i] = month_ordinal(m)
+        if isinstance(source, SnapshotMonthSource) and not months.is_loaded(m):
+            chunk = source.columns(m, text)
+        else:
+            chunk = _encode_entries(months[m].entries, text, amounts)
+        chunks.append(chunk)
+        offsets[i + 1] = offsets[i] + len(chunk[0])
+
+    n = int(offsets[-1])
+    month_col, mantissa, category, flags, exponent = (
+        np.concatenate([c[k] for c in chunks]) if chunks else np.empty(0, dtype=t)
+        for k, t in enumerate(COLUMN_TYPES)
+    )
+
+    meta_bytes = json.dumps(meta).encode("utf-8")
+    text_bytes = json.dumps(text).encode("utf-8")
+    sections = [meta_bytes, ordinals.tobytes(), offsets.tobytes(), month_col.tobytes(),
+                mantissa.tobytes(), category.tobytes(), flags.tobytes(), exponent.tobytes(),
+                text_bytes]
+
+    out = bytearray(HEADER.pack(MAGIC, VERSION, 0, len(months), n, len(meta_bytes), len(text_bytes)))
+    for section in sections:
+        out += b"\0" * (_pad(len(out)) - len(out))
+        out += section
+    return bytes(out)
+
+
+def _read_header(buffer) -> tuple:
+    """
+    Unpack and check the header at the start of buffer.
+
+    :return: (number of months, number of entries, meta length, text length)
+    :raises BinaryFormatError: on a short buffer, bad magic number or version
+    """
+    if len(buffer) < HEADER.size:
+        raise BinaryFormatError("File too short for a binary snapshot")
+    magic, version, _, n_months, n, meta_len, text_len = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise BinaryFormatError("Not a FinPlan binary snapshot")
+    if version != VERSION:
+        raise BinaryFormatError(f"Unsupported snapshot version {version}")
+    return n_months, n, meta_len, text_len
+
+
+class Snapshot:
+    """
+    Zero-copy view of a binary snapshot.
+
+    The column attributes are NumPy arrays backed directly by the buffer
+    (usually an mmap), so opening a snapshot costs O(header) until columns
+    are actually read. Use it as a context manager (or call close()) to
+    release an mmap once the data has been decoded.
+
+    Attributes:
+      meta: decoded meta section
+      months, offsets: month ordinals and their entry row ranges
+      month, mantissa, category, flags, exponent: entry columns
+      text: amounts stored verbatim
+    """
+
+    def __init__(self, buffer):
+        """
+        :param buffer: bytes-like object holding the whole file
+        :raises BinaryFormatError: on a bad magic number or version
+        """
+        n_months, n, meta_len, text_len = _read_header(buffer)
+        self._buffer = buffer
+        pos = HEADER.size
+
+        def take(length: int) -> int:
+            nonlocal pos
+            start = _pad(pos)
+            pos = start + length
+            if pos > len(buffer):
+                raise BinaryFormatError("Truncated binary snapshot")
+            return start
+
+        start = take(meta_len)
+        self.meta = json.loads(bytes(buffer[start:start + meta_len]).decode("utf-8"))
+        self.months = np.frombuffer(buffer, np.int32, n_months, take(4 * n_months))
+        self.offsets = np.frombuffer(buffer, np.int64, n_months + 1, take(8 * (n_months + 1)))
+        self.month = np.frombuffer(buffer, np.int32, n, take(4 * n))
+        self.mantissa = np.frombuffer(buffer, np.int64, n, take(8 * n))
+        self.category = np.frombuffer(buffer, np.int16, n, take(2 * n))
+        self.flags = np.frombuffer(buffer, np.uint8, n, take(n))
+        self.exponent = np.frombuffer(buffer, np.int8, n, take(n))
+        start = take(text_len)
+        self.text = json.loads(bytes(buffer[start:start + text_len]).decode("utf-8"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Drop the column arrays and close the buffer if it is an mmap.
+
+        Decoded results (to_months, to_ledger, ...) stay valid; the snapshot
+        itself cannot be read afterwards.
+        """
+        self.months = self.offsets = self.month = self.mantissa = None
+        self.category = self.flags = self.exponent = None
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+
+    def month_range(self, i: int) -> slice:
+        """Return the entry rows of the i-th stored month."""
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def amounts(self, rows: slice = slice(None)) -> list[Decimal]:
+        """
+        Decode amounts of a row range; equal amounts share one Decimal.
+
+        :param rows: slice of entry rows (default: all)
+        """
+        mantissa = self.mantissa[rows]
+        exponent = self.exponent[rows]
+        keys, inverse = np.unique(
+            np.stack([mantissa, exponent.astype(np.int64)]), axis=1, return_inverse=True
+        )
+        distinct = [decode_amount(m, e, self.text) for m, e in zip(keys[0].tolist(), keys[1].tolist())]
+        return [distinct[i] for i in inverse.ravel().tolist()]
+
+    def entries(self, rows: slice = slice(None)) -> list[Entry]:
+        """Materialize a row range as Entry objects."""
+        amounts = self.amounts(rows)
+        dates = {}
+        result = []
+        for ordinal, code, flag, amount in zip(
+            self.month[rows].tolist(), self.category[rows].tolist(),
+            self.flags[rows].tolist(), amounts,
+        ):
+            d = dates.get(ordinal)
+            if d is None:
+                d = dates[ordinal] = ordinal_month(ordinal)
+            result.append(Entry(d, CATEGORIES[code], DIRECTIONS[flag & INCOME],
+                                amount, TYPES[flag & ACTUAL]))
+        return result
+
+    def to_months(self) -> dict[date, MonthlyData]:
+        """Materialize all months in stored order."""
+        entries = self.entries()
+        months = {}
+        for i, ordinal in enumerate(self.months.tolist()):
+            m = ordinal_month(ordinal)
+            rows = self.month_range(i)
+            months[m] = MonthlyData(m, entries[rows])
+        return months
+
+    def month_summaries(self) -> dict[date, MonthSummary]:
+        """
+        Return exact per-month aggregates without creating Entry objects.
+
+        Totals equal the Decimal sums MonthlyData keeps: amounts of a
+        (month, direction, type) group are aligned to the group's smallest
+        exponent and summed as int64. Groups holding text amounts or
+        values too large for int64 are summed with Decimal instead.
+        """
+        n_months = len(self.months)
+        size = n_months * 4
+        group = np.repeat(np.arange(n_months, dtype=np.int64), np.diff(self.offsets)) * 4 + self.flags
+        counts = np.bincount(group, minlength=size)
+        exponent = self.exponent.astype(np.int64)
+        text_rows = exponent == TEXT_AMOUNT
+
+        emin = np.full(size, 127, dtype=np.int64)
+        np.minimum.at(emin, group[~text_rows], exponent[~text_rows])
+        shift = exponent - emin[group]
+
+        # Groups that cannot be summed exactly in int64
+        fallback = np.zeros(size, dtype=bool)
+        fallback[group[text_rows | (shift > INT64_DIGITS)]] = True
+        bound = np.zeros(size)
+        np.add.at(bound, group, np.abs(self.mantissa.astype(np.float64))
+                  * 10.0 ** np.clip(shift, 0, 300))
+        fallback |= bound >= 2 ** 62
+
+        fast = ~fallback[group]
+        sums = np.zeros(size, dtype=np.int64)
+        np.add.at(sums, group[fast], self.mantissa[fast] * 10 ** shift[fast])
+
+        summaries = {}
+        for i, ordinal in enumerate(self.months.tolist()):
+            totals, month_counts = {}, {}
+            for flag in range(4):
+                g = i * 4 + flag
+                if not counts[g]:
+                    continue
+                bucket = ("income" if flag & INCOME else "expense",
+                          "actual" if flag & ACTUAL else "forecast")
+                if fallback[g]:
+                    total = 0
+                    for row in np.flatnonzero(group == g).tolist():
+                        total = total + decode_amount(int(self.mantissa[row]), int(exponent[row]), self.text)
+                else:
+                    total = Decimal(int(sums[g])).scaleb(int(emin[g]))
+                totals[bucket] = total
+                month_counts[bucket] = int(counts[g])
+            m = ordinal_month(ordinal)
+            summaries[m] = MonthSummary(m, totals, month_counts)
+        return summaries
+
+    def to_ledger(self) -> Ledger:
+        """
+        Return the entries as a columnar Ledger without creating Entry objects.
+
+        Amounts are converted to whole cents (ROUND_HALF_EVEN), like
+        Ledger.from_entries.
+        """
+        cents = np.empty(len(self.mantissa), dtype=np.int64)
+        for exp in np.unique(self.exponent).tolist():
+            rows = self.exponent == exp
+            if -2 <= exp <= 8:
+                cents[rows] = self.mantissa[rows] * 10 ** (exp + 2)  # exact in int64
+            else:
+                cents[rows] = [
+                    to_cents(decode_amount(m, exp, self.text))
+                    for m in self.mantissa[rows].tolist()
+                ]
+        return Ledger(self.month.copy(), self.category.copy(), self.flags.copy(), cents)
+
+
+class BinaryDataStore(DataStore):
+    """
+    DataStore backend that keeps the workbook in the binary snapshot format.
+
+    load() memory-maps the file and decodes it column-wise; saves replace
+    the file atomically like the JSON backend. Use convert() for lossless
+    conversion between the JSON and binary formats.
+    """
+    FILE = Path("data/data.fpb")
+
+    def open_snapshot(self) -> Snapshot:
+        """
+        Memory-map the file and return a Snapshot view of it.
+
+        Use the result as a context manager so the map is closed:
+        `with store.open_snapshot() as snapshot: ...`
+
+        :raises BinaryFormatError: if the file is not a valid snapshot
+        """
+        with open(self.FILE, "rb") as f:
+            if not f.seek(0, 2):
+                raise BinaryFormatError("Empty binary snapshot")
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return Snapshot(buffer)
+
+    def read_meta(self) -> dict:
+        """
+        Return the raw meta section of the stored snapshot (empty if missing).
+
+        Only the header and the meta section are read.
+
+        :raises BinaryFormatError: if the file is not a valid snapshot
+        """
+        if not self.FILE.exists():
+            return {}
+        with open(self.FILE, "rb") as f:
+            _, _, meta_len, _ = _read_header(f.read(HEADER.size))
+            f.seek(_pad(HEADER.size))
+            data = f.read(meta_len)
+        if len(data) < meta_len:
+            raise BinaryFormatError("Truncated binary snapshot")
+        return json.loads(data.decode("utf-8"))
+
+    def load(self):
+        """
+        Load stored data from the binary snapshot.
+
+        :returns: tuple(period_start, window_offset, months)
+        """
+        if not self.FILE.exists():
+            return None, 0, {}
+        with self.open_snapshot() as snapshot:
+            meta = self.meta = snapshot.meta
+            months = snapshot.to_months()
+        period_start = date.fromisoformat(meta["period_start"]) if meta.get("period_start") else None
+        return period_start, int(meta.get("window_offset", 0)), months
+
+    def load_months(self):
+        """
+        Load metadata and the month index; entries are decoded per month on access.
+
+        The file is read into memory rather than mapped, so the snapshot
+        can be replaced by later saves while months are still pending.
+
+        :returns: tuple(period_start, window_offset, months: LazyMonths)
+        """
+        if not self.FILE.exists():
+            return None, 0, LazyMonths()
+        snapshot = Snapshot(self.FILE.read_bytes())
+        meta = self.meta = snapshot.meta
+        period_start = date.fromisoformat(meta["period_start"]) if meta.get("period_start") else None
+        months = LazyMonths(source=SnapshotMonthSource(snapshot))
+        return period_start, int(meta.get("window_offset", 0)), months
+
+    def load_ledger(self) -> Ledger:
+        """Return the stored entries as a Ledger without building Entry objects."""
+        if not self.FILE.exists():
+            return Ledger()
+        with self.open_snapshot() as snapshot:
+            return snapshot.to_ledger()
+
+    def _write_snapshot(self, period_start, window_offset, months, extra_meta: dict):
+        """Serialize the full workbook and atomically replace the binary file."""
+        meta = {
+            "period_start": period_start.isoformat() if period_start else None,
+            "window_offset": window_offset,
+            **extra_meta
+        }
+        self._write_atomic(self.FILE, pack_snapshot(meta, months))
+
+
+class SnapshotMonthSource(MonthSource):
+    """Month source that decodes single months from a Snapshot."""
+
+    def __init__(self, snapshot: Snapshot):
+        self.snapshot = snapshot
+        self._index = {ordinal_month(o): i for i, o in enumerate(snapshot.months.tolist())}
+
+    def summaries(self) -> dict:
+        return self.snapshot.month_summaries()
+
+    def load(self, month: date) -> MonthlyData:
+        rows = self.snapshot.month_range(self._index[month])
+        return MonthlyData(month, self.snapshot.entries(rows))
+
+    def records(self, month: date) -> list[dict]:
+        rows = self.snapshot.month_range(self._index[month])
+        return [e.to_dict() for e in self.snapshot.entries(rows)]
+
+    def columns(self, month: date, text: list) -> list:
+        """
+        Copy one month's entry columns for pack_snapshot.
+
+        :param text: text section of the file being written; text amounts
+            are appended to it and re-pointed
+        :return: [month, mantissa, category, flags, exponent] arrays
+        """
+        snap = self.snapshot
+        rows = snap.month_range(self._index[month])
+        mantissa = snap.mantissa[rows].copy()
+        exponent = snap.exponent[rows]
+        for row in np.flatnonzero(exponent == TEXT_AMOUNT).tolist():
+            text.append(snap.text[mantissa[row]])
+            mantissa[row] = len(text) - 1
+        return [snap.month[rows], mantissa, snap.category[rows], snap.flags[rows], exponent]
+
+
+def convert(src, dst):
+    """
+    Convert a workbook between the JSON and binary formats.
+
+    The format of each side is chosen by its suffix (".fpb" is binary,
+    anything else JSON). Entries, amounts, month order and extra meta keys
+    are preserved exactly. A JSON destination is written as a plain
+    snapshot, without journal metadata; a journal left next to it by an
+    earlier workbook at that path is removed, since it no longer applies.
+
+    :param src: existing workbook file
+    :param dst: file to write
+    """
+    source = open_store(src)
+    period_start, window_offset, months = source.load()
+    extra = {k: v for k, v in source.meta.items()
+             if k not in ("period_start", "window_offset", "journal_seq")}
+    if Path(dst).suffix == ".fpb":
+        BinaryDataStore(dst).write_snapshot(period_start, window_offset, months, extra)
+        return
+    DataStore(dst).write_snapshot(period_start, window_offset, months, extra)
+    JournalDataStore(dst).journal_file.unlink(missing_ok=True)
+
+
+def open_store(path) -> DataStore:
+    """
+    Return the store for a workbook path, by suffix: BinaryDataStore for
+    .fpb files, otherwise the journaled JSON store.
+    """
+    path = Path(path)
+    if path.suffix == ".fpb":
+        return BinaryDataStore(path)
+    return JournalDataStore(path)
@@ -11,6 +11,36 @@ SCENARIO_FACTORS = {
     "pessimistic":  {"income": Decimal("0.7"), "expenses": Decimal("1.2")},  # conservative case
 }
 
+# Stochastic scenario: monthly variation per category group
+#   probability: chance that a month's amount materializes at all
+#   spread: standard deviation of the lognormal noise around the amount
+STOCHASTIC_GROUPS = {
+    "guaranteed": {"probability": 1.0, "spread": 0.05},  # contracted income
+    "expected":   {"probability": 0.6, "spread": 0.35},  # uncertain income
+    "expense":    {"probability": 1.0, "spread": 0.10},  # running costs
+}
+
+# Per-category overrides of the group defaults above
+STOCHASTIC_CATEGORIES = {
+    "Planned but Unconfirmed Investments": {"probability": 0.3, "spread": 0.0},
+    "Loan Interests": {"probability": 1.0, "spread": 0.02},
+    "Loan Principal": {"probability": 1.0, "spread": 0.0},
+}
+
+# Forecast horizon limits (months in the rolling window)
+DEFAULT_HORIZON = 3     # months shown after confirming a period
+MAX_HORIZON = 120       # upper bound accepted by FinModel.set_horizon
+FORECAST_PAGE_SIZE = 6  # months per page in the output tables and charts
+
+# Autosave (GUI): seconds of editing inactivity before pending changes are
+# written, and the longest a change may stay unsaved during continuous edits
+AUTOSAVE_DELAY = 2.0
+AUTOSAVE_MAX_DELAY = 30.0
+
+# Sensitivity sweep (GUI heatmap): factor range and steps per axis
+SWEEP_RANGE = (0.5, 1.5)  # lowest and highest income/expense multiplier
+SWEEP_STEPS = 50          # grid points per axis
+
 # Default expense categories shown in the UI
 DEFAULT_EXPENSE_CATEGORIES = [
     "Employee Salaries",        # staff costs
@@ -36,4 +66,14 @@ DEFAULT_INCOME_EXPECTED_CATEGORIES = [
     "Potential Sales",              # projected sales
     "Planned but Unconfirmed Investments",  # pending funding
     "Crowdfunding (expected)",      # outreach campaigns
-]
\ No newline at end of file
+]
+
+# Expense categories that do not scale with activity; the rest are
+# variable ("fixed" and "variable" groups of a sensitivity sweep)
+FIXED_EXPENSE_CATEGORIES = [
+    "Employee Salaries",
+    "Rent and Utilities",
+    "Subscriptions and IT Services",
+    "Loan Interests",
+    "Loan Principal",
+]
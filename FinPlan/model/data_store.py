@@ -1,10 +1,67 @@
 import json
+import os
+from typing import Optional
 from pathlib import Path
 from datetime import date
 from decimal import Decimal
 from .monthly_data import MonthlyData
 from .entry import Entry
-from .category import Category
+from .ledger import MonthSummary
+from .lazy_months import LazyMonths, MonthSource
+
+
+class JsonMonthSource(MonthSource):
+    """
+    Month source over the parsed "entries" section of a JSON workbook.
+
+    Entry objects are only built for months that are loaded; summaries
+    need just one Decimal per distinct amount string. A month's raw entry
+    dicts are dropped once it is loaded (LazyMonths loads each month at
+    most once), so memory shifts from raw records to Entry objects instead
+    of holding both.
+
+    The file itself is still parsed as a whole by json.loads, so opening a
+    workbook costs O(file) time and, until months are loaded, the raw
+    records of every month stay in memory.
+    """
+
+    def __init__(self, entries: dict):
+        """
+        :param entries: raw mapping "YYYY-MM" -> list of entry dicts
+        """
+        self._raw = {}    # month -> list of entry dicts
+        self._shared = {}  # parsed dates/amounts reused across entries
+        for m_str, records in entries.items():
+            try:
+                self._raw[date.fromisoformat(f"{m_str}-01")] = records
+            except ValueError:
+                continue  # skip invalid keys
+
+    def _amount(self, text: str) -> Decimal:
+        """Parse an amount string once and share the Decimal."""
+        key = ("amount", text)
+        amount = self._shared.get(key)
+        if amount is None:
+            amount = self._shared[key] = Decimal(text)
+        return amount
+
+    def summaries(self) -> dict:
+        summaries = {}
+        for m, records in self._raw.items():
+            totals, counts = {}, {}
+            for r in records:
+                bucket = (r["direction"], r["type"])
+                totals[bucket] = totals.get(bucket, 0) + self._amount(r["amount"])
+                counts[bucket] = counts.get(bucket, 0) + 1
+            summaries[m] = MonthSummary(m, totals, counts)
+        return summaries
+
+    def load(self, month: date) -> MonthlyData:
+        return MonthlyData(month, [Entry.from_dict(e, self._shared) for e in self._raw.pop(month)])
+
+    def records(self, month: date) -> list[dict]:
+        return self._raw[month]
+
 
 class DataStore:
     """
@@ -12,16 +69,34 @@ class DataStore:
 
     Data format:
       {
-        "meta": {"period_start": "YYYY-MM-DD" or null, "window_offset": int},
+        "meta": {"period_start": "YYYY-MM-DD" or null, "window_offset": int,
+                 "rules": [rule_dict, ...] (optional, see recurring.py)},
         "entries": {"YYYY-MM": [entry_dict, ...], ...}
       }
 
     Methods:
       - load(): returns (period_start, window_offset, months_dict)
-      - save(period_start, window_offset, months_dict): writes JSON file
+      - load_months(): like load(), but months is a LazyMonths that only
+        materializes the months that are actually read
+      - load_rules(): recurring rule dicts of the last load
+      - save(period_start, window_offset, months_dict, rules): writes JSON file
+      - commit(period_start, window_offset, months_dict, changes, rules):
+        persist after a mutation; this backend ignores changes and rewrites
+        the file
+
+    Files are replaced atomically, so an interrupted save never leaves a
+    truncated data.json behind.
     """
     FILE = Path("data/data.json")
 
+    def __init__(self, path=None):
+        """
+        :param path: workbook file to use instead of the default FILE
+        """
+        if path is not None:
+            self.FILE = Path(path)
+        self.meta = {}  # raw meta section of the last load
+
     def load(self):
         """
         Load stored data from disk.
@@ -36,16 +111,12 @@ class DataStore:
             return None, 0, {}
 
         raw = json.loads(self.FILE.read_text())
-        meta = raw.get("meta", {}) or {}
-
-        # Extract metadata
-        period_start = None
-        if meta.get("period_start"):  # ISO date string
-            period_start = date.fromisoformat(meta["period_start"])
-        window_offset = int(meta.get("window_offset", 0))
+        self.meta = raw.get("meta", {}) or {}
+        period_start, window_offset = self._parse_meta(self.meta)
 
         # Load entries organized by month
         months: dict[date, MonthlyData] = {}
+        shared = {}  # parsed dates/amounts reused across entries
         for m_str, entries in raw.get("entries", {}).items():
             # m_str format: YYYY-MM
             try:
@@ -53,41 +124,131 @@ class DataStore:
             except ValueError:
                 continue  # skip invalid keys
 
-            md = MonthlyData(m_date)
-            for e in entries:
-                entry = Entry(
-                    date=date.fromisoformat(e["date"]),
-                    category=Category(e["category"]),
-                    direction=e["direction"],
-                    amount=Decimal(e["amount"]),
-                    type=e["type"]
-                )
-                md.entries.append(entry)
-            months[m_date] = md
+            months[m_date] = MonthlyData(m_date, [Entry.from_dict(e, shared) for e in entries])
 
         return period_start, window_offset, months
 
-    def save(self, period_start: date, window_offset: int, months: dict[date, MonthlyData]):
+    def load_months(self):
+        """
+        Load metadata and a month index; entries are parsed per month on access.
+
+        :returns: tuple(period_start, window_offset, months: LazyMonths)
+        """
+        if not self.FILE.exists():
+            return None, 0, LazyMonths()
+        raw = json.loads(self.FILE.read_text())
+        self.meta = raw.get("meta", {}) or {}
+        period_start, window_offset = self._parse_meta(self.meta)
+        return period_start, window_offset, LazyMonths(source=JsonMonthSource(raw.get("entries", {})))
+
+    @staticmethod
+    def _parse_meta(meta: dict):
+        """
+        Extract metadata from a raw "meta" section.
+
+        :returns: tuple(period_start or None, window_offset)
+        """
+        period_start = None
+        if meta.get("period_start"):  # ISO date string
+            period_start = date.fromisoformat(meta["period_start"])
+        return period_start, int(meta.get("window_offset", 0))
+
+    def load_rules(self) -> list[dict]:
+        """Return the recurring rules (to_dict() mappings) of the last load."""
+        return list(self.meta.get("rules", []))
+
+    @staticmethod
+    def _rules_meta(rules: Optional[list]) -> dict:
+        """Return the meta keys storing recurring rules (none without rules)."""
+        return {"rules": rules} if rules else {}
+
+    def read_meta(self) -> dict:
+        """Return the raw "meta" section of the stored file (empty if missing)."""
+        if not self.FILE.exists():
+            return {}
+        return json.loads(self.FILE.read_text()).get("meta", {}) or {}
+
+    def commit(self, period_start: date, window_offset: int,
+               months: dict[date, MonthlyData], changes: Optional[list],
+               rules: Optional[list] = None):
+        """
+        Persist state after one or more model mutations.
+
+        :param period_start: starting date of the period or None
+        :param window_offset: current window offset index
+        :param months: mapping of month start date to MonthlyData
+        :param changes: change records since the last commit, or None when
+            the whole workbook must be rewritten
+        :param rules: recurring rules as to_dict() mappings
+        """
+        self.save(period_start, window_offset, months, rules)
+
+    def save(self, period_start: date, window_offset: int, months: dict[date, MonthlyData],
+             rules: Optional[list] = None):
         """
         Persist metadata and monthly entries to the JSON file.
 
         :param period_start: starting date of the period or None
         :param window_offset: current window offset index
         :param months: mapping of month start date to MonthlyData
+        :param rules: recurring rules as to_dict() mappings
+        """
+        self.write_snapshot(period_start, window_offset, months, self._rules_meta(rules))
+
+    def write_snapshot(self, period_start: date, window_offset: int,
+                       months: dict[date, MonthlyData], extra_meta: dict):
+        """
+        Replace the stored workbook with a full snapshot.
+
+        save() goes through here; convert() uses it to carry extra meta
+        keys over from another store.
+
+        :param period_start: starting date of the period or None
+        :param window_offset: current window offset index
+        :param months: mapping of month start date to MonthlyData
+        :param extra_meta: additional meta keys to store (e.g. rules)
+        """
+        self._write_snapshot(period_start, window_offset, months, extra_meta)
+
+    def _write_snapshot(self, period_start, window_offset, months, extra_meta: dict):
+        """
+        Serialize the full workbook and atomically replace the JSON file.
+
+        :param extra_meta: additional keys stored in the "meta" section
         """
         obj = {
             "meta": {
                 "period_start": period_start.isoformat() if period_start else None,
-                "window_offset": window_offset
+                "window_offset": window_offset,
+                **extra_meta
             },
             "entries": {}
         }
 
-        # Serialize each month's entries
-        for m_date, md in months.items():
+        # Serialize each month's entries (unloaded months are copied as stored)
+        for m_date in months:
             key = m_date.strftime("%Y-%m")
-            obj["entries"][key] = [e.to_dict() for e in md.entries]
+            if isinstance(months, LazyMonths):
+                obj["entries"][key] = months.records(m_date)
+            else:
+                obj["entries"][key] = [e.to_dict() for e in months[m_date].entries]
+
+        self._write_atomic(self.FILE, json.dumps(obj, indent=2))
 
-        # Ensure directory exists and write file
-        self.FILE.parent.mkdir(parents=True, exist_ok=True)
-        self.FILE.write_text(json.dumps(obj, indent=2))
\ No newline at end of file
+    @staticmethod
+    def _write_atomic(path: Path, data):
+        """
+        Write text or bytes to a temporary sibling file, fsync it and rename
+        it over the target so readers only ever see the old or the new content.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        if isinstance(data, bytes):
+            f = open(tmp, "wb")
+        else:
+            f = open(tmp, "w", encoding="utf-8")
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
\ No newline at end of file
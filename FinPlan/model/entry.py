@@ -1,14 +1,40 @@
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Literal
+from enum import Enum
+from typing import Optional
 from .category import Category
 
-@dataclass
+
+class Direction(str, Enum):
+    """Money flow direction of an entry; compares equal to its string value."""
+    Income = "income"
+    Expense = "expense"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class EntryType(str, Enum):
+    """Whether an entry is planned or realized; compares equal to its string value."""
+    Forecast = "forecast"
+    Actual = "actual"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
 class Entry:
     """
     Represents a single financial record for a given month.
 
+    Entries are immutable and slotted (no per-instance __dict__). Direction
+    and type are stored as the shared Direction/EntryType members; plain
+    strings passed to the constructor are converted, and the members still
+    compare and hash equal to "income", "forecast" and so on. Use
+    dataclasses.replace() to derive a modified entry.
+
     Attributes:
       date: the first day of the relevant month
       category: category of the entry (income or expense)
@@ -16,11 +42,18 @@ class Entry:
       amount: monetary value as Decimal
       type: "forecast" or "actual"
     """
+    __slots__ = ("date", "category", "direction", "amount", "type")
+
     date: date               # month of the entry (first day)
     category: Category       # category enum
-    direction: Literal["income", "expense"]  # indicates income or expense
+    direction: Direction     # indicates income or expense
     amount: Decimal          # amount value
-    type: Literal["forecast", "actual"]      # entry type
+    type: EntryType          # entry type
+
+    def __post_init__(self):
+        # Intern direction and type as enum members (no-op if already members)
+        object.__setattr__(self, "direction", Direction(self.direction))
+        object.__setattr__(self, "type", EntryType(self.type))
 
     def to_dict(self) -> dict:
         """
@@ -31,7 +64,36 @@ class Entry:
         return {
             "date": self.date.isoformat(),        # ISO date string
             "category": self.category.value,      # category name
-            "direction": self.direction,          # "income" or "expense"
+            "direction": self.direction.value,    # "income" or "expense"
             "amount": str(self.amount),           # decimal as string
-            "type": self.type,                    # "forecast" or "actual"
-        }
\ No newline at end of file
+            "type": self.type.value,              # "forecast" or "actual"
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, shared: Optional[dict] = None) -> "Entry":
+        """
+        Build an Entry from the mapping produced by to_dict().
+
+        :param data: mapping with date, category, direction, amount and type
+        :param shared: optional cache of already parsed dates and amounts;
+            when loading many entries, equal values then share one object
+        :return: new Entry instance
+        """
+        if shared is None:
+            entry_date = date.fromisoformat(data["date"])
+            amount = Decimal(data["amount"])
+        else:
+            entry_date = shared.get(data["date"])
+            if entry_date is None:
+                entry_date = shared[data["date"]] = date.fromisoformat(data["date"])
+            key = ("amount", data["amount"])
+            amount = shared.get(key)
+            if amount is None:
+                amount = shared[key] = Decimal(data["amount"])
+        return cls(
+            date=entry_date,
+            category=Category(data["category"]),
+            direction=data["direction"],
+            amount=amount,
+            type=data["type"]
+        )
@@ -0,0 +1,415 @@
+"""
+Streaming export of ledgers, forecast metrics and chart series.
+
+Rows are produced by generators (ledger_rows, forecast_rows, chart_rows)
+and written either as CSV or as a columnar binary file (.fpc), so an
+export never holds more than one month of entries or one row group in
+memory.
+
+Columnar file layout (little endian), modelled on Parquet:
+
+  magic    b"FPCO"
+  groups   row groups; each is one buffer per column, 8-byte aligned
+  footer   UTF-8 JSON: {"version", "columns": [{"name", "type"}],
+           "dictionaries": {column: [values]}, "meta": {...},
+           "row_groups": [{"rows", "columns": [{"offset", "length",
+           "dtype", "scale"}]}]}
+  uint32   footer length
+  magic    b"FPCO"
+
+Column types and their buffers:
+  date     int32 days since 1970-01-01 (numpy datetime64[D])
+  str      int32 codes into the column's dictionary
+  decimal  int64 value * 10**scale (scale per row group, lossless), or
+           float64 with scale null if a group does not fit int64
+  float    float64
+  int      int64
+
+read_columnar() loads columns as NumPy arrays; iter_columnar_rows()
+streams rows with exact Decimal values.
+"""
+import csv
+import json
+import os
+import struct
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from .constants import SCENARIO_FACTORS
+
+MAGIC = b"FPCO"
+VERSION = 1
+FOOTER_LENGTH = struct.Struct("<I")
+ROW_GROUP_SIZE = 65536             # rows per row group
+EPOCH = date(1970, 1, 1).toordinal()
+INT64_LIMIT = 2 ** 63
+
+LEDGER_FIELDS = [
+    ("month", "date"), ("category", "str"), ("direction", "str"),
+    ("type", "str"), ("amount", "decimal"),
+]
+FORECAST_FIELDS = [
+    ("scenario", "str"), ("month", "date"), ("net_cash_flow", "decimal"),
+    ("closing_balance", "decimal"), ("runway", "decimal"),
+]
+CHART_FIELDS = [
+    ("scenario", "str"), ("kind", "str"), ("month", "date"),
+    ("net_cash_flow", "float"), ("runway", "float"),
+]
+EXPORTS = {"ledger": LEDGER_FIELDS, "forecast": FORECAST_FIELDS, "chart": CHART_FIELDS}
+
+
+# -- row generators ----------------------------------------------------------
+
+def ledger_rows(model) -> Iterator[dict]:
+    """
+    Yield every stored entry in month order, one month in memory at a time.
+
+    Months that were never loaded are read through the store's month index
+    without materializing MonthlyData.
+    """
+    months = model.months
+    for month in sorted(months):
+        for record in months.records(month):
+            yield {
+                "month": month,
+                "category": record["category"],
+                "direction": record["direction"],
+                "type": record["type"],
+                "amount": Decimal(record["amount"]),
+            }
+
+
+def forecast_rows(model, scenarios: Optional[Iterable[str]] = None) -> Iterator[dict]:
+    """Yield the forecast metrics of each scenario, one row per window month."""
+    months = model.get_active_months()
+    for name in scenarios or SCENARIO_FACTORS:
+        headers, net_row, close_row, runway_row = model.generate_forecast_metrics(name)
+        for month, net, close, runway in zip(months, net_row, close_row, runway_row):
+            yield {
+                "scenario": name, "month": month, "net_cash_flow": Decimal(net),
+                "closing_balance": Decimal(close), "runway": Decimal(runway),
+            }
+
+
+def chart_rows(model, scenarios: Optional[Iterable[str]] = None) -> Iterator[dict]:
+    """Yield the chart series (actual history and forecast) of each scenario."""
+    for name in scenarios or SCENARIO_FACTORS:
+        net_flows, runways = model.get_chart_data(name)
+        for (kind, label, net), (_, _, runway) in zip(net_flows, runways):
+            yield {
+                "scenario": name, "kind": kind,
+                "month": datetime.strptime(label, "%b %Y").date(),
+                "net_cash_flow": net, "runway": runway,
+            }
+
+
+def export_rows(model, what: str, scenarios: Optional[Iterable[str]] = None) -> Iterator[dict]:
+    """
+    Return the row generator of an export kind.
+
+    :param what: "ledger", "forecast" or "chart"
+    :param scenarios: scenario names for forecast and chart (default: all)
+    """
+    if what == "ledger":
+        return ledger_rows(model)
+    if what == "forecast":
+        return forecast_rows(model, scenarios)
+    if what == "chart":
+        return chart_rows(model, scenarios)
+    raise ValueError(f"Unknown export {what!r}; choose from {', '.join(EXPORTS)}")
+
+
+# -- writers -----------------------------------------------------------------
+
+def write_csv(rows: Iterable[dict], fields: list, out) -> int:
+    """
+    Stream rows to a CSV text stream.
+
+    :param fields: [(name, type)] schema; dates are written as ISO strings
+    :return: number of rows written
+    """
+    names = [name for name, _ in fields]
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(names)
+    count = 0
+    for row in rows:
+        writer.writerow([row[name].isoformat() if isinstance(row[name], date) else row[name]
+                         for name in names])
+        count += 1
+    return count
+
+
+class ColumnarWriter:
+    """
+    Writes rows to a columnar file, one row group at a time.
+
+    The file is written to a temporary sibling and renamed into place by
+    close(), so readers never see a partial export.
+
+    Usage:
+        with ColumnarWriter(path, LEDGER_FIELDS) as writer:
+            writer.write_rows(ledger_rows(model))
+    """
+
+    def __init__(self, path, fields: list, meta: Optional[dict] = None,
+                 row_group_size: int = ROW_GROUP_SIZE):
+        """
+        :param path: output file
+        :param fields: [(name, type)] with types date/str/decimal/float/int
+        :param meta: JSON-serializable metadata stored in the footer
+        :param row_group_size: rows buffered before a group is written
+        """
+        for name, kind in fields:
+            if kind not in _ENCODERS:
+                raise ValueError(f"Column {name!r}: unknown type {kind!r}")
+        self.path = Path(path)
+        self.fields = list(fields)
+        self.meta = meta or {}
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp, "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._buffer = {name: [] for name, _ in self.fields}
+        self._buffered = 0
+        self._dictionaries = {name: {} for name, kind in self.fields if kind == "str"}
+        self._groups = []
+
+    def write_row(self, row: dict):
+        for name, _ in self.fields:
+            self._buffer[name].append(row[name])
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self._flush_group()
+
+    def write_rows(self, rows: Iterable[dict]) -> int:
+        """Write all rows of an iterable; return the number written."""
+        before = self.rows + self._buffered
+        for row in rows:
+            self.write_row(row)
+        return self.rows + self._buffered - before
+
+    def _flush_group(self):
+        if not self._buffered:
+            return
+        columns = []
+        for name, kind in self.fields:
+            values = self._buffer[name]
+            data, info = _ENCODERS[kind](values, self._dictionaries.get(name))
+            padding = -self._offset % 8
+            self._file.write(b"\0" * padding)
+            self._offset += padding
+            self._file.write(data)
+            columns.append({"offset": self._offset, "length": len(data), **info})
+            self._offset += len(data)
+            values.clear()
+        self._groups.append({"rows": self._buffered, "columns": columns})
+        self.rows += self._buffered
+        self._buffered = 0
+
+    def close(self):
+        """Write the last row group and the footer, then move the file into place."""
+        if self._file.closed:
+            return
+        self._flush_group()
+        footer = json.dumps({
+            "version": VERSION,
+            "columns": [{"name": name, "type": kind} for name, kind in self.fields],
+            "dictionaries": {name: list(values) for name, values in self._dictionaries.items()},
+            "row_groups": self._groups,
+            "meta": self.meta,
+        }).encode("utf-8")
+        self._file.write(footer)
+        self._file.write(FOOTER_LENGTH.pack(len(footer)))
+        self._file.write(MAGIC)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self):
+        """Discard the partial file."""
+        if not self._file.closed:
+            self._file.close()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _encode_date(values, _):
+    days = np.fromiter((d.toordinal() - EPOCH for d in values), dtype="<i4", count=len(values))
+    return days.tobytes(), {"dtype": "<i4"}
+
+
+def _encode_str(values, dictionary):
+    codes = np.empty(len(values), dtype="<i4")
+    for i, value in enumerate(values):
+        code = dictionary.get(value)
+        if code is None:
+            code = dictionary[value] = len(dictionary)
+        codes[i] = code
+    return codes.tobytes(), {"dtype": "<i4"}
+
+
+def _encode_decimal(values, _):
+    scale = max((-v.as_tuple().exponent for v in values if v.is_finite()), default=0)
+    scale = max(scale, 0)
+    try:
+        scaled = [int(v.scaleb(scale)) for v in values]
+        if all(-INT64_LIMIT <= n < INT64_LIMIT for n in scaled):
+            return np.array(scaled, dtype="<i8").tobytes(), {"dtype": "<i8", "scale": scale}
+    except (ValueError, OverflowError, ArithmeticError):
+        pass
+    return np.array([float(v) for v in values], dtype="<f8").tobytes(), {"dtype": "<f8", "scale": None}
+
+
+def _encode_float(values, _):
+    return np.array(values, dtype="<f8").tobytes(), {"dtype": "<f8"}
+
+
+def _encode_int(values, _):
+    return np.array(values, dtype="<i8").tobytes(), {"dtype": "<i8"}
+
+
+_ENCODERS = {
+    "date": _encode_date, "str": _encode_str, "decimal": _encode_decimal,
+    "float": _encode_float, "int": _encode_int,
+}
+
+
+def export(model, what: str, path, fmt: Optional[str] = None,
+           scenarios: Optional[Iterable[str]] = None) -> int:
+    """
+    Export ledger, forecast metrics or chart series of a model to a file.
+
+    :param model: FinModel to export
+    :param what: "ledger", "forecast" or "chart"
+    :param path: output file
+    :param fmt: "csv" or "columnar" (default: columnar for .fpc, else csv)
+    :param scenarios: scenario names for forecast and chart (default: all)
+    :return: number of rows written
+    """
+    path = Path(path)
+    fields = EXPORTS.get(what)
+    rows = export_rows(model, what, scenarios)
+    fmt = fmt or ("columnar" if path.suffix.lower() == ".fpc" else "csv")
+    if fmt == "columnar":
+        meta = {
+            "export": what,
+            "period_start": model.period_start.isoformat() if model.period_start else None,
+            "window_offset": model.window_offset,
+            "created": datetime.now().isoformat(timespec="seconds"),
+        }
+        with ColumnarWriter(path, fields, meta) as writer:
+            return writer.write_rows(rows)
+    if fmt != "csv":
+        raise ValueError(f"Unknown export format {fmt!r}")
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="") as out:
+            count = write_csv(rows, fields, out)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return count
+
+
+# -- readers -----------------------------------------------------------------
+
+def read_footer(path) -> dict:
+    """Return the footer of a columnar file (schema, dictionaries, row groups, meta)."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        tail = len(MAGIC) + FOOTER_LENGTH.size
+        if size < len(MAGIC) + tail:
+            raise ValueError(f"{path}: not a columnar export")
+        f.seek(size - tail)
+        (length,) = FOOTER_LENGTH.unpack(f.read(FOOTER_LENGTH.size))
+        if f.read(len(MAGIC)) != MAGIC or length > size - len(MAGIC) - tail:
+            raise ValueError(f"{path}: not a columnar export")
+        f.seek(size - tail - length)
+        return json.loads(f.read(length))
+
+
+def _read_group(f, footer: dict, group: dict, names: list) -> dict:
+    """Read the raw buffers of one row group into typed NumPy arrays."""
+    out = {}
+    for col, info in zip(footer["columns"], group["columns"]):
+        if col["name"] not in names:
+            continue
+        f.seek(info["offset"])
+        out[col["name"]] = (np.frombuffer(f.read(info["length"]), dtype=info["dtype"]), info)
+    return out
+
+
+def _decode(kind: str, data, info: dict, dictionary: Optional[list]):
+    if kind == "date":
+        return data.astype("datetime64[D]")
+    if kind == "str":
+        return np.array(dictionary, dtype=object)[data] if dictionary else data.astype(object)
+    if kind == "decimal" and info.get("scale") is not None:
+        return data / 10.0 ** info["scale"]
+    return data
+
+
+def read_columnar(path, columns: Optional[list] = None) -> dict:
+    """
+    Load columns of a columnar export as NumPy arrays.
+
+    Dates become datetime64[D], strings object arrays and decimals
+    float64 (use iter_columnar_rows for exact values).
+
+    :param columns: names to load (default: all)
+    """
+    footer = read_footer(path)
+    kinds = {c["name"]: c["type"] for c in footer["columns"]}
+    names = columns or list(kinds)
+    parts = {name: [] for name in names}
+    with open(path, "rb") as f:
+        for group in footer["row_groups"]:
+            for name, (data, info) in _read_group(f, footer, group, names).items():
+                parts[name].append(_decode(kinds[name], data, info, footer["dictionaries"].get(name)))
+    return {name: np.concatenate(chunks) if chunks else np.array([]) for name, chunks in parts.items()}
+
+
+def iter_columnar_rows(path) -> Iterator[dict]:
+    """Stream the rows of a columnar export with exact values, one row group at a time."""
+    footer = read_footer(path)
+    fields = [(c["name"], c["type"]) for c in footer["columns"]]
+    names = [name for name, _ in fields]
+    with open(path, "rb") as f:
+        for group in footer["row_groups"]:
+            raw = _read_group(f, footer, group, names)
+            columns = []
+            for name, kind in fields:
+                data, info = raw[name]
+                if kind == "date":
+                    columns.append([date.fromordinal(int(d) + EPOCH) for d in data])
+                elif kind == "str":
+                    dictionary = footer["dictionaries"][name]
+                    columns.append([dictionary[c] for c in data])
+                elif kind == "decimal" and info.get("scale") is not None:
+                    scale = info["scale"]
+                    columns.append([Decimal(int(v)).scaleb(-scale) for v in data])
+                elif kind == "decimal":
+                    columns.append([Decimal(repr(float(v))) for v in data])
+                else:
+                    columns.append(data.tolist())
+            for values in zip(*columns):
+                yield dict(zip(names, values))
@@ -1,46 +1,334 @@
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_EVEN
 import shutil
+import threading
 from pathlib import Path
+from typing import Callable, Optional
 from dateutil.relativedelta import relativedelta
 
 from .monthly_data import MonthlyData
 from .scenario import Scenario
 from .data_store import DataStore
+from .binary_store import open_store
 from .entry import Entry
 from .period_shift import PeriodShift
+from .balance_index import BalanceIndex
+from .autosave import AutosaveScheduler, report_error
+from .ledger import Ledger, MonthTotals
+from .scenario_engine import ScenarioEngine, ProjectedTotals
+from .monte_carlo import MonteCarloEngine, SimulationResult, window_amounts
+from .sweep import SweepResult, group_amounts, sweep
+from .goal_seek import GoalResult, DEFAULT_BOUNDS, DEFAULT_TOLERANCE, seek
+from .recurring import RecurringRule, RuleSet
+from .constants import AUTOSAVE_DELAY, AUTOSAVE_MAX_DELAY, DEFAULT_HORIZON, MAX_HORIZON, SCENARIO_FACTORS
+from . import metrics
 
 class FinModel:
     """
-    Core business logic managing a rolling three-month window of financial data.
+    Core business logic managing a rolling window of financial data.
 
     Attributes:
-      WINDOW_LENGTH: number of months in the rolling window (3)
+      WINDOW_LENGTH: default number of months in the rolling window (3)
+      horizon: current number of months in the window (see set_horizon)
       store: DataStore instance for persistence
       period_start: date or None indicating start of period
       window_offset: int offset of the current window
-      months: dict mapping month start date to MonthlyData
+      months: LazyMonths mapping month start date to MonthlyData; months
+        are loaded from the store when first read
+      rules: RuleSet of recurring income/expense rules; they are expanded
+        for the active window and counted as actuals for earlier months
+        (see recurring.py and month_view)
       active_months: list of dates in the current window
       shift: PeriodShift instance for window navigation
+      version: counter bumped by every mutation; keys the metrics cache
+      dirty: True while changes are waiting to be written
+      modified_months: months changed since the last write
+
+    Mutations are persisted immediately unless they run inside batch(),
+    in which case they are written once when the batch completes. With
+    enable_autosave() writes are deferred until editing pauses.
     """
 
-    WINDOW_LENGTH = 3  # months in the window
+    WINDOW_LENGTH = DEFAULT_HORIZON  # default months in the window
 
-    def __init__(self):
+    def __init__(self, store: Optional[DataStore] = None, path=None):
         """
         Initialize the model:
         - load saved data
         - compute active months list
         - set up period shifting helper
+
+        All state lives on the instance, so any number of models (one per
+        workbook) can coexist in a process. Threads sharing one model must
+        hold its lock while they use it (the GUI's background worker does).
+
+        :param store: persistence backend (defaults to the store
+            binary_store.open_store picks for path)
+        :param path: workbook file for the default store (ignored if a
+            store is given; defaults to DataStore.FILE)
         """
-        self.store = DataStore()  # persistence layer
-        ps, wo, months = self.store.load()
+        self.store = store or open_store(DataStore.FILE if path is None else path)  # persistence layer
+        self.lock = threading.RLock()             # serializes threads sharing the model
+        ps, wo, months = self.store.load_months()
         self.period_start = ps or None            # starting month of period
         self.window_offset = wo                   # window offset index
-        self.months = months or {}                # all stored months
+        self.months = months                      # all stored months (LazyMonths)
+        self.rules = RuleSet.from_list(self.store.load_rules())  # recurring rules
+        self.horizon = self.WINDOW_LENGTH         # months in the window
         self._recalc_window()                     # compute active_months
         self.shift = PeriodShift(self)            # navigation helper
 
+        self._batch_depth = 0                     # nesting level of batch()
+        self._dirty = False                       # unsaved changes in batch
+        self._undo = {}                           # month -> copy before batch
+        self._undo_meta = None                    # (period_start, window_offset)
+        self._undo_pending = None                 # (dirty, queued change count) before batch
+        self._undo_rules = None                   # rules before batch
+        self._changes = []                        # change records since last save
+
+        self.dirty = False                        # changes not written yet (autosave)
+        self.modified_months = set()              # months changed since the last write
+        self.writes = 0                           # store writes by this model
+        self.autosave = None                      # AutosaveScheduler, see enable_autosave
+
+        self.version = 0                          # bumped on every mutation
+        self._cache = {}                          # memoized metrics/chart data
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._balance_index = None                # (view key, BalanceIndex)
+        self._aggregates = None                   # (view key, month summaries)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several mutations into a single unit of work.
+
+        Inside the block every mutation is applied in memory only; the store
+        is written once when the outermost batch exits. If the block or the
+        final write raises, all months and metadata touched since the batch
+        began are restored and the exception is re-raised.
+
+        Usage:
+            with model.batch():
+                model.upsert_entry(e1)
+                model.upsert_entry(e2)
+        """
+        if self._batch_depth:
+            # Nested batch: join the outer unit of work
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+
+        self._batch_depth = 1
+        self._undo = {}
+        self._undo_meta = (self.period_start, self.window_offset)
+        self._undo_pending = (self.dirty, None if self._changes is None else len(self._changes))
+        self._undo_rules = list(self.rules)
+        try:
+            yield self
+            self._batch_depth = 0
+            if self._dirty:
+                self._commit()
+        except BaseException:
+            self._rollback()
+            raise
+        finally:
+            self._batch_depth = 0
+            self._dirty = False
+            self._undo = {}
+            self._undo_meta = None
+            self._undo_pending = None
+            self._undo_rules = None
+
+    def _touch(self, month: date):
+        """
+        Record that a month is about to change so a failing batch can undo it.
+
+        :param month: start date of the month being modified
+        """
+        self.modified_months.add(month)
+        if self._batch_depth and month not in self._undo:
+            md = self.months.get(month)
+            self._undo[month] = md.copy() if md else None
+
+    def _rollback(self):
+        """Restore months and metadata captured since the batch began."""
+        for month, md in self._undo.items():
+            if md is None:
+                self.months.pop(month, None)
+            else:
+                self.months[month] = md
+        self.period_start, self.window_offset = self._undo_meta
+        self.rules = RuleSet(self._undo_rules)
+        self._recalc_window()
+        # Keep changes that were already waiting for autosave before the batch
+        self.dirty, pending = self._undo_pending
+        self._changes = None if pending is None else (self._changes or [])[:pending]
+        self._invalidate()
+
+    def _record(self, op: str, **payload):
+        """
+        Queue a change record for the store's journal.
+
+        :param op: operation name ("meta", "add", "upsert", "month", "actualize", "rules")
+        :param payload: JSON-serializable operation data
+        """
+        if self._changes is not None:
+            self._changes.append({"op": op, **payload})
+
+    def _record_meta(self):
+        """Queue the current period_start/window_offset as a change record."""
+        self._record(
+            "meta",
+            period_start=self.period_start.isoformat() if self.period_start else None,
+            window_offset=self.window_offset,
+        )
+
+    def _invalidate(self):
+        """Advance the ledger version and drop memoized results."""
+        self.version += 1
+        self._cache.clear()
+
+    def _cached(self, kind: str, scenario_name: str, compute, page=None):
+        """
+        Return a memoized result for the current ledger version.
+
+        :param kind: result family ("metrics", "chart" or "sweep")
+        :param scenario_name: scenario key the result depends on
+        :param compute: zero-argument callable producing the result
+        :param page: (count, offset) of the requested columns
+        """
+        key = (kind, scenario_name, self.window_offset, self.horizon, page, self.version)
+        if key in self._cache:
+            self.cache_hits += 1
+            return self._cache[key]
+        self.cache_misses += 1
+        result = self._cache[key] = compute()
+        return result
+
+    def _view_key(self) -> tuple:
+        """Key of the derived month views: ledger version and, with rules, the window."""
+        if not self.rules:
+            return (self.version,)
+        return (self.version, self.window_offset, self.horizon)
+
+    def aggregates(self) -> dict:
+        """
+        Return {month: aggregates} for every stored month, rebuilt once per
+        version (and window, if there are recurring rules).
+
+        Months that were never loaded are represented by the summaries the
+        store indexed at startup, so history does not have to be loaded for
+        balances, charts or overviews. Months before the window include the
+        entries of recurring rules as actuals (RuleSet.history); the rule
+        entries of the window are added by _window_months.
+        """
+        key = self._view_key()
+        if self._aggregates is None or self._aggregates[0] != key:
+            summaries = self.months.summaries()
+            if self.rules and self.active_months:
+                summaries = self.rules.history(summaries, self.active_months[0], self.months)
+            self._aggregates = (key, summaries)
+        return self._aggregates[1]
+
+    def balance_index(self) -> BalanceIndex:
+        """Return the prefix-sum index of actual months, rebuilt with aggregates()."""
+        key = self._view_key()
+        if self._balance_index is None or self._balance_index[0] != key:
+            index = BalanceIndex(self.aggregates())
+            if self.rules:
+                # Rule history months are not stored; never carry them forward
+                index.last_month = max(self.months, default=None)
+            self._balance_index = (key, index)
+        return self._balance_index[1]
+
+    def _window_months(self, window: list[date], months=None):
+        """
+        Return months with the rule entries of a window merged in.
+
+        :param window: months to expand the rules for
+        :param months: mapping to overlay (default: the stored months; pass
+            aggregates() for the metrics)
+        """
+        months = self.months if months is None else months
+        if not self.rules:
+            return months
+        return self.rules.overlay(months, window, source=self.months, last=max(self.months, default=None))
+
+    def cache_info(self) -> dict:
+        """Return hit/miss counters and the number of memoized results."""
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._cache)}
+
+    def _save(self):
+        """Persist the current state, or defer it while a batch is open."""
+        self._invalidate()
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._commit()
+
+    def _commit(self):
+        """Write queued changes, or leave them to the autosave scheduler."""
+        self.dirty = True
+        if self.autosave is not None:
+            self.autosave.schedule()
+            return
+        self.flush()
+
+    def flush(self) -> bool:
+        """
+        Hand queued changes to the store and start a new change list.
+
+        Called for every mutation unless autosave is enabled; then by the
+        scheduler after an idle interval and on exit.
+
+        :return: True if anything was written
+        """
+        with self.lock:
+            if not self.dirty or self._batch_depth:
+                return False
+            changes = self._changes
+            self.store.commit(self.period_start, self.window_offset, self.months, changes,
+                              self.rules.to_list())
+            self._changes = []
+            self.dirty = False
+            self.modified_months = set()
+            self.writes += 1
+            return True
+
+    def enable_autosave(self, delay: float = AUTOSAVE_DELAY, max_delay: Optional[float] = AUTOSAVE_MAX_DELAY,
+                        on_error: Callable[[Exception], None] = report_error) -> AutosaveScheduler:
+        """
+        Defer writes: mutations mark the model dirty and a burst of edits is
+        written once, after `delay` idle seconds (see autosave.py).
+
+        Pending changes are flushed at interpreter exit (also after an
+        unhandled exception); SIGTERM/SIGHUP are covered by
+        autosave.install_exit_handlers.
+
+        :param delay: idle interval in seconds
+        :param max_delay: longest a change may stay unsaved
+        :param on_error: called (on the autosave thread) when writes start
+            failing; failed writes are retried after `delay` seconds
+        """
+        if self.autosave is None:
+            self.autosave = AutosaveScheduler(self.flush, delay, max_delay, on_error)
+        return self.autosave
+
+    def disable_autosave(self):
+        """
+        Write pending changes and stop the autosave scheduler; later
+        mutations are written immediately again.
+        """
+        if self.autosave is not None:
+            self.autosave.stop()
+            self.autosave = None
+
     def _recalc_window(self):
         """
         Compute the list of active months based on period_start and window_offset.
@@ -51,9 +339,25 @@ class FinModel:
             base = self.period_start + relativedelta(months=self.window_offset)
             self.active_months = [
                 base + relativedelta(months=i)
-                for i in range(self.WINDOW_LENGTH)
+                for i in range(self.horizon)
             ]
 
+    def set_horizon(self, months: int):
+        """
+        Change the number of months in the rolling window.
+
+        Only the window dates are recomputed; months without stored data
+        are forecast lazily when metrics or charts are requested.
+
+        :param months: horizon length, 1..MAX_HORIZON
+        :raises ValueError: if the horizon is out of range
+        """
+        if not 1 <= months <= MAX_HORIZON:
+            raise ValueError(f"Horizon must be between 1 and {MAX_HORIZON} months")
+        self.horizon = months
+        self._recalc_window()
+        self._cache.clear()
+
     def set_period_start(self, dt: date):
         """
         Set the starting month for the rolling window and reset offset.
@@ -63,7 +367,8 @@ class FinModel:
         self.period_start = dt.replace(day=1)
         self.window_offset = 0
         self._recalc_window()
-        self.store.save(self.period_start, self.window_offset, self.months)
+        self._record_meta()
+        self._save()
 
     def get_active_months(self) -> list[date]:
         """Return the list of dates in the current rolling window."""
@@ -75,31 +380,82 @@ class FinModel:
 
         :param entry: Entry to add
         """
+        self._touch(entry.date)
         md = self.months.setdefault(entry.date, MonthlyData(entry.date))
         md.add_entry(entry)
-        self.store.save(self.period_start, self.window_offset, self.months)
+        self._record("add", entry=entry.to_dict())
+        self._save()
 
     def upsert_entry(self, entry: Entry):
         """
         Insert or update an entry with matching date/category/direction/type.
         """
+        self._touch(entry.date)
         md = self.months.setdefault(entry.date, MonthlyData(entry.date))
-        replaced = False
-        for idx, existing in enumerate(md.entries):
-            if (
-                existing.date == entry.date and
-                existing.category == entry.category and
-                existing.direction == entry.direction and
-                existing.type == entry.type
-            ):
-                md.entries[idx] = entry
-                replaced = True
-                break
-
-        if not replaced:
+        md.upsert(entry)
+        self._record("upsert", entry=entry.to_dict())
+        self._save()
+
+    def add_rule(self, rule: RecurringRule) -> int:
+        """
+        Add a recurring income/expense rule and persist.
+
+        Occurrences before the active window count as actuals in the
+        balances (see aggregates) without being stored.
+
+        :param rule: RecurringRule to add
+        :return: index of the rule in self.rules
+        """
+        index = self.rules.add(rule)
+        self._record("rules", rules=self.rules.to_list())
+        self._save()
+        return index
+
+    def remove_rule(self, index: int) -> RecurringRule:
+        """
+        Remove a recurring rule and persist.
+
+        Entries it already wrote to closed months are kept.
+
+        :param index: index of the rule in self.rules
+        :return: the removed rule
+        """
+        rule = self.rules.remove(index)
+        self._record("rules", rules=self.rules.to_list())
+        self._save()
+        return rule
+
+    def _materialize_rules(self, month: date):
+        """
+        Store the rule entries of a month as actual entries.
+
+        Called by close_period for the month leaving the window; stored
+        entries that override a rule are kept. Does not persist.
+
+        :param month: start date of the month
+        """
+        pending = self.rules.pending(self.months.get(month), month)
+        if not pending:
+            return
+        self._touch(month)
+        md = self.months.setdefault(month, MonthlyData(month))
+        for entry in pending:
+            entry = replace(entry, type="actual")
             md.add_entry(entry)
+            self._record("add", entry=entry.to_dict())
+
+    def month_view(self, month: date) -> Optional[MonthlyData]:
+        """
+        Return a month's stored entries plus the forecasts of recurring rules.
+
+        The result is computed, not stored; edit months through
+        add_entry/upsert_entry.
 
-        self.store.save(self.period_start, self.window_offset, self.months)
+        :param month: start date of the month
+        :return: MonthlyData, or None if the month has no entries
+        """
+        md = self.months.get(month)
+        return self.rules.merge(md, month) if self.rules else md
 
     def generate_forecast(self, scenario_name: str) -> MonthlyData:
         """
@@ -113,134 +469,232 @@ class FinModel:
         last_month = max(self.months)
         scenario = Scenario(scenario_name)
         forecast_md = scenario.apply(self.months[last_month])
+        self._touch(forecast_md.month)
         self.months[forecast_md.month] = forecast_md
-        self.store.save(self.period_start, self.window_offset, self.months)
+        self._record(
+            "month",
+            month=forecast_md.month.strftime("%Y-%m"),
+            entries=[e.to_dict() for e in forecast_md.entries],
+        )
+        self._save()
         return forecast_md
 
+    def actualize_month(self, month: date):
+        """
+        Convert all forecast entries of a month, including those of recurring
+        rules, into actuals and persist.
+
+        :param month: start date of the month to finalize
+        """
+        md = self.months.get(month)
+        pending = self.rules.pending(md, month)
+        if not md and not pending:
+            return
+        self._touch(month)
+        # Recurring rules become stored entries only now that the month is final
+        if pending:
+            md = self.months.setdefault(month, MonthlyData(month))
+            for entry in pending:
+                md.add_entry(entry)
+                self._record("add", entry=entry.to_dict())
+        md.actualize()
+        self._record("actualize", month=month.strftime("%Y-%m"))
+        self._save()
+
     def close_period(self):
         """
         Advance the rolling window by one month and persist state.
         """
         if not self.period_start:
             raise ValueError("Period start is not set")
+        first = self.active_months[0]
         self.window_offset += 1
         self._recalc_window()
-        self.store.save(self.period_start, self.window_offset, self.months)
+        self._materialize_rules(first)
+        self._record_meta()
+        self._save()
 
     def get_overview(self) -> list[tuple[date, Decimal]]:
         """
         Return a list of tuples (month, net_cash_flow) for all stored months.
         """
-        return [
-            (m, md.net_cash_flow)
-            for m, md in sorted(self.months.items())
-        ]
+        return metrics.overview(self.aggregates())
 
-    def generate_forecast_metrics(self, scenario_name: str, months: int = 3):
+    def generate_forecast_metrics(self, scenario_name: str, months: Optional[int] = None, offset: int = 0):
         """
         Compute forecast metrics (net cash flow, closing balance, runway)
         for each month in the active window based on a scenario.
 
+        Results are memoized per (scenario, window, page, version) and
+        shared between callers, so treat the returned lists as read-only.
+
         :param scenario_name: scenario key to apply
-        :param months: number of months to include (default 3)
+        :param months: number of months to include (default: whole window)
+        :param offset: index of the first window month to include
         :return: (headers, net_row, close_row, runway_row)
         """
-        scenario = Scenario(scenario_name)
-        forecast_months = []
-
-        for m in self.get_active_months():
-            md = self.months.get(m)
-            if md:
-                fm = scenario.apply(md, preserve_date=True)
-                fm.month = m
-                forecast_months.append(fm)
-
-        if not forecast_months:
-            return [], [], [], []
-
-        # Determine actual months before the forecast window
-        actual_months = [
-            md for m, md in self.months.items()
-            if m < forecast_months[0].month and any(e.type == "actual" for e in md.entries)
-        ]
-        initial_balance = sum(md.net_cash_flow for md in actual_months)
-
-        # Weighted burn rate: 2x for actual, 1x for forecast
-        weight_actual = 2
-        weight_forecast = 1
-        total_weight = len(actual_months)*weight_actual + len(forecast_months)*weight_forecast
-
-        if total_weight:
-            total_exp_actual = sum(md.total_expenses for md in actual_months)
-            total_exp_forecast = sum(md.total_expenses for md in forecast_months)
-            weighted_burn = (total_exp_actual*weight_actual + total_exp_forecast*weight_forecast) / total_weight
-        else:
-            weighted_burn = Decimal("1")
-
-        headers = [md.month.strftime("%b %Y") for md in forecast_months]
-        net_row, close_row, runway_row = [], [], []
+        return self._cached("metrics", scenario_name, lambda: metrics.forecast_metrics(
+            self._window_months(self.get_active_months(), self.aggregates()),
+            self.get_active_months(), Scenario(scenario_name),
+            index=self.balance_index(), count=months, offset=offset,
+        ), page=(months, offset))
 
-        balance = initial_balance
-        for fm in forecast_months:
-            net = fm.net_cash_flow
-            balance += net
-            runway = (balance / weighted_burn) if weighted_burn else Decimal("0")
-            net_row.append(str(net))
-            close_row.append(str(balance))
-            runway_row.append(str(round(runway, 2)))
-
-        return headers, net_row, close_row, runway_row
-
-    def get_chart_data(self, scenario_name: str):
+    def get_chart_data(self, scenario_name: str, months: Optional[int] = None, offset: int = 0):
         """
         Prepare data tuples for charting actual vs forecast flows and runways.
 
         :param scenario_name: scenario key
+        :param months: number of forecast months to include (default: all)
+        :param offset: index of the first window month to include
         :return: (net_flows, runways) lists of (type, label, value)
         """
-        net_flows, runways = [], []
-
-        hdrs, net_vals, _, runway_vals = self.generate_forecast_metrics(scenario_name)
-        if not hdrs:
-            return [], []
-
-        # Plot actual data first
-        balance = Decimal("0")
-        for m in sorted(self.months):
-            md = self.months[m]
-            if any(e.type == "actual" for e in md.entries):
-                net = md.net_cash_flow
-                burn = (md.total_expenses / 3) if md.total_expenses else Decimal("1")
-                run = (balance / burn) if burn else Decimal("0")
-                net_flows.append(("actual", m.strftime("%b %Y"), float(net)))
-                runways.append(("actual", m.strftime("%b %Y"), float(run)))
-                balance += net
-
-        # Then forecast values
-        for lbl, net_str, rw_str in zip(hdrs, net_vals, runway_vals):
-            nf = Decimal(net_str)
-            rw = Decimal(rw_str)
-            net_flows.append(("forecast", lbl, float(nf)))
-            runways.append(("forecast", lbl, float(rw)))
-            balance += nf
-
-        return net_flows, runways
+        return self._cached("chart", scenario_name, lambda: metrics.chart_data(
+            self.aggregates(), self.get_active_months(), Scenario(scenario_name),
+            forecast=self.generate_forecast_metrics(scenario_name, months, offset),
+            index=self.balance_index(),
+        ), page=(months, offset))
+
+    def project_scenario(self, scenario_name: str, rounding: str = ROUND_HALF_EVEN) -> ProjectedTotals:
+        """
+        Project every stored month through a scenario in one vectorized pass.
+
+        :param scenario_name: scenario key
+        :param rounding: decimal rounding mode for cent results
+        :return: ProjectedTotals (income, expenses, net in cents per month)
+        """
+        engine = ScenarioEngine.from_name(scenario_name, rounding)
+        return engine.project(MonthTotals.from_months(self.aggregates()))
+
+    def simulate(self, scenario_name: str = "baseline", paths: int = 10000,
+                 seed: Optional[int] = None, workers: Optional[int] = None,
+                 distributions: Optional[dict] = None) -> SimulationResult:
+        """
+        Run a Monte Carlo forecast of the active window.
+
+        The scenario factors set the mean of every category; the per-category
+        distributions add the variation around it.
+
+        :param scenario_name: scenario key whose factors scale the amounts
+        :param paths: number of simulated paths
+        :param seed: optional seed for reproducible results
+        :param workers: worker processes (None: one per core, 1: in-process)
+        :param distributions: per-category overrides of STOCHASTIC_CATEGORIES
+        :return: SimulationResult (P10/P50/P90 closing balance, runway distribution)
+        :raises ValueError: if scenario name is unknown
+        """
+        if scenario_name not in SCENARIO_FACTORS:
+            raise ValueError(f"Unknown scenario: {scenario_name}")
+        index = self.balance_index()
+        months, income, expenses = window_amounts(
+            self._window_months(self.get_active_months()), self.get_active_months(), index, SCENARIO_FACTORS[scenario_name]
+        )
+        opening = index.opening(months[0]) if months else (0, 0, 0)
+        engine = MonteCarloEngine(paths, seed, workers, distributions)
+        return engine.simulate(months, income, expenses, opening)
+
+    def sweep(self, income_factors, expense_factors) -> SweepResult:
+        """
+        Evaluate the active window for a grid of income and expense factors.
+
+        Every income factor is combined with every expense factor in one
+        vectorized pass. The window amounts per category group are computed
+        once per ledger version, so repeated sweeps (e.g. a live heatmap)
+        only redo the grid arithmetic.
+
+        :param income_factors: I income multipliers, or {group: multipliers}
+            for the "guaranteed" and "expected" income groups
+        :param expense_factors: J expense multipliers, or {group: multipliers}
+            for the "fixed" and "variable" expense groups
+        :return: SweepResult with (I, J, months) closing balances and runway
+        :raises ValueError: on unknown groups or mismatched factor arrays
+        """
+        months, income, expenses, opening = self._group_amounts()
+        return sweep(months, income, expenses, opening, income_factors, expense_factors)
+
+    def solve_goal(self, goal: str, until: Optional[date] = None, min_runway: float = 0.0,
+                   scenario_name: str = "baseline", groups: Optional[tuple] = None,
+                   bounds: tuple = DEFAULT_BOUNDS, tolerance: float = DEFAULT_TOLERANCE) -> GoalResult:
+        """
+        Find what it takes to stay solvent (or keep a runway) through a month.
+
+        Goals: "income" finds the smallest income factor, "expenses" the
+        largest expense factor and "funding" the smallest cash injection in
+        the first window month for which every month from the first active
+        month through `until` keeps at least `min_runway` months of runway.
+        The other direction keeps the scenario's factor.
+
+        :param goal: "income", "expenses" or "funding"
+        :param until: last month the target must hold in (default: the end
+            of the active window); the window is extended or cut to it
+        :param min_runway: runway months required (0: non-negative balance)
+        :param scenario_name: scenario whose factors are kept fixed
+        :param groups: category groups the solved factor applies to, e.g.
+            ("expected",) or ("variable",) (default: all of the direction)
+        :param bounds: (low, high) factor search range
+        :param tolerance: factor precision
+        :return: GoalResult (value None if the target cannot be met)
+        :raises ValueError: on an unknown goal, group or scenario, or a
+            target month outside 1..MAX_HORIZON months of the window
+        """
+        if scenario_name not in SCENARIO_FACTORS:
+            raise ValueError(f"Unknown scenario: {scenario_name}")
+        factors = SCENARIO_FACTORS[scenario_name]
+        months, income, expenses, opening = self._group_amounts(until)
+        return seek(goal, months, income, expenses, opening,
+                    float(factors["income"]), float(factors["expenses"]),
+                    min_runway, groups, bounds, tolerance)
+
+    def _group_amounts(self, until: Optional[date] = None):
+        """
+        Return the window's amounts per category group and its opening
+        balance, computed once per ledger version.
+
+        :param until: last window month (default: the active window)
+        :return: (months, income, expenses, opening), see sweep.group_amounts
+        :raises ValueError: if until lies outside 1..MAX_HORIZON window months
+        """
+        window = self.get_active_months()
+        if until is not None and window:
+            start = window[0]
+            until = until.replace(day=1)
+            count = (until.year - start.year) * 12 + until.month - start.month + 1
+            if not 1 <= count <= MAX_HORIZON:
+                raise ValueError(f"Target month must be within {MAX_HORIZON} months from {start:%b %Y}")
+            window = [start + relativedelta(months=i) for i in range(count)]
+
+        def amounts():
+            index = self.balance_index()
+            months, income, expenses = group_amounts(self._window_months(window), window, index)
+            opening = index.opening(months[0]) if months else (0, 0, 0)
+            return months, income, expenses, opening
+
+        return self._cached("sweep", "", amounts, page=until)
+
+    def to_ledger(self) -> Ledger:
+        """Return a columnar Ledger snapshot of all stored entries."""
+        return Ledger.from_months(self.months)
 
     def reset(self, backup: bool = True) -> None:
         """
         Clear all stored data, optionally backing up existing file first.
 
-        :param backup: if True, copy old data.json to a timestamped backup
+        :param backup: if True, copy the workbook file to a timestamped backup
         """
         file_path = self.store.FILE
         if backup and file_path.exists():
+            # Fold any journaled changes into the file before copying it
+            self.store.save(self.period_start, self.window_offset, self.months, self.rules.to_list())
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = file_path.with_name(f"data_backup_{timestamp}.json")
+            backup_file = file_path.with_name(f"{file_path.stem}_backup_{timestamp}{file_path.suffix}")
             shutil.copy(file_path, backup_file)
 
         # Reset in-memory state
+        for month in list(self.months):
+            self._touch(month)
         self.period_start = None
         self.window_offset = 0
-        self.months = {}
+        self.months.clear()
+        self.rules = RuleSet()
         self._recalc_window()
-        self.store.save(None, 0, {})
\ No newline at end of file
+        self._changes = None  # full rewrite instead of journal records
+        self._save()
\ No newline at end of file
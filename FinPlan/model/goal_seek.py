@@ -0,0 +1,158 @@
+"""
+Goal seeking: which income level, expense level or funding keeps the
+business solvent (or above a runway target) through a given month.
+
+The window runs from the first active month through the target month.
+Its amounts are summed per category group once (see sweep.group_amounts);
+every solver iteration then only redoes the balance arithmetic of those
+months, for a whole batch of candidate factors at once:
+
+  income    smallest income factor that meets the target
+  expenses  largest expense factor (i.e. maximum burn) that meets it
+  funding   smallest cash injection in the first window month that meets
+            it; balances grow linearly with it, so it is solved directly
+
+The factor searches evaluate SEARCH_POINTS evenly spaced candidates per
+iteration with sweep() and narrow the bracket to the two candidates around
+the threshold, so each iteration shrinks it by a factor of
+SEARCH_POINTS - 1. The target holds in a month if the closing balance is
+at least min_runway times the weighted burn (runway >= min_runway, with
+min_runway 0 meaning a non-negative balance).
+"""
+from datetime import date
+from decimal import Decimal, ROUND_CEILING
+from typing import Callable, Optional
+
+import numpy as np
+
+from .sweep import INCOME_GROUPS, EXPENSE_GROUPS, sweep
+
+GOALS = ("income", "expenses", "funding")
+SEARCH_POINTS = 64               # candidates evaluated per iteration
+DEFAULT_BOUNDS = (0.0, 10.0)     # factor search range
+DEFAULT_TOLERANCE = 1e-4         # factor precision
+
+
+class GoalResult:
+    """
+    Solution of a goal search.
+
+    Attributes:
+      goal: "income", "expenses" or "funding"
+      value: required factor (float) or funding amount (Decimal); None if
+        the target cannot be met within the search bounds
+      months: window months through the target month
+      closing: float64 array of closing balances at the solution
+      runway: float64 array of runway months at the solution
+      iterations: search iterations used (0 for funding)
+    """
+
+    def __init__(self, goal: str, value, months: list[date], closing, runway, iterations: int):
+        self.goal = goal
+        self.value = value
+        self.months = months
+        self.closing = closing
+        self.runway = runway
+        self.iterations = iterations
+
+    @property
+    def feasible(self) -> bool:
+        """True if the target can be met."""
+        return self.value is not None
+
+
+def _search(margin: Callable, low: float, high: float, increasing: bool, tolerance: float):
+    """
+    Find the threshold of a monotone margin function over [low, high].
+
+    :param margin: maps an array of candidates to their worst margin
+        (>= 0 where the target is met)
+    :param increasing: True if the margin grows with the candidate
+        (find the smallest feasible value), False if it shrinks (largest)
+    :return: (value or None if no candidate is feasible, iterations)
+    """
+    iterations = 0
+    while True:
+        iterations += 1
+        xs = np.linspace(low, high, SEARCH_POINTS)
+        ok = np.flatnonzero(margin(xs) >= 0)
+        if not ok.size:
+            return None, iterations
+        i = ok[0] if increasing else ok[-1]
+        if (increasing and i == 0) or (not increasing and i == SEARCH_POINTS - 1):
+            return float(xs[i]), iterations  # the bound itself meets the target
+        low, high = (xs[i - 1], xs[i]) if increasing else (xs[i], xs[i + 1])
+        if high - low <= tolerance:
+            return float(high if increasing else low), iterations
+
+
+def _factors(value, base: float, groups: tuple, selected: Optional[tuple]) -> dict:
+    """Apply value to the selected groups (default: all), base to the others."""
+    selected = groups if selected is None else selected
+    unknown = set(selected) - set(groups)
+    if unknown:
+        raise ValueError(f"Unknown factor groups: {', '.join(sorted(unknown))}")
+    return {group: value if group in selected else base for group in groups}
+
+
+def seek(goal: str, months: list[date], income, expenses, opening,
+         income_factor: float = 1.0, expense_factor: float = 1.0,
+         min_runway: float = 0.0, groups: Optional[tuple] = None,
+         bounds: tuple = DEFAULT_BOUNDS, tolerance: float = DEFAULT_TOLERANCE) -> GoalResult:
+    """
+    Solve for the factor or funding that meets a runway target in every
+    window month.
+
+    :param goal: "income", "expenses" or "funding"
+    :param months: window months, as returned by sweep.group_amounts
+    :param income: income per month and group, as returned by group_amounts
+    :param expenses: expenses per month and group, shaped like income
+    :param opening: (net, expenses, count) of actual months before the
+        window, as returned by BalanceIndex.opening
+    :param income_factor: income multiplier of the scenario (kept fixed
+        unless solved for)
+    :param expense_factor: expense multiplier of the scenario
+    :param min_runway: runway months required in every window month
+    :param groups: groups the solved factor applies to (default: all of
+        the direction); other groups keep the scenario factor
+    :param bounds: (low, high) factor search range
+    :param tolerance: factor precision
+    :return: GoalResult
+    :raises ValueError: on an unknown goal or group, or an empty window
+    """
+    if goal not in GOALS:
+        raise ValueError(f"Unknown goal: {goal}")
+    if not months:
+        raise ValueError("The goal window has no months")
+
+    def evaluate(inc, exp):
+        r = sweep(months, income, expenses, opening, inc, exp)
+        closing = r.closing.reshape(-1, len(months))  # one row per candidate
+        burn = np.broadcast_to(r.burn, closing.shape[:1])
+        return closing, burn, r.runway.reshape(-1, len(months))
+
+    def margin(closing, burn):
+        return (closing - min_runway * burn[:, None]).min(axis=1)
+
+    inc, exp = income_factor, expense_factor
+    iterations = 0
+    if goal == "funding":
+        closing, burn, _ = evaluate(inc, exp)
+        shortfall = max(-float(margin(closing, burn)[0]), 0.0)
+        value = Decimal(repr(shortfall)).quantize(Decimal("0.01"), rounding=ROUND_CEILING)
+        opening = (Decimal(opening[0]) + value, opening[1], opening[2])
+    elif goal == "income":
+        value, iterations = _search(
+            lambda xs: margin(*evaluate(_factors(xs, income_factor, INCOME_GROUPS, groups), exp)[:2]),
+            *bounds, increasing=True, tolerance=tolerance,
+        )
+        inc = _factors(bounds[1] if value is None else value, income_factor, INCOME_GROUPS, groups)
+    else:
+        value, iterations = _search(
+            lambda xs: margin(*evaluate(inc, _factors(xs, expense_factor, EXPENSE_GROUPS, groups))[:2]),
+            *bounds, increasing=False, tolerance=tolerance,
+        )
+        exp = _factors(bounds[0] if value is None else value, expense_factor, EXPENSE_GROUPS, groups)
+
+    closing, _, runway = evaluate(inc, exp)
+    return GoalResult(goal, value, months, closing[0], runway[0], iterations)
@@ -0,0 +1,481 @@
+"""
+Streaming import of ledger exports (CSV and XLSX) into a FinModel.
+
+Rows are read one at a time, validated in chunks of CHUNK_ROWS and summed
+per (month, category, direction, type); only those monthly totals are kept,
+so a bank or ERP export of any length is imported in constant memory. The
+totals are written to the model inside one batch(), i.e. with a single
+store write.
+
+Columns are matched by header name (see COLUMN_ALIASES, case-insensitive)
+or by an explicit mapping of Entry field to header. The direction column
+is optional: without it, negative amounts are expenses and positive ones
+income; with it, a negative amount flips the given direction. Category
+labels are matched against Category values and names, after an optional
+category_map translating export labels, and a row whose direction does
+not match its category (see category_direction) is invalid.
+
+XLSX files are read with the standard library (zipfile + iterparse); no
+spreadsheet package is required.
+"""
+import csv
+import io
+import time
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from xml.etree.ElementTree import iterparse
+
+from .category import Category
+from .constants import DEFAULT_EXPENSE_CATEGORIES
+from .entry import Entry, Direction, EntryType
+
+CHUNK_ROWS = 5000         # rows validated per chunk (and per progress report)
+MAX_KEPT_ERRORS = 100     # row errors kept for the report; all are counted
+
+# Header names recognized for each Entry field (lower case)
+COLUMN_ALIASES = {
+    "date":      ("date", "month", "booking date", "posting date", "value date", "transaction date"),
+    "category":  ("category", "account", "cost center"),
+    "direction": ("direction", "kind", "income/expense"),
+    "amount":    ("amount", "value", "sum", "total"),
+    "type":      ("type", "entry type"),
+}
+REQUIRED_COLUMNS = ("date", "category", "amount")
+
+DIRECTION_WORDS = {
+    "income": Direction.Income, "in": Direction.Income, "credit": Direction.Income,
+    "expense": Direction.Expense, "out": Direction.Expense, "debit": Direction.Expense,
+}
+OPPOSITE = {Direction.Income: Direction.Expense, Direction.Expense: Direction.Income}
+EXCEL_EPOCH = date(1899, 12, 30)  # day 0 of Excel serial dates (1900 system)
+
+
+def category_direction(category: Category) -> Direction:
+    """Return the direction of a category (expense categories as in DEFAULT_EXPENSE_CATEGORIES)."""
+    return Direction.Expense if category.value in DEFAULT_EXPENSE_CATEGORIES else Direction.Income
+
+
+class LedgerImportError(ValueError):
+    """Raised when a file cannot be imported (format, header or too many bad rows)."""
+
+
+@dataclass
+class ImportProgress:
+    """Snapshot passed to the progress callback after each chunk."""
+    rows: int              # rows read so far
+    errors: int            # invalid rows so far
+    bytes_read: int        # input bytes consumed (approximate for XLSX)
+    total_bytes: int       # input size, 0 if unknown
+    elapsed: float         # seconds since the import started
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Share of the input read, or None if the size is unknown."""
+        return min(self.bytes_read / self.total_bytes, 1.0) if self.total_bytes else None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class ImportResult:
+    """Outcome of LedgerImporter.import_into()."""
+    rows: int = 0                          # data rows read
+    imported: int = 0                      # valid rows added to the totals
+    errors: int = 0                        # invalid rows skipped
+    error_samples: list = field(default_factory=list)  # (row number, message), first MAX_KEPT_ERRORS
+    entries_written: int = 0               # (month, category, direction, type) totals stored
+    months: list = field(default_factory=list)          # months that received entries
+    seconds: float = 0.0                   # wall time of read, validation and write
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class _Source:
+    """Row iterator over one input file plus its read position."""
+
+    def __init__(self, rows: Iterator[list], position: Callable[[], int], total_bytes: int, close):
+        self.rows = rows
+        self.position = position
+        self.total_bytes = total_bytes
+        self.close = close
+
+
+def _open_csv(path: Path, encoding: str, delimiter: Optional[str]) -> _Source:
+    raw = open(path, "rb")
+    text = io.TextIOWrapper(raw, encoding=encoding, newline="")
+    if delimiter is None:
+        sample = text.read(64 * 1024)
+        text.seek(0)
+        try:
+            delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+        except csv.Error:
+            delimiter = ","
+    return _Source(csv.reader(text, delimiter=delimiter), raw.tell, path.stat().st_size, text.close)
+
+
+def _local(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _column_index(ref: str) -> int:
+    """Return the 0-based column of a cell reference such as "AB12"."""
+    col = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        col = col * 26 + ord(ch.upper()) - 64
+    return col - 1
+
+
+def _open_xlsx(path: Path, sheet: Optional[str]) -> _Source:
+    archive = zipfile.ZipFile(path)
+    try:
+        names = set(archive.namelist())
+        shared = []
+        if "xl/sharedStrings.xml" in names:
+            with archive.open("xl/sharedStrings.xml") as f:
+                for _, el in iterparse(f):
+                    if _local(el.tag) == "si":
+                        shared.append("".join(t.text or "" for t in el.iter() if _local(t.tag) == "t"))
+                        el.clear()
+
+        # Resolve the sheet (first one, or by name) to its part name
+        with archive.open("xl/workbook.xml") as f:
+            sheets = [(el.get("name"), next((v for k, v in el.attrib.items() if _local(k) == "id"), None))
+                      for _, el in iterparse(f) if _local(el.tag) == "sheet"]
+        if not sheets:
+            raise LedgerImportError(f"{path}: workbook has no sheets")
+        if sheet is None:
+            rel_id = sheets[0][1]
+        else:
+            rel_id = next((rid for name, rid in sheets if name == sheet), None)
+            if rel_id is None:
+                raise LedgerImportError(f"{path}: no sheet named {sheet!r}")
+        with archive.open("xl/_rels/workbook.xml.rels") as f:
+            targets = {el.get("Id"): el.get("Target") for _, el in iterparse(f)
+                       if _local(el.tag) == "Relationship"}
+        target = targets[rel_id].lstrip("/")
+        part = target if target.startswith("xl/") else f"xl/{target}"
+        info = archive.getinfo(part)
+    except (KeyError, zipfile.BadZipFile) as exc:
+        archive.close()
+        raise LedgerImportError(f"{path}: not a readable XLSX workbook ({exc})") from exc
+    except BaseException:
+        archive.close()
+        raise
+
+    stream = archive.open(part)
+    consumed = [0]  # uncompressed bytes parsed, scaled to the file size below
+
+    def rows():
+        for _, el in iterparse(stream):
+            if _local(el.tag) != "row":
+                continue
+            values = []
+            for cell in el:
+                if _local(cell.tag) != "c":
+                    continue
+                ref = cell.get("r")
+                col = _column_index(ref) if ref else len(values)
+                kind = cell.get("t")
+                if kind == "inlineStr":
+                    value = "".join(t.text or "" for t in cell.iter() if _local(t.tag) == "t")
+                else:
+                    v = next((c.text for c in cell if _local(c.tag) == "v"), None)
+                    if v is None:
+                        value = None
+                    elif kind == "s":
+                        value = shared[int(v)]
+                    elif kind == "b":
+                        value = "TRUE" if v == "1" else "FALSE"
+                    elif kind in ("str", "e"):
+                        value = v
+                    else:
+                        value = _ExcelNumber(v)
+                if col >= len(values):
+                    values.extend([None] * (col - len(values) + 1))
+                values[col] = value
+            el.clear()
+            consumed[0] = stream.tell() if stream.seekable() else consumed[0]
+            yield values
+
+    def position():
+        if not info.file_size:
+            return 0
+        return int(consumed[0] / info.file_size * path.stat().st_size)
+
+    def close():
+        stream.close()
+        archive.close()
+
+    return _Source(rows(), position, path.stat().st_size, close)
+
+
+class _ExcelNumber(str):
+    """Numeric XLSX cell text; may be a serial date in the date column."""
+
+
+class LedgerImporter:
+    """
+    Reads CSV/XLSX ledger exports and adds them to a FinModel.
+
+    Attributes:
+      mapping: {Entry field: header name} overriding COLUMN_ALIASES
+      category_map: {export label: Category, or its value or name}
+      default_category: Category (or value/name) for unknown labels
+        (None: reject the row)
+      entry_type: type of entries without a type column ("actual")
+      replace: overwrite existing entries instead of adding to them
+      decimal_separator: "." or ","; the other one is ignored as grouping
+      date_format: strptime format of the date column (None: ISO or Excel)
+      max_errors: abort once more rows are invalid (None: skip bad rows)
+      progress: callable(ImportProgress) invoked after each chunk
+    """
+
+    def __init__(self, mapping: Optional[dict] = None, category_map: Optional[dict] = None,
+                 default_category=None, entry_type: str = "actual",
+                 replace: bool = False, decimal_separator: str = ".",
+                 date_format: Optional[str] = None, max_errors: Optional[int] = None,
+                 progress: Optional[Callable[[ImportProgress], None]] = None,
+                 chunk_rows: int = CHUNK_ROWS):
+        self.mapping = dict(mapping or {})
+        self.category_map = {}
+        self.default_category = None
+        self.entry_type = EntryType(entry_type)
+        self.replace = replace
+        self.decimal_separator = decimal_separator
+        self.date_format = date_format
+        self.max_errors = max_errors
+        self.progress = progress
+        self.chunk_rows = chunk_rows
+
+        # Parse caches: exports repeat the same dates and labels many times
+        self._dates = {}
+        self._categories = {c.value.lower(): c for c in Category}
+        self._categories.update({c.name.lower(): c for c in Category})
+        for label, target in (category_map or {}).items():
+            self.category_map[label.strip().lower()] = self._category(target)
+        self._categories.update(self.category_map)
+        if default_category is not None:
+            self.default_category = self._category(default_category)
+
+    def _category(self, value) -> Category:
+        """Resolve a Category, its value or its name (case-insensitive)."""
+        if isinstance(value, Category):
+            return value
+        category = self._categories.get(str(value).strip().lower())
+        if category is None:
+            raise ValueError(f"unknown FinPlan category {value!r}")
+        return category
+
+    # -- reading ---------------------------------------------------------
+
+    def open(self, path, sheet: Optional[str] = None, encoding: str = "utf-8-sig",
+             delimiter: Optional[str] = None) -> _Source:
+        """Open a CSV or XLSX file as a row source (by suffix)."""
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix in (".xlsx", ".xlsm"):
+            return _open_xlsx(path, sheet)
+        if suffix in (".csv", ".txt", ".tsv"):
+            return _open_csv(path, encoding, "\t" if suffix == ".tsv" and delimiter is None else delimiter)
+        raise LedgerImportError(f"{path}: unsupported file type {suffix!r} (use .csv or .xlsx)")
+
+    def columns(self, header: list) -> dict:
+        """
+        Map Entry fields to column indices for a header row.
+
+        :raises LedgerImportError: if a required column is missing
+        """
+        names = [str(h).strip().lower() if h is not None else "" for h in header]
+        columns = {}
+        for field_name, aliases in COLUMN_ALIASES.items():
+            wanted = (self.mapping[field_name].strip().lower(),) if field_name in self.mapping else aliases
+            for alias in wanted:
+                if alias in names:
+                    columns[field_name] = names.index(alias)
+                    break
+        missing = [f for f in REQUIRED_COLUMNS if f not in columns]
+        if missing:
+            raise LedgerImportError(
+                f"missing column(s) {', '.join(missing)}; header is {', '.join(n for n in names if n)}"
+            )
+        return columns
+
+    # -- validation ------------------------------------------------------
+
+    def parse_date(self, value) -> date:
+        """Return the first day of the month a date cell falls in."""
+        if isinstance(value, (date, datetime)):
+            return date(value.year, value.month, 1)
+        text = str(value).strip()
+        month = self._dates.get(text)
+        if month is not None:
+            return month
+        if isinstance(value, _ExcelNumber):
+            day = EXCEL_EPOCH + timedelta(days=int(float(text)))
+        elif self.date_format:
+            day = datetime.strptime(text, self.date_format).date()
+        elif len(text) == 7:  # YYYY-MM
+            day = date.fromisoformat(text + "-01")
+        else:
+            day = date.fromisoformat(text[:10])
+        month = self._dates[text] = day.replace(day=1)
+        return month
+
+    def parse_amount(self, value) -> Decimal:
+        """Parse an amount cell; grouping characters and spaces are ignored."""
+        text = str(value).strip().replace(" ", "").replace("\u00a0", "")
+        if isinstance(value, _ExcelNumber):
+            return Decimal(text)
+        if self.decimal_separator == ",":
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+        if text.startswith("(") and text.endswith(")"):  # accounting negative
+            text = "-" + text[1:-1]
+        amount = Decimal(text)
+        if not amount.is_finite():
+            raise InvalidOperation
+        return amount
+
+    def parse_category(self, value) -> Category:
+        label = str(value).strip().lower()
+        category = self._categories.get(label)
+        if category is None:
+            if self.default_category is None:
+                raise ValueError(f"unknown category {str(value).strip()!r}")
+            category = self.default_category
+        return category
+
+    def validate_chunk(self, rows: list, columns: dict, first_row: int, totals: dict, result: ImportResult):
+        """
+        Validate a chunk of rows and add the valid ones to totals.
+
+        :param rows: raw rows of the chunk
+        :param columns: field -> column index
+        :param first_row: 1-based file row number of rows[0]
+        :param totals: {(month, category, direction, type): Decimal}, updated
+        :param result: counters and error samples, updated
+        """
+        date_col, cat_col, amount_col = columns["date"], columns["category"], columns["amount"]
+        dir_col, type_col = columns.get("direction"), columns.get("type")
+        width = max(columns.values()) + 1
+        for number, row in enumerate(rows, first_row):
+            if not any(v not in (None, "") for v in row):
+                continue  # blank line
+            result.rows += 1
+            if len(row) < width:
+                row = list(row) + [None] * (width - len(row))
+            try:
+                try:
+                    month = self.parse_date(row[date_col])
+                except (ValueError, TypeError, OverflowError):
+                    raise ValueError(f"invalid date {row[date_col]!r}")
+                category = self.parse_category(row[cat_col])
+                try:
+                    amount = self.parse_amount(row[amount_col])
+                except (InvalidOperation, ValueError):
+                    raise ValueError(f"invalid amount {row[amount_col]!r}")
+                if dir_col is not None and row[dir_col] not in (None, ""):
+                    word = str(row[dir_col]).strip().lower()
+                    direction = DIRECTION_WORDS.get(word)
+                    if direction is None:
+                        raise ValueError(f"invalid direction {row[dir_col]!r}")
+                    if amount < 0:
+                        direction = OPPOSITE[direction]  # e.g. a negative expense is money in
+                else:
+                    direction = Direction.Expense if amount < 0 else Direction.Income
+                amount = abs(amount)
+                expected = category_direction(category)
+                if direction != expected:
+                    raise ValueError(f"{direction.value} row for {expected.value} category {category.value!r}")
+                entry_type = (EntryType(str(row[type_col]).strip().lower())
+                              if type_col is not None and row[type_col] not in (None, "")
+                              else self.entry_type)
+            except (ValueError, TypeError, OverflowError) as exc:
+                result.errors += 1
+                if len(result.error_samples) < MAX_KEPT_ERRORS:
+                    result.error_samples.append((number, str(exc)))
+                if self.max_errors is not None and result.errors > self.max_errors:
+                    raise LedgerImportError(f"row {number}: {exc} (more than {self.max_errors} invalid rows)")
+                continue
+            key = (month, category, direction, entry_type)
+            totals[key] = totals.get(key, 0) + amount
+            result.imported += 1
+
+    def read_totals(self, path, **open_args) -> tuple[dict, ImportResult]:
+        """
+        Stream a file and return its monthly totals without touching a model.
+
+        :param path: .csv/.tsv/.txt or .xlsx file
+        :param open_args: sheet, encoding, delimiter (see open())
+        :return: ({(month, category, direction, type): amount}, ImportResult)
+        """
+        start = time.perf_counter()
+        result = ImportResult()
+        totals = {}
+        source = self.open(path, **open_args)
+        try:
+            header = next(source.rows, None)
+            if header is None:
+                raise LedgerImportError(f"{path}: file is empty")
+            columns = self.columns(header)
+            row_number = 2
+            while True:
+                chunk = []
+                for row in source.rows:
+                    chunk.append(row)
+                    if len(chunk) >= self.chunk_rows:
+                        break
+                if not chunk:
+                    break
+                self.validate_chunk(chunk, columns, row_number, totals, result)
+                row_number += len(chunk)
+                if self.progress:
+                    self.progress(ImportProgress(result.rows, result.errors, source.position(),
+                                                 source.total_bytes, time.perf_counter() - start))
+        finally:
+            source.close()
+        result.seconds = time.perf_counter() - start
+        return totals, result
+
+    # -- writing ---------------------------------------------------------
+
+    def import_into(self, model, path, **open_args) -> ImportResult:
+        """
+        Import a file into a model with a single batched write.
+
+        Existing entries of the same month, category, direction and type
+        are increased by the imported total (or replaced with replace=True).
+
+        :param model: FinModel to import into
+        :param path: .csv/.tsv/.txt or .xlsx file
+        :param open_args: sheet, encoding, delimiter (see open())
+        :raises LedgerImportError: for unreadable files, missing columns, or
+            more than max_errors invalid rows (the model is then unchanged)
+        """
+        start = time.perf_counter()
+        totals, result = self.read_totals(path, **open_args)
+        with model.lock, model.batch():
+            for (month, category, direction, entry_type), amount in totals.items():
+                if not self.replace:
+                    md = model.months.get(month)
+                    existing = md.get(category, direction, entry_type) if md else None
+                    if existing is not None:
+                        amount += existing.amount
+                model.upsert_entry(Entry(date=month, category=category, direction=direction,
+                                         amount=amount, type=entry_type))
+        result.entries_written = len(totals)
+        result.months = sorted({key[0] for key in totals})
+        result.seconds = time.perf_counter() - start
+        return result
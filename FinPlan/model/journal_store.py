@@ -0,0 +1,182 @@
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from .data_store import DataStore
+from .monthly_data import MonthlyData
+from .entry import Entry
+
+
+class JournalDataStore(DataStore):
+    """
+    Append-only storage backend: a JSON snapshot plus a journal of changes.
+
+    Every model mutation is appended as one JSON line to a journal file next
+    to data.json, so a save costs O(change) instead of O(workbook). Loading
+    reads the snapshot and replays the journal on top of it. When the
+    journal grows past COMPACT_BYTES it is folded into a new snapshot.
+
+    Journal record format (one per line):
+      {"seq": int, "op": "meta", "period_start": "YYYY-MM-DD" | null, "window_offset": int}
+      {"seq": int, "op": "add" | "upsert", "entry": entry_dict}
+      {"seq": int, "op": "month", "month": "YYYY-MM", "entries": [entry_dict, ...]}
+      {"seq": int, "op": "actualize", "month": "YYYY-MM"}
+      {"seq": int, "op": "rules", "rules": [rule_dict, ...]}
+
+    The snapshot stores the sequence number of the last record it contains
+    in meta["journal_seq"]; older records are skipped on replay, which makes
+    a crash between writing the snapshot and truncating the journal safe.
+    """
+    COMPACT_BYTES = 1024 * 1024  # journal size that triggers compaction
+
+    def __init__(self, path=None):
+        """
+        :param path: snapshot file to use instead of the default FILE
+        """
+        super().__init__(path)
+        self._seq = 0        # sequence number of the last persisted record
+        self._torn = False   # journal ended with an unreadable record
+
+    @property
+    def journal_file(self) -> Path:
+        """Path of the journal file stored next to the snapshot."""
+        return self.FILE.with_suffix(".journal")
+
+    def load(self):
+        """
+        Load the snapshot and replay journal records written after it.
+
+        :returns: tuple(period_start, window_offset, months)
+        """
+        return self._replay_journal(*super().load())
+
+    def load_months(self):
+        """
+        Load like load(), but keep the snapshot months lazy: replayed
+        records only materialize the months they touch.
+
+        :returns: tuple(period_start, window_offset, months: LazyMonths)
+        """
+        return self._replay_journal(*super().load_months())
+
+    def _replay_journal(self, period_start, window_offset, months):
+        """
+        Replay the journal records newer than the loaded snapshot.
+
+        :param months: months of the snapshot (dict or LazyMonths), updated in place
+        :returns: tuple(period_start, window_offset, months)
+        """
+        self._seq = int(self.meta.get("journal_seq", 0))
+        self._torn = False
+
+        for record in self._read_journal():
+            if record["seq"] <= self._seq:
+                continue  # already folded into the snapshot
+            if record["op"] == "rules":
+                self.meta = {**self.meta, "rules": record["rules"]}
+            period_start, window_offset = self._replay(
+                record, period_start, window_offset, months
+            )
+            self._seq = record["seq"]
+
+        if self._torn:
+            # Fold the readable records into a snapshot so later appends
+            # do not land behind the damaged line
+            self.save(period_start, window_offset, months, self.load_rules())
+
+        return period_start, window_offset, months
+
+    def write_snapshot(self, period_start: date, window_offset: int,
+                       months: dict[date, MonthlyData], extra_meta: dict):
+        """
+        Write a full snapshot and start a fresh journal (compaction).
+
+        save() and compaction go through here.
+
+        :param extra_meta: additional meta keys to store (e.g. rules)
+        """
+        self._write_snapshot(period_start, window_offset, months,
+                             {**extra_meta, "journal_seq": self._seq})
+        self._write_atomic(self.journal_file, "")
+
+    def commit(self, period_start: date, window_offset: int,
+               months: dict[date, MonthlyData], changes: Optional[list],
+               rules: Optional[list] = None):
+        """
+        Append change records to the journal, compacting when it grows large.
+
+        :param changes: change records from the model, or None to force a
+            full snapshot
+        :param rules: recurring rules as to_dict() mappings (journaled
+            through "rules" records; written on compaction)
+        """
+        if changes is None:
+            self.save(period_start, window_offset, months, rules)
+            return
+
+        lines = []
+        for record in changes:
+            self._seq += 1
+            lines.append(json.dumps({"seq": self._seq, **record}))
+
+        if lines:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        if self.journal_file.exists() and self.journal_file.stat().st_size >= self.COMPACT_BYTES:
+            self.save(period_start, window_offset, months, rules)
+
+    def _read_journal(self):
+        """
+        Yield decoded journal records in order.
+
+        A torn final line (crash during append) stops the replay and is
+        reported through self._torn.
+        """
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    self._torn = True  # incomplete trailing record
+                    break
+
+    @staticmethod
+    def _replay(record: dict, period_start, window_offset, months):
+        """
+        Apply a single journal record to the loaded state.
+
+        :returns: updated (period_start, window_offset)
+        """
+        op = record["op"]
+        if op == "meta":
+            ps = record.get("period_start")
+            period_start = date.fromisoformat(ps) if ps else None
+            window_offset = int(record.get("window_offset", 0))
+        elif op in ("add", "upsert"):
+            entry = Entry.from_dict(record["entry"])
+            md = months.setdefault(entry.date, MonthlyData(entry.date))
+            if op == "add":
+                md.add_entry(entry)
+            else:
+                md.upsert(entry)
+        elif op == "month":
+            m_date = date.fromisoformat(f"{record['month']}-01")
+            months[m_date] = MonthlyData(
+                m_date, [Entry.from_dict(e) for e in record["entries"]]
+            )
+        elif op == "actualize":
+            md = months.get(date.fromisoformat(f"{record['month']}-01"))
+            if md:
+                md.actualize()
+        return period_start, window_offset
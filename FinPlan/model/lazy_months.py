@@ -0,0 +1,129 @@
+"""
+Month mapping that loads MonthlyData on first access.
+
+Stores build a LazyMonths from a month source: an index of every stored
+month with its rolled-up aggregates (a ledger.MonthSummary), plus a way to
+materialize a single month's entries. FinModel only touches the months it
+reads or edits; balances, chart history and overviews run on summaries().
+"""
+from collections.abc import MutableMapping
+from datetime import date
+from typing import Optional
+
+from .monthly_data import MonthlyData
+
+
+class MonthSource:
+    """
+    Interface of the objects LazyMonths reads unloaded months from.
+
+    Implementations live next to their store (DataStore, BinaryDataStore).
+    """
+
+    def summaries(self) -> dict:
+        """Return {month: MonthSummary} for every stored month, in stored order."""
+        raise NotImplementedError
+
+    def load(self, month: date) -> MonthlyData:
+        """Materialize one stored month."""
+        raise NotImplementedError
+
+    def records(self, month: date) -> list[dict]:
+        """Return one stored month's entries as to_dict() mappings."""
+        return [e.to_dict() for e in self.load(month).entries]
+
+
+class LazyMonths(MutableMapping):
+    """
+    Mapping of month start date to MonthlyData with on-demand loading.
+
+    Keys cover every stored month from the start. Reading a month (get,
+    [], setdefault, items, values) loads it once from the source; writes
+    and deletes only affect memory, as with a dict.
+
+    Attributes:
+      source: MonthSource for months not loaded yet (None if all loaded)
+    """
+
+    def __init__(self, loaded: Optional[dict] = None, source: Optional[MonthSource] = None):
+        """
+        :param loaded: months already materialized
+        :param source: source of the remaining stored months
+        """
+        self._loaded = dict(loaded or {})                     # month -> MonthlyData
+        self._pending = source.summaries() if source else {}  # month -> MonthSummary
+        for month in self._loaded:
+            self._pending.pop(month, None)
+        self._order = dict.fromkeys([*self._pending, *self._loaded])  # stored order
+        self.source = source
+
+    def __getitem__(self, month: date) -> MonthlyData:
+        md = self._loaded.get(month)
+        if md is not None:
+            return md
+        if month not in self._pending:
+            raise KeyError(month)
+        md = self._loaded[month] = self.source.load(month)
+        del self._pending[month]
+        return md
+
+    def __setitem__(self, month: date, md: MonthlyData):
+        self._pending.pop(month, None)
+        self._loaded[month] = md
+        self._order[month] = None
+
+    def __delitem__(self, month: date):
+        if month in self._loaded:
+            del self._loaded[month]
+        else:
+            del self._pending[month]
+        del self._order[month]
+
+    def __contains__(self, month) -> bool:
+        return month in self._order
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def clear(self):
+        """Forget every month without loading any."""
+        self._loaded.clear()
+        self._pending.clear()
+        self._order.clear()
+
+    def is_loaded(self, month: date) -> bool:
+        """Return True if a month is materialized in memory."""
+        return month in self._loaded
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of months materialized so far."""
+        return len(self._loaded)
+
+    def summary(self, month: date):
+        """Return a month's aggregates without loading its entries."""
+        md = self._loaded.get(month)
+        return md if md is not None else self._pending[month]
+
+    def summaries(self) -> dict:
+        """
+        Return {month: aggregates} for all months without loading any.
+
+        Loaded months appear as their MonthlyData, so in-place edits are
+        reflected; unloaded ones as MonthSummary. The result works with
+        every function in metrics.py and with BalanceIndex.
+        """
+        loaded, pending = self._loaded, self._pending
+        return {m: loaded[m] if m in loaded else pending[m] for m in self._order}
+
+    def records(self, month: date) -> list[dict]:
+        """Return a month's entries as to_dict() mappings, without loading it."""
+        md = self._loaded.get(month)
+        if md is not None:
+            return [e.to_dict() for e in md.entries]
+        if month not in self._pending:
+            raise KeyError(month)
+        return self.source.records(month)
@@ -0,0 +1,317 @@
+"""
+Columnar ledger: all entries of a workbook stored as parallel NumPy arrays.
+
+Columns (one row per entry):
+  month:    int32 month ordinal (year * 12 + month - 1)
+  category: int16 index into CATEGORIES
+  flags:    uint8 bit set of INCOME and ACTUAL
+  cents:    int64 fixed-point amount in cents
+
+Compared to lists of Entry objects this needs 15 bytes per row and allows
+vectorized group-by sums over millions of entries. Amounts are rounded to
+whole cents (ROUND_HALF_EVEN) when converted from Decimal.
+"""
+from datetime import date
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from .category import Category
+from .entry import Entry
+from .monthly_data import MonthlyData
+
+CATEGORIES = list(Category)                        # code -> Category
+CATEGORY_CODES = {c: i for i, c in enumerate(CATEGORIES)}
+
+INCOME = 1   # flag bit: entry direction is "income" (else "expense")
+ACTUAL = 2   # flag bit: entry type is "actual" (else "forecast")
+
+CENT = Decimal("0.01")
+
+
+def month_ordinal(d: date) -> int:
+    """Return the integer month ordinal of a date."""
+    return d.year * 12 + d.month - 1
+
+
+def ordinal_month(ordinal: int) -> date:
+    """Return the first day of the month for a month ordinal."""
+    return date(int(ordinal) // 12, int(ordinal) % 12 + 1, 1)
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a Decimal amount to integer cents."""
+    return int(amount.quantize(CENT, rounding=ROUND_HALF_EVEN).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a Decimal amount."""
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def entry_flags(direction: str, type: str) -> int:
+    """Return the flag bits for an entry direction and type."""
+    return (INCOME if direction == "income" else 0) | (ACTUAL if type == "actual" else 0)
+
+
+class MonthSummary:
+    """
+    Per-month aggregates derived from a Ledger.
+
+    Exposes the same aggregate API as MonthlyData (total, count,
+    total_income, total_expenses, net_cash_flow, has_actuals), so the
+    functions in metrics.py run on it unchanged.
+    """
+    __slots__ = ("month", "_totals", "_counts")
+
+    def __init__(self, month: date, totals: dict, counts: dict):
+        """
+        :param month: start date of the month
+        :param totals: (direction, type) -> Decimal total
+        :param counts: (direction, type) -> number of entries
+        """
+        self.month = month
+        self._totals = totals
+        self._counts = counts
+
+    def total(self, direction: str, type: Optional[str] = None) -> Decimal:
+        """Return the total for a direction, optionally for one type."""
+        types = ("actual", "forecast") if type is None else (type,)
+        return sum((self._totals.get((direction, t), 0) for t in types), 0)
+
+    def count(self, direction: str, type: Optional[str] = None) -> int:
+        """Return the number of entries for a direction, optionally for one type."""
+        types = ("actual", "forecast") if type is None else (type,)
+        return sum(self._counts.get((direction, t), 0) for t in types)
+
+    @property
+    def has_actuals(self) -> bool:
+        """Return True if this month holds at least one 'actual' entry."""
+        return bool(self.count("income", "actual") or self.count("expense", "actual"))
+
+    @property
+    def total_income(self) -> Decimal:
+        """Return sum of all income amounts for this month."""
+        return self.total("income")
+
+    @property
+    def total_expenses(self) -> Decimal:
+        """Return sum of all expense amounts for this month."""
+        return self.total("expense")
+
+    @property
+    def net_cash_flow(self) -> Decimal:
+        """Return net cash flow (income minus expenses) for this month."""
+        return self.total_income - self.total_expenses
+
+
+class MonthTotals:
+    """
+    Vectorized per-month totals of a Ledger or of a months mapping.
+
+    Attributes (all arrays aligned with `months`, amounts in cents):
+      months: sorted unique month ordinals
+      income_actual, income_forecast, expense_actual, expense_forecast:
+        int64 sums per month
+      counts: int64 array of shape (len(months), 4) with entry counts per
+        flag combination (index = flags)
+    """
+    def __init__(self, months, sums, counts):
+        self.months = months
+        self.expense_forecast = sums[:, 0]
+        self.income_forecast = sums[:, INCOME]
+        self.expense_actual = sums[:, ACTUAL]
+        self.income_actual = sums[:, INCOME | ACTUAL]
+        self.counts = counts
+
+    @classmethod
+    def from_months(cls, months) -> "MonthTotals":
+        """
+        Build totals from month aggregates without touching individual entries.
+
+        :param months: mapping of month start date to MonthlyData (or any
+            object exposing total(direction, type) and count(direction, type))
+        """
+        ordered = sorted(months)
+        sums = np.zeros((len(ordered), 4), dtype=np.int64)
+        counts = np.zeros((len(ordered), 4), dtype=np.int64)
+        for i, m in enumerate(ordered):
+            md = months[m]
+            for direction in ("income", "expense"):
+                for type in ("actual", "forecast"):
+                    slot = entry_flags(direction, type)
+                    counts[i, slot] = md.count(direction, type)
+                    if counts[i, slot]:
+                        sums[i, slot] = to_cents(md.total(direction, type))
+        ordinals = np.array([month_ordinal(m) for m in ordered], dtype=np.int32)
+        return cls(ordinals, sums, counts)
+
+    @property
+    def income(self):
+        """Total income per month in cents."""
+        return self.income_actual + self.income_forecast
+
+    @property
+    def expenses(self):
+        """Total expenses per month in cents."""
+        return self.expense_actual + self.expense_forecast
+
+    @property
+    def net(self):
+        """Net cash flow per month in cents."""
+        return self.income - self.expenses
+
+    @property
+    def has_actuals(self):
+        """Boolean array: month holds at least one actual entry."""
+        return (self.counts[:, ACTUAL] + self.counts[:, INCOME | ACTUAL]) > 0
+
+
+class Ledger:
+    """
+    Columnar store of financial entries backed by NumPy arrays.
+
+    Build one with from_entries() or from_months(); aggregate with
+    group_sum() or month_totals(); get Entry objects back with entries()
+    or to_months() where object-based code still needs them.
+    """
+    def __init__(self, month=None, category=None, flags=None, cents=None):
+        """
+        :param month: int32 array of month ordinals
+        :param category: int16 array of category codes
+        :param flags: uint8 array of INCOME/ACTUAL bits
+        :param cents: int64 array of amounts in cents
+        """
+        self.month = np.asarray(month if month is not None else [], dtype=np.int32)
+        self.category = np.asarray(category if category is not None else [], dtype=np.int16)
+        self.flags = np.asarray(flags if flags is not None else [], dtype=np.uint8)
+        self.cents = np.asarray(cents if cents is not None else [], dtype=np.int64)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Entry]) -> "Ledger":
+        """
+        Build a ledger from Entry objects in a single pass.
+
+        :param entries: any iterable of Entry (may be a generator)
+        """
+        month, category, flags, cents = [], [], [], []
+        for e in entries:
+            month.append(month_ordinal(e.date))
+            category.append(CATEGORY_CODES[e.category])
+            flags.append(entry_flags(e.direction, e.type))
+            cents.append(to_cents(e.amount))
+        return cls(month, category, flags, cents)
+
+    @classmethod
+    def from_months(cls, months: dict[date, MonthlyData]) -> "Ledger":
+        """Build a ledger from a mapping of month start date to MonthlyData."""
+        return cls.from_entries(e for md in months.values() for e in md.entries)
+
+    @classmethod
+    def concat(cls, ledgers: Iterable["Ledger"]) -> "Ledger":
+        """Concatenate several ledgers into one."""
+        ledgers = list(ledgers)
+        if not ledgers:
+            return cls()
+        return cls(
+            np.concatenate([l.month for l in ledgers]),
+            np.concatenate([l.category for l in ledgers]),
+            np.concatenate([l.flags for l in ledgers]),
+            np.concatenate([l.cents for l in ledgers]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.cents)
+
+    def entry(self, i: int) -> Entry:
+        """Materialize row i as an Entry object."""
+        f = int(self.flags[i])
+        return Entry(
+            date=ordinal_month(self.month[i]),
+            category=CATEGORIES[self.category[i]],
+            direction="income" if f & INCOME else "expense",
+            amount=from_cents(self.cents[i]),
+            type="actual" if f & ACTUAL else "forecast",
+        )
+
+    def entries(self, month: Optional[date] = None) -> Iterator[Entry]:
+        """
+        Yield Entry views of all rows, or of one month's rows.
+
+        :param month: optional month start date to filter on
+        """
+        if month is None:
+            rows = range(len(self))
+        else:
+            rows = np.flatnonzero(self.month == month_ordinal(month))
+        for i in rows:
+            yield self.entry(i)
+
+    def to_months(self) -> dict[date, MonthlyData]:
+        """Materialize the ledger as a mapping of month to MonthlyData."""
+        months: dict[date, MonthlyData] = {}
+        for e in self.entries():
+            months.setdefault(e.date, MonthlyData(e.date)).add_entry(e)
+        return months
+
+    def group_sum(self, by: tuple = ("month",), mask=None):
+        """
+        Sum amounts grouped by one or more columns.
+
+        :param by: column names from ("month", "category", "flags")
+        :param mask: optional boolean row filter
+        :return: (keys, sums) where keys is a tuple of unique key arrays
+            (one per column in `by`) and sums the int64 cents per group
+        """
+        cols = [getattr(self, name) for name in by]
+        cents = self.cents
+        if mask is not None:
+            cols = [c[mask] for c in cols]
+            cents = cents[mask]
+        if not len(cents):
+            return tuple(c[:0] for c in cols), cents[:0]
+
+        stacked = np.stack([c.astype(np.int64) for c in cols])
+        keys, inverse = np.unique(stacked, axis=1, return_inverse=True)
+        sums = np.zeros(keys.shape[1], dtype=np.int64)
+        np.add.at(sums, inverse.ravel(), cents)
+        return tuple(keys), sums
+
+    def month_totals(self) -> MonthTotals:
+        """Return income/expense totals per month and flag combination."""
+        months, inverse = np.unique(self.month, return_inverse=True)
+        slot = inverse.ravel() * 4 + self.flags
+        size = len(months) * 4
+        sums = np.zeros(size, dtype=np.int64)
+        np.add.at(sums, slot, self.cents)
+        counts = np.bincount(slot, minlength=size)
+        return MonthTotals(months, sums.reshape(-1, 4), counts.reshape(-1, 4))
+
+    def month_summaries(self) -> dict[date, MonthSummary]:
+        """
+        Return per-month aggregates keyed by month start date.
+
+        The result can be passed to the functions in metrics.py in place of
+        FinModel.months.
+        """
+        mt = self.month_totals()
+        buckets = {
+            ("expense", "forecast"): mt.expense_forecast,
+            ("income", "forecast"): mt.income_forecast,
+            ("expense", "actual"): mt.expense_actual,
+            ("income", "actual"): mt.income_actual,
+        }
+        slots = {key: entry_flags(*key) for key in buckets}
+
+        summaries = {}
+        for i, ordinal in enumerate(mt.months):
+            totals, counts = {}, {}
+            for key, sums in buckets.items():
+                n = int(mt.counts[i, slots[key]])
+                if n:
+                    totals[key] = from_cents(sums[i])
+                    counts[key] = n
+            m = ordinal_month(ordinal)
+            summaries[m] = MonthSummary(m, totals, counts)
+        return summaries
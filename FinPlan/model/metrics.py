@@ -0,0 +1,150 @@
+"""
+Forecast metrics computed from per-month aggregates.
+
+Every function accepts a mapping of month start date to an object exposing
+the MonthlyData aggregate API (total_income, total_expenses, net_cash_flow,
+has_actuals, count). That is either FinModel.months or the MonthSummary
+objects produced by a columnar Ledger, so the same code serves the UI and
+bulk analytics.
+"""
+from datetime import date
+from decimal import Decimal
+
+from .scenario import Scenario
+from .balance_index import BalanceIndex
+
+
+def overview(months) -> list[tuple[date, Decimal]]:
+    """
+    Return a list of tuples (month, net_cash_flow) for all months.
+
+    :param months: mapping of month start date to aggregates
+    """
+    return [
+        (m, md.net_cash_flow)
+        for m, md in sorted(months.items())
+    ]
+
+
+def window_months(months, active_months: list[date], index: BalanceIndex):
+    """
+    Yield (month, aggregates) for the months of a forecast window.
+
+    Stored months are returned as they are. Months after the last stored
+    month are forecast lazily: they reuse the aggregates of the last stored
+    month (run-rate carry-forward) without creating any entries. Empty
+    months before the last stored month are skipped.
+
+    :param months: mapping of month start date to aggregates
+    :param active_months: months of the forecast window
+    :param index: BalanceIndex of months (provides last_month)
+    """
+    last = index.last_month
+    for m in active_months:
+        md = months.get(m)
+        if md is None and last is not None and m > last:
+            md = months[last]
+        if md:
+            yield m, md
+
+
+def forecast_metrics(months, active_months: list[date], scenario: Scenario,
+                     index: BalanceIndex = None, count: int = None, offset: int = 0):
+    """
+    Compute forecast metrics (net cash flow, closing balance, runway)
+    for each active month based on a scenario.
+
+    Balances and the weighted burn always cover the whole window; count and
+    offset only select which columns are returned, so long horizons can be
+    paged through.
+
+    :param months: mapping of month start date to aggregates
+    :param active_months: months of the forecast window
+    :param scenario: Scenario whose factors are applied
+    :param index: BalanceIndex of months; built on the fly if omitted
+    :param count: number of columns to return (None for all)
+    :param offset: index of the first column to return
+    :return: (headers, net_row, close_row, runway_row)
+    """
+    if index is None:
+        index = BalanceIndex(months)
+
+    forecast_months = []  # (month, net, expenses) after scenario factors
+    for m, md in window_months(months, active_months, index):
+        income, expenses = scenario.project(md)
+        forecast_months.append((m, income - expenses, expenses))
+
+    if not forecast_months:
+        return [], [], [], []
+
+    # Actual months before the forecast window, from the prefix sums
+    initial_balance, total_exp_actual, actual_count = index.opening(forecast_months[0][0])
+
+    # Weighted burn rate: 2x for actual, 1x for forecast
+    weight_actual = 2
+    weight_forecast = 1
+    total_weight = actual_count*weight_actual + len(forecast_months)*weight_forecast
+
+    if total_weight:
+        total_exp_forecast = sum(exp for _, _, exp in forecast_months)
+        weighted_burn = (total_exp_actual*weight_actual + total_exp_forecast*weight_forecast) / total_weight
+    else:
+        weighted_burn = Decimal("1")
+
+    end = len(forecast_months) if count is None else offset + count
+    headers = [m.strftime("%b %Y") for m, _, _ in forecast_months[offset:end]]
+    net_row, close_row, runway_row = [], [], []
+
+    balance = initial_balance
+    for i, (_, net, _) in enumerate(forecast_months[:end]):
+        balance += net
+        if i < offset:
+            continue  # earlier page: only carry the balance forward
+        runway = (balance / weighted_burn) if weighted_burn else Decimal("0")
+        net_row.append(str(net))
+        close_row.append(str(balance))
+        runway_row.append(str(round(runway, 2)))
+
+    return headers, net_row, close_row, runway_row
+
+
+def chart_data(months, active_months: list[date], scenario: Scenario,
+               forecast=None, index: BalanceIndex = None,
+               count: int = None, offset: int = 0):
+    """
+    Prepare data tuples for charting actual vs forecast flows and runways.
+
+    :param months: mapping of month start date to aggregates
+    :param active_months: months of the forecast window
+    :param scenario: Scenario whose factors are applied
+    :param forecast: precomputed forecast_metrics() result to reuse
+    :param index: BalanceIndex of months; built on the fly if omitted
+    :param count: number of forecast points to include (None for all)
+    :param offset: index of the first forecast point to include
+    :return: (net_flows, runways) lists of (type, label, value)
+    """
+    net_flows, runways = [], []
+
+    if index is None:
+        index = BalanceIndex(months)
+    if forecast is None:
+        forecast = forecast_metrics(months, active_months, scenario, index, count, offset)
+    hdrs, net_vals, _, runway_vals = forecast
+    if not hdrs:
+        return [], []
+
+    # Plot actual data first; balances come from the prefix sums
+    for m, net, balance, exp in zip(index.months, index.nets, index.cum_net, index.expenses):
+        burn = (exp / 3) if exp else Decimal("1")
+        run = (balance / burn) if burn else Decimal("0")
+        net_flows.append(("actual", m.strftime("%b %Y"), float(net)))
+        runways.append(("actual", m.strftime("%b %Y"), float(run)))
+
+    # Then forecast values
+    for lbl, net_str, rw_str in zip(hdrs, net_vals, runway_vals):
+        nf = Decimal(net_str)
+        rw = Decimal(rw_str)
+        net_flows.append(("forecast", lbl, float(nf)))
+        runways.append(("forecast", lbl, float(rw)))
+
+    return net_flows, runways
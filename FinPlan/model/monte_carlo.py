@@ -0,0 +1,277 @@
+"""
+Monte Carlo simulation of the forecast window.
+
+Instead of one deterministic multiplier per direction, every category gets
+a distribution (see STOCHASTIC_GROUPS and STOCHASTIC_CATEGORIES): in each
+month its amount materializes with a given probability and is scaled by
+lognormal noise with mean 1. Thousands of paths are drawn per batch with
+NumPy. Large runs spread their batches over a process pool that is
+created once and shared by all engines; small runs stay in-process, where
+starting workers would cost more than the batches themselves.
+
+Actual entries are already realized and are kept as they are, while
+forecast_metrics scales them by the scenario factors too. For a scenario
+other than baseline the P50 path therefore differs from the deterministic
+forecast whenever the window holds actuals, even with zero spread.
+
+Amounts are simulated as float cents; results are reported as percentiles
+of the closing balance per month and as the distribution of the runway at
+the end of the window (same weighted-burn definition as forecast_metrics).
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+from .balance_index import BalanceIndex
+from .constants import (
+    DEFAULT_INCOME_GUARANTEED_CATEGORIES,
+    DEFAULT_INCOME_EXPECTED_CATEGORIES,
+    STOCHASTIC_GROUPS,
+    STOCHASTIC_CATEGORIES,
+)
+from .ledger import CATEGORIES, CATEGORY_CODES, to_cents
+from .metrics import window_months
+
+PERCENTILES = (10, 50, 90)
+REALIZED = len(CATEGORIES)  # extra amount column for actual entries (no variation)
+PARALLEL_PATHS = 20000      # runs with fewer paths are simulated in-process
+
+_pool = None                # shared worker pool, see _executor
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool, (re)creating it with at least `workers` processes."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers < workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def category_group(category) -> str:
+    """Return the stochastic group ("guaranteed", "expected" or "expense") of a category."""
+    if category.value in DEFAULT_INCOME_GUARANTEED_CATEGORIES:
+        return "guaranteed"
+    if category.value in DEFAULT_INCOME_EXPECTED_CATEGORIES:
+        return "expected"
+    return "expense"
+
+
+def category_distributions(overrides: Optional[dict] = None):
+    """
+    Build per-category probability and spread arrays aligned with CATEGORIES.
+
+    The arrays have one extra trailing slot (REALIZED) for actual amounts,
+    which always materialize unchanged.
+
+    :param overrides: optional {category name: {"probability", "spread"}}
+        applied on top of STOCHASTIC_CATEGORIES
+    :return: (probability, spread) float64 arrays
+    """
+    settings = {**STOCHASTIC_CATEGORIES, **(overrides or {})}
+    probability = np.ones(REALIZED + 1)
+    spread = np.zeros(REALIZED + 1)
+    for code, category in enumerate(CATEGORIES):
+        dist = {**STOCHASTIC_GROUPS[category_group(category)],
+                **settings.get(category.value, {})}
+        probability[code] = dist["probability"]
+        spread[code] = dist["spread"]
+    return probability, spread
+
+
+def window_amounts(months, active_months: list[date], index: BalanceIndex,
+                   factors: Optional[dict] = None):
+    """
+    Collect per-category amounts of the forecast window in cents.
+
+    Months after the last stored month carry the last stored month forward,
+    as in metrics.window_months. Actual entries are summed into the REALIZED
+    column instead of their category; scenario factors do not apply to them.
+
+    :param months: mapping of month start date to MonthlyData
+    :param active_months: months of the forecast window
+    :param index: BalanceIndex of months
+    :param factors: optional scenario factors applied to the mean amounts
+    :return: (dates, income, expenses) with float64 arrays of shape
+        (len(dates), len(CATEGORIES) + 1)
+    """
+    window = list(window_months(months, active_months, index))
+    income = np.zeros((len(window), REALIZED + 1))
+    expenses = np.zeros((len(window), REALIZED + 1))
+    for row, (_, md) in enumerate(window):
+        for e in md.entries:
+            target = income if e.direction == "income" else expenses
+            column = REALIZED if e.type == "actual" else CATEGORY_CODES[e.category]
+            target[row, column] += to_cents(e.amount)
+    if factors is not None:
+        income[:, :REALIZED] *= float(factors["income"])
+        expenses[:, :REALIZED] *= float(factors["expenses"])
+    return [m for m, _ in window], income, expenses
+
+
+def _draw(rng, shape, probability: float, spread: float):
+    """Return multiplicative factors: Bernoulli(probability) x lognormal(mean 1)."""
+    if spread:
+        factor = rng.lognormal(-spread * spread / 2, spread, shape)
+    else:
+        factor = np.ones(shape)
+    if probability < 1:
+        factor *= rng.random(shape) < probability
+    return factor
+
+
+def _simulate_batch(task):
+    """
+    Simulate one batch of paths (runs in a worker process).
+
+    :param task: tuple (income, expenses, probability, spread, opening,
+        paths, seed) as built by MonteCarloEngine.simulate
+    :return: (closing, runway) with closing balances of shape
+        (paths, months) and runway months of shape (paths,)
+    """
+    income, expenses, probability, spread, opening, paths, seed = task
+    balance, actual_expenses, actual_count = opening
+    rng = np.random.default_rng(seed)
+    shape = (paths, income.shape[0])
+
+    inc = np.zeros(shape)
+    exp = np.zeros(shape)
+    for base, total in ((income, inc), (expenses, exp)):
+        for c in np.flatnonzero(base.any(axis=0)):
+            if probability[c] >= 1 and not spread[c]:
+                total += base[:, c]  # certain amount, no draws needed
+            else:
+                total += base[:, c] * _draw(rng, shape, probability[c], spread[c])
+
+    closing = balance + np.cumsum(inc - exp, axis=1)
+
+    # Weighted burn rate: 2x for actual, 1x for forecast (see forecast_metrics)
+    burn = (actual_expenses * 2 + exp.sum(axis=1)) / (actual_count * 2 + shape[1])
+    runway = np.divide(closing[:, -1], burn, out=np.zeros(paths), where=burn != 0)
+    return closing, runway
+
+
+class SimulationResult:
+    """
+    Outcome of a Monte Carlo run.
+
+    Attributes:
+      months: dates of the simulated window months
+      closing: float64 array (paths, months) of closing balances
+      runway: float64 array (paths,) of runway months at the window end
+    """
+
+    def __init__(self, months: list[date], closing, runway):
+        self.months = months
+        self.closing = closing
+        self.runway = runway
+
+    @property
+    def paths(self) -> int:
+        """Number of simulated paths."""
+        return len(self.runway)
+
+    def closing_percentiles(self, q=PERCENTILES) -> dict:
+        """
+        Return closing balance percentiles per month.
+
+        :param q: percentiles to compute (default P10/P50/P90)
+        :return: {percentile: float64 array aligned with months}
+        """
+        values = np.percentile(self.closing, q, axis=0)
+        return dict(zip(q, values))
+
+    def runway_percentiles(self, q=PERCENTILES) -> dict:
+        """Return {percentile: runway months} over all paths."""
+        return dict(zip(q, np.percentile(self.runway, q)))
+
+    def runway_histogram(self, bins: int = 20):
+        """
+        Return the distribution of runway months.
+
+        :param bins: number of histogram bins
+        :return: (counts, edges) as from numpy.histogram
+        """
+        return np.histogram(self.runway, bins=bins)
+
+    def insolvency(self):
+        """Return the share of paths with a negative closing balance per month."""
+        return (self.closing < 0).mean(axis=0)
+
+
+class MonteCarloEngine:
+    """
+    Runs stochastic forecasts of a window in parallel batches.
+
+    Each batch of BATCH_PATHS paths gets its own child seed, so for a given
+    seed the result does not depend on the number of workers.
+
+    Attributes:
+      paths: number of simulated paths
+      seed: base seed (None for a fresh random run)
+      workers: worker processes (None: one per core, 1: run in-process);
+        runs below PARALLEL_PATHS paths always run in-process
+      probability, spread: per-category distribution arrays
+    """
+    BATCH_PATHS = 2000  # paths simulated per task
+
+    def __init__(self, paths: int = 10000, seed: Optional[int] = None,
+                 workers: Optional[int] = None, distributions: Optional[dict] = None):
+        """
+        :param paths: number of paths to simulate
+        :param seed: optional seed for reproducible runs
+        :param workers: number of worker processes
+        :param distributions: per-category overrides, see category_distributions
+        :raises ValueError: if paths is not positive
+        """
+        if paths < 1:
+            raise ValueError("At least one path is required")
+        self.paths = paths
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.probability, self.spread = category_distributions(distributions)
+
+    def simulate(self, months: list[date], income, expenses,
+                 opening=(0, 0, 0)) -> SimulationResult:
+        """
+        Simulate closing balances and runway for a window.
+
+        :param months: window month dates
+        :param income: mean income in cents per month and category, as
+            returned by window_amounts
+        :param expenses: mean expenses in cents, shaped like income
+        :param opening: (net, expenses, count) of actual months before the
+            window, as returned by BalanceIndex.opening
+        :return: SimulationResult with amounts in currency units
+        """
+        if not months:
+            return SimulationResult([], np.zeros((self.paths, 0)), np.zeros(self.paths))
+
+        net, actual_expenses, actual_count = opening
+        opening = (float(net) * 100, float(actual_expenses) * 100, actual_count)
+        sizes = [self.BATCH_PATHS] * (self.paths // self.BATCH_PATHS)
+        if self.paths % self.BATCH_PATHS:
+            sizes.append(self.paths % self.BATCH_PATHS)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        tasks = [
+            (income, expenses, self.probability, self.spread, opening, size, seed)
+            for size, seed in zip(sizes, seeds)
+        ]
+
+        if self.workers == 1 or len(tasks) == 1 or self.paths < PARALLEL_PATHS:
+            results = [_simulate_batch(task) for task in tasks]
+        else:
+            results = list(_executor(self.workers).map(_simulate_batch, tasks))
+
+        closing = np.concatenate([c for c, _ in results]) / 100
+        runway = np.concatenate([r for _, r in results])
+        return SimulationResult(months, closing, runway)
@@ -1,7 +1,10 @@
+from collections import Counter
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 from .entry import Entry
+from .category import Category
 
 class MonthlyData:
     """
@@ -10,7 +13,17 @@ class MonthlyData:
     Attributes:
       month: start date of the month (first day)
       entries: list of Entry objects for this month
+
+    Entries are indexed by (date, category, direction, type), so lookups,
+    upserts and removals by key are O(1). Running totals per (direction, type)
+    are updated on every change, so the summary properties are O(1) as well.
+    Modify entries through the methods below rather than the list itself to
+    keep the index and totals in sync.
+
+    Set DEBUG_TOTALS to True to verify every total against a full rescan.
     """
+    DEBUG_TOTALS = False  # compare running totals with a rescan on access
+
     def __init__(self, month: date, entries: List[Entry] = None):
         """
         Initialize MonthlyData for a given month.
@@ -20,6 +33,52 @@ class MonthlyData:
         """
         self.month = month                       # month start date
         self.entries = entries or []             # list of entries
+        self._reindex()
+
+    @staticmethod
+    def key(entry: Entry) -> tuple:
+        """Return the index key (date, category, direction, type) of an entry."""
+        return (entry.date, entry.category, entry.direction, entry.type)
+
+    def _reindex(self):
+        """Rebuild the key index and running totals from the entries list."""
+        self._index = {}                         # key -> position in entries
+        self._totals = {}                        # (direction, type) -> sum
+        self._exponents = {}                     # (direction, type) -> Counter
+        self._counts = Counter()                 # (direction, type) -> entries
+        for pos, entry in enumerate(self.entries):
+            self._index.setdefault(self.key(entry), pos)
+            self._add_totals(entry)
+
+    def _add_totals(self, entry: Entry):
+        """Include an entry's amount in the running totals."""
+        bucket = (entry.direction, entry.type)
+        self._totals[bucket] = self._totals.get(bucket, 0) + entry.amount
+        self._exponents.setdefault(bucket, Counter())[entry.amount.as_tuple().exponent] += 1
+        self._counts[bucket] += 1
+
+    def _sub_totals(self, entry: Entry):
+        """
+        Remove an entry's amount from the running totals.
+
+        The result is re-quantized to the smallest exponent still present so
+        it prints exactly like a fresh sum over the remaining entries.
+        """
+        bucket = (entry.direction, entry.type)
+        exponents = self._exponents[bucket]
+        exponents[entry.amount.as_tuple().exponent] -= 1
+        exponents += Counter()                   # drop zero counts
+        self._counts[bucket] -= 1
+        if not self._counts[bucket]:
+            del self._totals[bucket], self._exponents[bucket], self._counts[bucket]
+            return
+
+        total = self._totals[bucket] - entry.amount
+        smallest = min(exponents)
+        if total.as_tuple().exponent != smallest:
+            total = total.quantize(Decimal((0, (1,), smallest)))
+        self._totals[bucket] = total
+        self._exponents[bucket] = exponents
 
     def add_entry(self, entry: Entry):
         """
@@ -31,22 +90,136 @@ class MonthlyData:
         if entry.date != self.month:
             raise ValueError("Entry date does not match MonthlyData month")
         self.entries.append(entry)              # add valid entry
+        self._index.setdefault(self.key(entry), len(self.entries) - 1)
+        self._add_totals(entry)
+
+    def get(self, category: Category, direction: str, type: str) -> Optional[Entry]:
+        """
+        Look up the entry stored under a category/direction/type key.
+
+        :return: matching Entry or None
+        """
+        pos = self._index.get((self.month, category, direction, type))
+        return None if pos is None else self.entries[pos]
+
+    def upsert(self, entry: Entry) -> bool:
+        """
+        Replace the entry with the same category/direction/type or add it.
+
+        :param entry: Entry object to store
+        :return: True if an existing entry was replaced
+        :raises ValueError: if entry.date does not match this month
+        """
+        pos = self._index.get(self.key(entry))
+        if pos is None:
+            self.add_entry(entry)
+            return False
+        self._sub_totals(self.entries[pos])
+        self.entries[pos] = entry
+        self._add_totals(entry)
+        return True
+
+    def remove(self, category: Category, direction: str, type: str) -> Optional[Entry]:
+        """
+        Remove the entry stored under a category/direction/type key.
+
+        The last entry is moved into the freed slot, so removal is O(1) but
+        does not preserve the order of the remaining entries.
+
+        :return: the removed Entry or None if no entry matched
+        """
+        key = (self.month, category, direction, type)
+        pos = self._index.pop(key, None)
+        if pos is None:
+            return None
+
+        removed = self.entries[pos]
+        last = self.entries.pop()
+        if pos < len(self.entries):
+            self.entries[pos] = last
+            if self._index.get(self.key(last)) == len(self.entries):
+                self._index[self.key(last)] = pos
+
+        if len(self._index) < len(self.entries):
+            # Duplicate keys exist (only possible via add_entry); re-point
+            # the removed key to a remaining duplicate, if any
+            for i, entry in enumerate(self.entries):
+                if self.key(entry) == key:
+                    self._index[key] = i
+                    break
+
+        self._sub_totals(removed)
+        return removed
+
+    def actualize(self):
+        """Convert every 'forecast' entry of this month into an 'actual' one."""
+        for pos, entry in enumerate(self.entries):
+            if entry.type == "forecast":
+                self.entries[pos] = replace(entry, type="actual")  # finalize forecast entry
+        self._reindex()                         # keys and buckets changed
+
+    def copy(self) -> "MonthlyData":
+        """Return an independent copy of this month (entries are immutable and shared)."""
+        return MonthlyData(self.month, list(self.entries))
+
+    def total(self, direction: str, type: Optional[str] = None) -> Decimal:
+        """
+        Return the running total for a direction, optionally for one type.
+
+        :param direction: "income" or "expense"
+        :param type: "actual", "forecast" or None for both
+        """
+        if type is None:
+            value = (self._totals.get((direction, "actual"), 0) +
+                     self._totals.get((direction, "forecast"), 0))
+        else:
+            value = self._totals.get((direction, type), 0)
+        if self.DEBUG_TOTALS:
+            self.check_totals()
+        return value
+
+    def check_totals(self):
+        """
+        Compare the running totals with a full rescan of the entries.
+
+        :raises AssertionError: if any (direction, type) total has drifted
+        """
+        rescanned = {}
+        for e in self.entries:
+            bucket = (e.direction, e.type)
+            rescanned[bucket] = rescanned.get(bucket, 0) + e.amount
+        if rescanned != self._totals:
+            raise AssertionError(
+                f"Running totals out of sync for {self.month}: {self._totals} != {rescanned}"
+            )
+
+    def count(self, direction: str, type: Optional[str] = None) -> int:
+        """
+        Return the number of entries for a direction, optionally for one type.
+
+        :param direction: "income" or "expense"
+        :param type: "actual", "forecast" or None for both
+        """
+        if type is None:
+            return self._counts[(direction, "actual")] + self._counts[(direction, "forecast")]
+        return self._counts[(direction, type)]
+
+    @property
+    def has_actuals(self) -> bool:
+        """Return True if this month holds at least one 'actual' entry."""
+        return bool(self._counts[("income", "actual")] or self._counts[("expense", "actual")])
 
     @property
     def total_income(self) -> Decimal:
         """Return sum of all income amounts for this month."""
-        return sum(
-            e.amount for e in self.entries if e.direction == "income"
-        )
+        return self.total("income")
 
     @property
     def total_expenses(self) -> Decimal:
         """Return sum of all expense amounts for this month."""
-        return sum(
-            e.amount for e in self.entries if e.direction == "expense"
-        )
+        return self.total("expense")
 
     @property
     def net_cash_flow(self) -> Decimal:
         """Return net cash flow (income minus expenses) for this month."""
-        return self.total_income - self.total_expenses
\ No newline at end of file
+        return self.total_income - self.total_expenses
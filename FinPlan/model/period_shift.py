@@ -37,7 +37,9 @@ class PeriodShift:
     def apply_shift(self) -> None:
         """
         Execute the pending period shift:
-        - convert all 'forecast' entries in the first active month to 'actual'
+        - convert all 'forecast' entries in the first active month to 'actual',
+          storing the entries of recurring rules for that month (later
+          months stay implicit)
         - advance the rolling window in the model
 
         :raises PeriodShiftError: if prepare() was not called first
@@ -48,11 +50,7 @@ class PeriodShift:
             )
 
         first_month = self.model.get_active_months()[0]  # beginning of window
-        md = self.model.months.get(first_month)
-        if md:
-            for entry in md.entries:
-                if entry.type == "forecast":
-                    entry.type = "actual"       # finalize forecast entries
-
-        self.model.close_period()              # move window forward
+        with self.model.batch():               # one write for the whole shift
+            self.model.actualize_month(first_month)  # finalize forecasts
+            self.model.close_period()          # move window forward
         self._pending = False                  # reset readiness flag
\ No newline at end of file
@@ -0,0 +1,300 @@
+"""
+Recurring income and expense rules.
+
+A RecurringRule describes a regular flow such as "salaries 200 a month from
+January, +5% a year" or "loan principal 500 a month until December 2028"
+instead of one stored Entry per month. Rules are kept in the workbook's
+meta section and expanded lazily: RuleSet.entries() computes the forecast
+entries of one month in closed form (amount x (1 + growth) ^ whole years
+since the start) and caches them, and only queried months (the forecast
+window) are ever expanded.
+
+Stored entries take precedence: a month that already holds an entry
+(actual or forecast) for a rule's category and direction keeps it, so the
+amount of a single month can still be overridden in the input grid.
+Months before the window are history: RuleSet.history() adds their rule
+entries to the month aggregates as actuals, so opening balances and the
+chart history include them without one stored row per month. Only the
+month that close_period moves out of the window is written to the
+workbook (see FinModel._materialize_rules).
+"""
+from collections import ChainMap, OrderedDict
+from dataclasses import dataclass, replace
+from datetime import date
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Optional
+
+from dateutil.relativedelta import relativedelta
+
+from .category import Category
+from .entry import Direction, Entry
+from .ledger import MonthSummary
+from .monthly_data import MonthlyData
+
+CENT = Decimal("0.01")
+CACHE_MONTHS = 1024   # expanded months kept by RuleSet.entries()
+
+
+def months_between(start: date, month: date) -> int:
+    """Return the number of whole months from start to month (negative if before)."""
+    return (month.year - start.year) * 12 + month.month - start.month
+
+
+@dataclass(frozen=True)
+class RecurringRule:
+    """
+    A recurring forecast amount.
+
+    Attributes:
+      category: category of the generated entries
+      direction: "income" or "expense"
+      amount: amount in the first year
+      start: first month the rule applies to (first day)
+      end: last month it applies to, inclusive (None: open-ended)
+      every: interval in months (1 monthly, 3 quarterly, 12 yearly)
+      growth: yearly growth rate applied on every anniversary of start,
+        e.g. Decimal("0.05") for +5% a year
+    """
+    category: Category
+    direction: Direction
+    amount: Decimal
+    start: date
+    end: Optional[date] = None
+    every: int = 1
+    growth: Decimal = Decimal("0")
+
+    def __post_init__(self):
+        object.__setattr__(self, "direction", Direction(self.direction))
+        object.__setattr__(self, "start", self.start.replace(day=1))
+        if self.end is not None:
+            object.__setattr__(self, "end", self.end.replace(day=1))
+            if self.end < self.start:
+                raise ValueError("Rule ends before it starts")
+        if self.every < 1:
+            raise ValueError("Rule interval must be at least one month")
+
+    def amount_in(self, month: date) -> Optional[Decimal]:
+        """
+        Return the rule's amount in a month, or None if it does not apply.
+
+        :param month: start date of the month
+        """
+        offset = months_between(self.start, month)
+        if offset < 0 or offset % self.every or (self.end is not None and month > self.end):
+            return None
+        years = offset // 12
+        if not years or not self.growth:
+            return self.amount
+        return (self.amount * (1 + self.growth) ** years).quantize(CENT, ROUND_HALF_EVEN)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the rule to a JSON-serializable dict.
+
+        :return: mapping of rule fields to primitive types
+        """
+        return {
+            "category": self.category.value,
+            "direction": self.direction.value,
+            "amount": str(self.amount),
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat() if self.end else None,
+            "every": self.every,
+            "growth": str(self.growth),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RecurringRule":
+        """
+        Build a rule from the mapping produced by to_dict().
+
+        :param data: mapping with category, direction, amount and start;
+            end, every and growth are optional
+        :return: new RecurringRule instance
+        """
+        return cls(
+            category=Category(data["category"]),
+            direction=data["direction"],
+            amount=Decimal(data["amount"]),
+            start=date.fromisoformat(data["start"]),
+            end=date.fromisoformat(data["end"]) if data.get("end") else None,
+            every=int(data.get("every", 1)),
+            growth=Decimal(data.get("growth", "0")),
+        )
+
+
+class RuleSet:
+    """
+    Ordered collection of recurring rules with a per-month expansion cache.
+
+    Attributes:
+      rules: list of RecurringRule; change it through add() and remove()
+        so the cache stays valid
+    """
+
+    def __init__(self, rules=()):
+        """
+        :param rules: initial RecurringRule objects
+        """
+        self.rules = list(rules)
+        self._cache = OrderedDict()  # month -> list of forecast entries, LRU order
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    @property
+    def start(self) -> Optional[date]:
+        """Earliest start month of the rules, or None if there are none."""
+        return min((rule.start for rule in self.rules), default=None)
+
+    def add(self, rule: RecurringRule) -> int:
+        """Append a rule and return its index."""
+        self.rules.append(rule)
+        self._cache.clear()
+        return len(self.rules) - 1
+
+    def remove(self, index: int) -> RecurringRule:
+        """Remove and return the rule at an index."""
+        rule = self.rules.pop(index)
+        self._cache.clear()
+        return rule
+
+    def entries(self, month: date) -> list[Entry]:
+        """
+        Return the forecast entries the rules generate for a month.
+
+        Rules sharing a category and direction are summed into one entry.
+        Results are cached until the rules change; the cache keeps the
+        CACHE_MONTHS most recently used months.
+
+        :param month: start date of the month
+        """
+        entries = self._cache.get(month)
+        if entries is not None:
+            self._cache.move_to_end(month)
+        else:
+            totals = {}
+            for rule in self.rules:
+                amount = rule.amount_in(month)
+                if amount is not None:
+                    key = (rule.category, rule.direction)
+                    totals[key] = totals.get(key, 0) + amount
+            entries = self._cache[month] = [
+                Entry(date=month, category=category, direction=direction, amount=amount, type="forecast")
+                for (category, direction), amount in totals.items()
+            ]
+            if len(self._cache) > CACHE_MONTHS:
+                self._cache.popitem(last=False)
+        return entries
+
+    def pending(self, md: Optional[MonthlyData], month: date) -> list[Entry]:
+        """
+        Return the rule entries of a month that its stored entries do not override.
+
+        :param md: stored MonthlyData of the month, or None
+        :param month: start date of the month
+        """
+        entries = self.entries(month)
+        if md is None:
+            return entries
+        return [e for e in entries
+                if md.get(e.category, e.direction, "forecast") is None
+                and md.get(e.category, e.direction, "actual") is None]
+
+    def merge(self, md: Optional[MonthlyData], month: date) -> Optional[MonthlyData]:
+        """
+        Return a month with its rule entries added (the stored month is not modified).
+
+        :param md: stored MonthlyData of the month, or None
+        :param month: start date of the month
+        :return: md itself if no rule entry applies, otherwise a merged copy
+        """
+        pending = self.pending(md, month)
+        if not pending:
+            return md
+        merged = md.copy() if md is not None else MonthlyData(month)
+        for entry in pending:
+            merged.add_entry(entry)
+        return merged
+
+    def overlay(self, months, window: list[date], source=None, last: Optional[date] = None):
+        """
+        Return a read-only mapping of months with the window's rule entries merged in.
+
+        Window months after the last stored month carry that month forward
+        (as metrics.window_months does) with the month's rule entries on
+        top, so a rule adds to the run rate instead of replacing it.
+
+        :param months: mapping of month start date to aggregates
+        :param window: months to expand the rules for
+        :param source: mapping the stored entries are read from (default:
+            months; pass the LazyMonths when months holds summaries)
+        :param last: last stored month, or None if nothing is stored
+        :return: ChainMap of the merged window months over months
+        """
+        source = months if source is None else source
+        merged = {}
+        for month in window:
+            md = source.get(month)
+            if md is None and last is not None and month > last:
+                carried = MonthlyData(month, [replace(e, date=month) for e in source[last].entries])
+                for entry in self.pending(carried, month):
+                    carried.add_entry(entry)
+                merged[month] = carried
+                continue
+            view = self.merge(md, month)
+            if view is not md:
+                merged[month] = view
+        return ChainMap(merged, months)
+
+    def history(self, months, end: date, source):
+        """
+        Return a read-only mapping of months with the rule entries of months
+        before `end` added as actuals.
+
+        Stored months keep the entries that override a rule; their entries
+        are read through source.records(), so unloaded months stay unloaded.
+
+        :param months: mapping of month start date to aggregates
+        :param end: first month not to expand, usually the window start
+        :param source: LazyMonths holding the stored months
+        :return: ChainMap of MonthSummary objects over months
+        """
+        merged = {}
+        month = self.start
+        while month is not None and month < end:
+            entries = self.entries(month)
+            if entries and month in source:
+                stored = {(r["category"], r["direction"]) for r in source.records(month)}
+                entries = [e for e in entries if (e.category.value, e.direction.value) not in stored]
+            if entries:
+                merged[month] = _with_actuals(months.get(month), month, entries)
+            month += relativedelta(months=1)
+        return ChainMap(merged, months)
+
+    def to_list(self) -> list[dict]:
+        """Return the rules as to_dict() mappings."""
+        return [rule.to_dict() for rule in self.rules]
+
+    @classmethod
+    def from_list(cls, data: list) -> "RuleSet":
+        """Build a RuleSet from to_list() output."""
+        return cls(RecurringRule.from_dict(d) for d in data)
+
+
+def _with_actuals(md, month: date, entries: list[Entry]) -> MonthSummary:
+    """Return the aggregates of a month (None: empty) plus entries counted as actuals."""
+    totals, counts = {}, {}
+    if md is not None:
+        for direction in ("income", "expense"):
+            for type in ("actual", "forecast"):
+                totals[direction, type] = md.total(direction, type)
+                counts[direction, type] = md.count(direction, type)
+    for e in entries:
+        key = (e.direction.value, "actual")
+        totals[key] = totals.get(key, 0) + e.amount
+        counts[key] = counts.get(key, 0) + 1
+    return MonthSummary(month, totals, counts)
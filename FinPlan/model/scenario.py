@@ -8,6 +8,9 @@ class Scenario:
     """
     Applies scenario multipliers to a month's data to generate forecasts.
 
+    apply() materializes forecast entries; project() only scales totals.
+    For whole-ledger projections in integer cents see ScenarioEngine.
+
     Attributes:
       name: key identifying the scenario (e.g., 'optimistic', 'baseline', 'pessimistic')
       factors: dict with 'income' and 'expenses' Decimal multipliers
@@ -40,17 +43,15 @@ class Scenario:
             next_month = prev.month + relativedelta(months=1)
 
         forecast = MonthlyData(next_month)  # container for forecast entries
+        income_factor = Decimal(self.factors['income'])     # Decimal multipliers,
+        expense_factor = Decimal(self.factors['expenses'])  # built once per call
         for entry in prev.entries:
             # choose factor based on direction
-            factor = (
-                Decimal(self.factors['income'])
-                if entry.direction == 'income'
-                else Decimal(self.factors['expenses'])
-            )  # Decimal multiplier
+            factor = income_factor if entry.direction == 'income' else expense_factor
             adjusted_amount = entry.amount * factor  # scaled value
 
             # create new forecast entry
-            forecast.entries.append(
+            forecast.add_entry(
                 Entry(
                     date=next_month,
                     category=entry.category,
@@ -59,4 +60,23 @@ class Scenario:
                     type="forecast"
                 )
             )
-        return forecast  # return populated forecast data
\ No newline at end of file
+        return forecast  # return populated forecast data
+
+    def project(self, month) -> tuple[Decimal, Decimal]:
+        """
+        Scale a month's aggregate totals by the scenario factors.
+
+        Equivalent to apply() followed by summing the forecast entries, but
+        works on totals alone, so it accepts MonthlyData as well as a
+        Ledger's MonthSummary.
+
+        :param month: object exposing total_income, total_expenses and count()
+        :return: (income, expenses) after applying the factors
+        """
+        income = month.total_income
+        expenses = month.total_expenses
+        if month.count("income"):
+            income = income * self.factors["income"]
+        if month.count("expense"):
+            expenses = expenses * self.factors["expenses"]
+        return income, expenses
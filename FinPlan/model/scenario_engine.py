@@ -0,0 +1,185 @@
+"""
+Vectorized scenario projection over columnar totals.
+
+ScenarioEngine applies income/expense factors to many months (or every row
+of a Ledger) at once using int64 cent arithmetic. Each factor is split into
+an exact integer ratio (1.3 -> 13/10), so amount * factor is computed
+without floating point and rounded back to cents with a Decimal rounding
+mode. The results equal the Decimal path (sum of amount * factor, quantized
+to cents with the same rounding mode) for amounts in whole cents.
+"""
+from datetime import date
+from decimal import (
+    Decimal, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN,
+    ROUND_UP, ROUND_DOWN, ROUND_CEILING, ROUND_FLOOR, ROUND_05UP,
+)
+from typing import Optional
+
+import numpy as np
+
+from .constants import SCENARIO_FACTORS
+from .ledger import Ledger, MonthTotals, INCOME, from_cents, ordinal_month
+
+
+def factor_ratio(factor) -> tuple[int, int]:
+    """
+    Split a decimal factor into an exact (numerator, denominator) pair.
+
+    :param factor: Decimal, str or int multiplier
+    :return: integers such that factor == numerator / denominator
+    """
+    sign, digits, exponent = Decimal(factor).as_tuple()
+    numerator = int("".join(map(str, digits)) or "0") * (-1 if sign else 1)
+    if exponent >= 0:
+        return numerator * 10 ** exponent, 1
+    return numerator, 10 ** -exponent
+
+
+def divide_rounded(values, denominator: int, rounding: str = ROUND_HALF_EVEN):
+    """
+    Divide an int64 array by a positive integer, rounding like Decimal.
+
+    :param values: int64 numerators
+    :param denominator: positive integer divisor
+    :param rounding: one of the decimal module ROUND_* constants
+    :return: int64 array of rounded quotients
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if denominator == 1:
+        return values.copy()
+
+    negative = values < 0
+    magnitude = np.abs(values)
+    quotient, remainder = np.divmod(magnitude, denominator)
+    twice = remainder * 2
+
+    if rounding == ROUND_DOWN:
+        bump = np.zeros_like(remainder, dtype=bool)
+    elif rounding == ROUND_UP:
+        bump = remainder > 0
+    elif rounding == ROUND_HALF_UP:
+        bump = twice >= denominator
+    elif rounding == ROUND_HALF_DOWN:
+        bump = twice > denominator
+    elif rounding == ROUND_HALF_EVEN:
+        bump = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    elif rounding == ROUND_CEILING:
+        bump = (remainder > 0) & ~negative
+    elif rounding == ROUND_FLOOR:
+        bump = (remainder > 0) & negative
+    elif rounding == ROUND_05UP:
+        bump = (remainder > 0) & (quotient % 5 == 0)
+    else:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+
+    result = quotient + bump
+    return np.where(negative, -result, result)
+
+
+class ProjectedTotals:
+    """
+    Lightweight result of a scenario projection: per-month totals in cents.
+
+    Attributes (aligned arrays):
+      months: month ordinals
+      income, expenses, net: int64 cents after scenario factors
+    """
+    def __init__(self, months, income, expenses):
+        self.months = months
+        self.income = income
+        self.expenses = expenses
+        self.net = income - expenses
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def month_dates(self) -> list[date]:
+        """Return the projected months as first-of-month dates."""
+        return [ordinal_month(o) for o in self.months]
+
+    def as_decimals(self) -> dict[date, tuple[Decimal, Decimal, Decimal]]:
+        """Return {month: (income, expenses, net)} as Decimal amounts."""
+        return {
+            ordinal_month(o): (from_cents(i), from_cents(e), from_cents(n))
+            for o, i, e, n in zip(self.months, self.income, self.expenses, self.net)
+        }
+
+
+class ScenarioEngine:
+    """
+    Applies scenario factors to whole months or whole ledgers in one pass.
+
+    Attributes:
+      factors: dict with 'income' and 'expenses' multipliers
+      rounding: decimal ROUND_* mode used when rounding back to cents
+    """
+
+    def __init__(self, factors: dict, rounding: str = ROUND_HALF_EVEN):
+        """
+        :param factors: mapping with 'income' and 'expenses' multipliers
+        :param rounding: decimal module rounding mode for cent results
+        """
+        self.factors = factors
+        self.rounding = rounding
+        self._income = factor_ratio(factors["income"])
+        self._expenses = factor_ratio(factors["expenses"])
+
+    @classmethod
+    def from_name(cls, name: str, rounding: str = ROUND_HALF_EVEN) -> "ScenarioEngine":
+        """
+        Create an engine for one of the preset SCENARIO_FACTORS.
+
+        :raises ValueError: if scenario name is unknown
+        """
+        if name not in SCENARIO_FACTORS:
+            raise ValueError(f"Unknown scenario: {name}")
+        return cls(SCENARIO_FACTORS[name], rounding)
+
+    def scale(self, cents, direction: str):
+        """
+        Multiply an array of cents by the income or expense factor.
+
+        :param cents: int64 amounts
+        :param direction: "income" or "expense"
+        :return: int64 scaled amounts rounded to cents
+        """
+        numerator, denominator = self._income if direction == "income" else self._expenses
+        return divide_rounded(np.asarray(cents, dtype=np.int64) * numerator,
+                              denominator, self.rounding)
+
+    def project(self, totals: MonthTotals, months: Optional[list[date]] = None) -> ProjectedTotals:
+        """
+        Project per-month totals, applying factors to all entry types.
+
+        :param totals: MonthTotals from Ledger.month_totals() or
+            MonthTotals.from_months()
+        :param months: optional subset of months to project
+        :return: ProjectedTotals in cents
+        """
+        ordinals, income, expenses = totals.months, totals.income, totals.expenses
+        if months is not None:
+            wanted = np.array([m.year * 12 + m.month - 1 for m in months], dtype=ordinals.dtype)
+            keep = np.isin(ordinals, wanted)
+            ordinals, income, expenses = ordinals[keep], income[keep], expenses[keep]
+        return ProjectedTotals(
+            ordinals,
+            self.scale(income, "income"),
+            self.scale(expenses, "expense"),
+        )
+
+    def project_ledger(self, ledger: Ledger) -> Ledger:
+        """
+        Scale every row of a ledger, returning a new forecast-only ledger.
+
+        Rows are rounded individually, matching Scenario.apply() followed by
+        quantizing each entry to cents. Call Ledger.entries() or to_months()
+        on the result when Entry objects are actually needed.
+        """
+        is_income = (ledger.flags & INCOME).astype(bool)
+        cents = np.where(
+            is_income,
+            self.scale(ledger.cents, "income"),
+            self.scale(ledger.cents, "expense"),
+        )
+        return Ledger(ledger.month.copy(), ledger.category.copy(),
+                      ledger.flags & INCOME, cents)
@@ -0,0 +1,162 @@
+"""
+Sensitivity sweep of the forecast window over a grid of scenario factors.
+
+A Scenario applies one income and one expense multiplier. A sweep
+evaluates every combination of an array of income factors and an array of
+expense factors at once: the window amounts are summed per category group
+once, and the closing balance and runway of all combinations are computed
+with NumPy broadcasting instead of one forecast_metrics call per cell.
+
+Factors can be given per group: income is split into "guaranteed" and
+"expected" categories, expenses into "fixed" (FIXED_EXPENSE_CATEGORIES)
+and "variable" ones. The math follows forecast_metrics (carry-forward of
+the last stored month, weighted burn), in float currency units.
+"""
+from datetime import date
+
+import numpy as np
+
+from .balance_index import BalanceIndex
+from .constants import (
+    DEFAULT_INCOME_GUARANTEED_CATEGORIES,
+    FIXED_EXPENSE_CATEGORIES,
+    SWEEP_RANGE,
+    SWEEP_STEPS,
+)
+from .metrics import window_months
+
+INCOME_GROUPS = ("guaranteed", "expected")
+EXPENSE_GROUPS = ("fixed", "variable")
+
+
+def factor_range(low: float = SWEEP_RANGE[0], high: float = SWEEP_RANGE[1],
+                 steps: int = SWEEP_STEPS):
+    """Return `steps` evenly spaced factors from low to high."""
+    return np.linspace(low, high, steps)
+
+
+def expense_group(category) -> str:
+    """Return the sweep group ("fixed" or "variable") of an expense category."""
+    return "fixed" if category.value in FIXED_EXPENSE_CATEGORIES else "variable"
+
+
+def income_group(category) -> str:
+    """Return the sweep group ("guaranteed" or "expected") of an income category."""
+    return "guaranteed" if category.value in DEFAULT_INCOME_GUARANTEED_CATEGORIES else "expected"
+
+
+def group_amounts(months, active_months: list[date], index: BalanceIndex):
+    """
+    Sum the forecast window per month and category group.
+
+    :param months: mapping of month start date to MonthlyData
+    :param active_months: months of the forecast window
+    :param index: BalanceIndex of months
+    :return: (dates, income, expenses) with float64 arrays of shape
+        (len(dates), 2) in currency units, columns ordered as INCOME_GROUPS
+        and EXPENSE_GROUPS
+    """
+    window = list(window_months(months, active_months, index))
+    income = np.zeros((len(window), len(INCOME_GROUPS)))
+    expenses = np.zeros((len(window), len(EXPENSE_GROUPS)))
+    for row, (_, md) in enumerate(window):
+        for e in md.entries:
+            if e.direction == "income":
+                income[row, INCOME_GROUPS.index(income_group(e.category))] += float(e.amount)
+            else:
+                expenses[row, EXPENSE_GROUPS.index(expense_group(e.category))] += float(e.amount)
+    return [m for m, _ in window], income, expenses
+
+
+def _factor_matrix(factors, groups: tuple) -> np.ndarray:
+    """
+    Normalize factors to an array of shape (len(groups), steps).
+
+    :param factors: array-like applied to every group, or a dict
+        {group: array-like or scalar}; missing groups keep factor 1
+    :raises ValueError: on unknown groups or arrays of different lengths
+    """
+    if not isinstance(factors, dict):
+        factors = {group: factors for group in groups}
+    unknown = set(factors) - set(groups)
+    if unknown:
+        raise ValueError(f"Unknown factor groups: {', '.join(sorted(unknown))}")
+    arrays = [np.atleast_1d(np.asarray(factors.get(group, 1.0), dtype=float)) for group in groups]
+    try:
+        return np.vstack(np.broadcast_arrays(*arrays))
+    except ValueError:
+        raise ValueError("Factor arrays of one axis must have the same length") from None
+
+
+class SweepResult:
+    """
+    Closing balances and runway for every factor combination.
+
+    Attributes:
+      months: dates of the window months
+      income_factors: float64 array (2, I) of income factors per group
+      expense_factors: float64 array (2, J) of expense factors per group
+      closing: float64 array (I, J, months) of closing balances
+      runway: float64 array (I, J, months) of runway months
+      burn: float64 array (J,) of weighted monthly burn per expense step
+    """
+
+    def __init__(self, months: list[date], income_factors, expense_factors, closing, runway, burn):
+        self.months = months
+        self.income_factors = income_factors
+        self.expense_factors = expense_factors
+        self.closing = closing
+        self.runway = runway
+        self.burn = burn
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Grid size as (income steps, expense steps)."""
+        return self.closing.shape[:2]
+
+    def final_closing(self):
+        """Return the (I, J) closing balances at the end of the window."""
+        return self.closing[:, :, -1] if self.months else np.zeros(self.shape)
+
+    def final_runway(self):
+        """Return the (I, J) runway months at the end of the window."""
+        return self.runway[:, :, -1] if self.months else np.zeros(self.shape)
+
+    def solvent(self):
+        """Return an (I, J) boolean grid: closing balance never negative in the window."""
+        return (self.closing >= 0).all(axis=2)
+
+
+def sweep(months: list[date], income, expenses, opening,
+          income_factors, expense_factors) -> SweepResult:
+    """
+    Evaluate the window for every pair of income and expense factors.
+
+    :param months: window month dates, as returned by group_amounts
+    :param income: income per month and group, as returned by group_amounts
+    :param expenses: expenses per month and group, shaped like income
+    :param opening: (net, expenses, count) of actual months before the
+        window, as returned by BalanceIndex.opening
+    :param income_factors: I income multipliers, or {group: multipliers}
+        with groups from INCOME_GROUPS
+    :param expense_factors: J expense multipliers, or {group: multipliers}
+        with groups from EXPENSE_GROUPS
+    :return: SweepResult with (I, J, months) closing balances and runway
+    """
+    f_inc = _factor_matrix(income_factors, INCOME_GROUPS)
+    f_exp = _factor_matrix(expense_factors, EXPENSE_GROUPS)
+    inc = f_inc.T @ income.T    # (I, months)
+    exp = f_exp.T @ expenses.T  # (J, months)
+
+    net, actual_expenses, actual_count = opening
+    closing = float(net) + np.cumsum(inc[:, None, :] - exp[None, :, :], axis=2)
+
+    # Weighted burn rate: 2x for actual, 1x for forecast (see forecast_metrics)
+    total_weight = actual_count * 2 + len(months)
+    if total_weight:
+        burn = (float(actual_expenses) * 2 + exp.sum(axis=1)) / total_weight
+    else:
+        burn = np.ones(exp.shape[0])
+    grid_burn = burn[None, :, None]
+    runway = np.divide(closing, grid_burn, out=np.zeros_like(closing), where=grid_burn != 0)
+    return SweepResult(months, f_inc, f_exp, closing, runway, burn)
@@ -0,0 +1,168 @@
+"""
+Workspace manager: several workbooks open in one process.
+
+Each workspace is one workbook file (<root>/<name>.fpb if present, else
+<root>/<name>.json) backed by its own FinModel and store. Opened models are
+cached in least-recently-used order; when the cache holds more than
+max_open models or its estimated memory use exceeds memory_budget, the
+least recently used models are closed. Closing a model writes its pending
+autosave changes and stops its scheduler.
+"""
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+from .binary_store import open_store
+from .data_store import DataStore
+from .fin_model import FinModel
+
+
+class WorkspaceManager:
+    """
+    Opens, caches and evicts workbooks with an LRU policy under a memory budget.
+
+    Attributes:
+      root: directory holding the workbook files
+      max_open: maximum number of models kept open
+      memory_budget: approximate bytes the open models may use
+      store_factory: callable(path) -> DataStore used for new models
+
+    The cache itself is thread-safe, so different threads may open
+    different workspaces concurrently. Each model should still be used by
+    one thread at a time.
+    """
+    ENTRY_BYTES = 400   # measured cost of one loaded entry incl. month index
+    MONTH_BYTES = 1500  # MonthlyData object, index and totals of one month
+
+    def __init__(self, root="data", max_open: int = 8,
+                 memory_budget: int = 256 * 1024 * 1024,
+                 store_factory: Callable[[Path], DataStore] = open_store):
+        """
+        :param root: directory of workbook files
+        :param max_open: maximum number of cached models
+        :param memory_budget: memory budget in bytes for cached models
+        :param store_factory: creates the store for a workbook path
+        """
+        self.root = Path(root)
+        self.max_open = max_open
+        self.memory_budget = memory_budget
+        self.store_factory = store_factory
+        self._models = OrderedDict()  # path -> FinModel, least recent first
+        self._sizes = {}              # path -> estimated bytes
+        self._lock = threading.Lock()
+
+    def path_for(self, name) -> Path:
+        """
+        Resolve a workspace name or file path to the workbook file.
+
+        :param name: workspace name ("acme" -> <root>/acme.fpb or
+            <root>/acme.json) or a path
+        """
+        path = Path(name)
+        if path.suffix:
+            return path
+        binary = self.root / f"{path.name}.fpb"
+        return binary if binary.exists() else self.root / f"{path.name}.json"
+
+    def available(self) -> list[str]:
+        """Return the names of all workbooks in the root directory."""
+        if not self.root.is_dir():
+            return []
+        names = {p.stem for pattern in ("*.json", "*.fpb") for p in self.root.glob(pattern)}
+        return sorted(n for n in names if "_backup_" not in n)
+
+    def open(self, name) -> FinModel:
+        """
+        Return the model of a workspace, loading it if it is not cached.
+
+        :param name: workspace name or workbook path
+        """
+        path = self.path_for(name)
+        with self._lock:
+            model = self._models.get(path)
+            if model is not None:
+                self._models.move_to_end(path)
+                return model
+
+        # Load outside the lock so other workspaces can open meanwhile
+        model = FinModel(store=self.store_factory(path))
+        with self._lock:
+            if path in self._models:
+                # Another thread loaded it first; keep that instance
+                self._models.move_to_end(path)
+                return self._models[path]
+            self._models[path] = model
+            self._sizes[path] = self.estimate_size(model)
+            evicted = self._evict(keep=path)
+        self._release(evicted)
+        return model
+
+    def close(self, name):
+        """
+        Drop a workspace from the cache after writing its pending changes.
+
+        :param name: workspace name or workbook path
+        """
+        path = self.path_for(name)
+        with self._lock:
+            model = self._models.pop(path, None)
+            self._sizes.pop(path, None)
+        if model is not None:
+            self._release([model])
+
+    def refresh_size(self, name):
+        """Re-estimate a cached workspace after it grew and evict if needed."""
+        path = self.path_for(name)
+        evicted = []
+        with self._lock:
+            if path in self._models:
+                self._sizes[path] = self.estimate_size(self._models[path])
+                evicted = self._evict(keep=path)
+        self._release(evicted)
+
+    @property
+    def open_workspaces(self) -> list[Path]:
+        """Workbook paths currently cached, least recently used first."""
+        with self._lock:
+            return list(self._models)
+
+    @property
+    def memory_used(self) -> int:
+        """Estimated bytes used by the cached models."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    @classmethod
+    def estimate_size(cls, model: FinModel) -> int:
+        """Estimate the memory held by a model's loaded months in bytes."""
+        months = model.months
+        entries = sum(len(months[m].entries) for m in months if months.is_loaded(m))
+        return entries * cls.ENTRY_BYTES + len(months) * cls.MONTH_BYTES
+
+    def _evict(self, keep: Path) -> list[FinModel]:
+        """
+        Drop least recently used models until count and budget fit (lock held).
+
+        :return: the dropped models; pass them to _release() once the lock
+            is released
+        """
+        evicted = []
+        while len(self._models) > 1 and (
+            len(self._models) > self.max_open
+            or sum(self._sizes.values()) > self.memory_budget
+        ):
+            oldest = next(iter(self._models))
+            if oldest == keep:
+                break
+            evicted.append(self._models.pop(oldest))
+            del self._sizes[oldest]
+        return evicted
+
+    @staticmethod
+    def _release(models: list[FinModel]):
+        """Write the pending changes of dropped models and stop their autosave."""
+        for model in models:
+            with model.lock:
+                model.disable_autosave()
+                model.flush()
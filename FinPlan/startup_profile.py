@@ -0,0 +1,144 @@
+"""
+Startup-time instrumentation.
+
+Enable with `python -m FinPlan --profile-startup` or by setting the
+environment variable FINPLAN_PROFILE_STARTUP=1. While enabled, every module
+import and every phase wrapped in phase() (widget construction, controller
+setup, chart creation) is timed, and a report is printed to stderr once the
+main window has been shown.
+
+When disabled, phase() is a no-op and no import hook is installed.
+"""
+import importlib.abc
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ENV_VAR = "FINPLAN_PROFILE_STARTUP"
+
+_t0 = time.perf_counter()   # reference point: first import of this module
+_enabled = False
+_imports = []               # (module, inclusive seconds, self seconds)
+_phases = []                # (label, seconds, depth)
+_milestones = []            # (label, seconds since _t0)
+_depth = 0
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Loader wrapper measuring exec_module() of one module."""
+
+    _stack = []  # child time accumulators of the modules being executed
+
+    def __init__(self, loader, name: str):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        _TimedLoader._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = _TimedLoader._stack.pop()
+            if _TimedLoader._stack:
+                _TimedLoader._stack[-1] += elapsed
+            _imports.append((self._name, elapsed, elapsed - children))
+
+    def __getattr__(self, name):
+        # Resource readers, get_source() and friends go to the real loader
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps the loader found by the other finders."""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname)
+        return spec
+
+
+def enable():
+    """Start timing imports and phases (call before importing the GUI)."""
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    sys.meta_path.insert(0, _ImportTimer())
+
+
+def enabled_by_environment() -> bool:
+    """Return True if the FINPLAN_PROFILE_STARTUP variable requests profiling."""
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+def is_enabled() -> bool:
+    """Return True while startup profiling is active."""
+    return _enabled
+
+
+@contextmanager
+def phase(label: str):
+    """
+    Time a block of startup work, e.g. the construction of one widget.
+
+    :param label: name shown in the report
+    """
+    global _depth
+    if not _enabled:
+        yield
+        return
+    index = len(_phases)
+    _phases.append((label, 0.0, _depth))
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _depth -= 1
+        _phases[index] = (label, time.perf_counter() - start, _phases[index][2])
+
+
+def milestone(label: str):
+    """Record the time since startup at which a point was reached."""
+    if _enabled:
+        _milestones.append((label, time.perf_counter() - _t0))
+
+
+def report(stream=None, top: int = 25):
+    """
+    Print the collected timings.
+
+    :param stream: text stream (default: stderr)
+    :param top: number of slowest modules to list
+    """
+    if not _enabled:
+        return
+    out = stream or sys.stderr
+    print("\n== FinPlan startup profile ==", file=out)
+    for label, at in _milestones:
+        print(f"{at * 1000:9.1f} ms  {label}", file=out)
+
+    print("\n-- phases (inclusive) --", file=out)
+    for label, seconds, depth in _phases:
+        print(f"{seconds * 1000:9.1f} ms  {'  ' * depth}{label}", file=out)
+
+    total = sum(self_s for _, _, self_s in _imports)
+    print(f"\n-- imports: {len(_imports)} modules, {total * 1000:.1f} ms "
+          f"(slowest {top}, self / inclusive) --", file=out)
+    for name, incl, self_s in sorted(_imports, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"{self_s * 1000:9.1f} ms {incl * 1000:9.1f} ms  {name}", file=out)
+    out.flush()
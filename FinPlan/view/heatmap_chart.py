@@ -0,0 +1,126 @@
+"""
+HeatmapChart draws a sensitivity grid (e.g. runway for every income /
+expense factor pair) into one figure and keeps its artists between
+refreshes.
+
+The image, its colorbar and the marker of the selected scenario are
+created once. A refresh replaces the image data; as long as the factor
+ranges and the color limits still fit, only the image and marker are
+blitted over a cached background, otherwise the limits are relaid out and
+a full redraw is queued with draw_idle(), as in SeriesChart.
+"""
+import numpy as np
+
+
+class HeatmapChart:
+    MIN_FILL = 0.5     # relayout when the data shrinks below this share of the color range
+
+    def __init__(self, figure, canvas):
+        """
+        :param figure: matplotlib Figure owned by this chart
+        :param canvas: FigureCanvas showing the figure
+        """
+        self.figure = figure
+        self.canvas = canvas
+        self.ax = figure.add_subplot(111)
+        self.ax.set_xlabel("Expense factor")
+        self.ax.set_ylabel("Income factor")
+
+        # Image and marker are animated: a full draw renders axes and
+        # colorbar only, they are drawn on top of the cached background
+        self.image = self.ax.imshow(np.zeros((1, 1)), origin="lower", aspect="auto",
+                                    cmap="RdYlGn", interpolation="nearest", animated=True)
+        self.marker, = self.ax.plot([], [], linestyle="", marker="+", color="black",
+                                    markersize=10, markeredgewidth=2, animated=True)
+        self.colorbar = figure.colorbar(self.image, ax=self.ax)
+
+        self._background = None     # axes pixels without image and marker
+        self._draw_pending = False  # full redraw queued with draw_idle
+        self._extent = None         # factor ranges laid out on the axes
+        self._fitted_span = None    # data span the color limits were fitted to
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def update(self, title: str, income_factors, expense_factors, values, marker=None):
+        """
+        Show a new grid.
+
+        :param title: chart title
+        :param income_factors: I income factors (y axis)
+        :param expense_factors: J expense factors (x axis)
+        :param values: (I, J) array of values to color
+        :param marker: optional (expense factor, income factor) to mark
+        """
+        values = np.asarray(values, dtype=float)
+        self.image.set_data(values)
+        self.marker.set_data(*(([marker[0]], [marker[1]]) if marker else ([], [])))
+
+        relayout = self.ax.get_title() != title
+        relayout |= self._relayout_extent(income_factors, expense_factors)
+        relayout |= self._relayout_colors(values)
+        if relayout:
+            self.ax.set_title(title)
+            self.figure.tight_layout()
+            self.redraw()
+        else:
+            self.blit()
+
+    @staticmethod
+    def _edges(factors) -> tuple[float, float]:
+        """Outer cell edges of evenly spaced factors."""
+        lo, hi = float(factors[0]), float(factors[-1])
+        half = (hi - lo) / (len(factors) - 1) / 2 if len(factors) > 1 else 0.05
+        return lo - half, hi + half
+
+    def _relayout_extent(self, income_factors, expense_factors) -> bool:
+        """Map the grid cells onto the factor ranges if they changed."""
+        extent = self._edges(expense_factors) + self._edges(income_factors)
+        if extent == self._extent:
+            return False
+        self._extent = extent
+        self.image.set_extent(extent)
+        self.ax.set_xlim(*extent[:2])
+        self.ax.set_ylim(*extent[2:])
+        return True
+
+    def _relayout_colors(self, values) -> bool:
+        """
+        Refit the color limits if the data leaves them or fills too little of them.
+
+        Limits are symmetric around zero, so the middle color always marks
+        the break-even line.
+        """
+        finite = values[np.isfinite(values)]
+        if not finite.size:
+            return False
+        bound = max(float(np.abs(finite).max()), 1e-9)
+        vmin, vmax = self.image.get_clim()
+        fitted = self._fitted_span
+        if fitted is not None and -bound >= vmin and bound <= vmax and bound >= self.MIN_FILL * fitted:
+            return False
+        self.image.set_clim(-bound, bound)
+        self._fitted_span = bound
+        return True
+
+    def redraw(self):
+        """Queue a full redraw; draws requested in one event loop pass coalesce."""
+        self._draw_pending = True
+        self.canvas.draw_idle()
+
+    def blit(self):
+        """Repaint only the image and marker over the cached axes background."""
+        if self._draw_pending or self._background is None:
+            self.redraw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+
+    def _draw_artists(self):
+        self.ax.draw_artist(self.image)
+        self.ax.draw_artist(self.marker)
+
+    def _on_draw(self, event):
+        """After a full draw: cache the background, then paint the grid on it."""
+        self._draw_pending = False
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_artists()
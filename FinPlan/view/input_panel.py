@@ -1,15 +1,17 @@
 from PyQt5.QtWidgets import (
     QGroupBox, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QDateEdit, QSizePolicy,
-    QGridLayout, QLineEdit
+    QGridLayout, QLineEdit, QButtonGroup, QScrollArea, QSpinBox
 )
 from PyQt5.QtCore import Qt
 
+from ..model.constants import DEFAULT_HORIZON, MAX_HORIZON
+
 """
 Input panel on the left side of the main window.
 UI elements to: 
 select planning period
-enter expenses and income for three months
+enter expenses and income for each month of the forecast horizon
 control scenario, navigation and data actions
 """
 
@@ -32,14 +34,34 @@ class InputPanel(QGroupBox):
         # Top control row (period, scenario, exit)
         layout.addWidget(self._create_top_row())
 
-        # Month selection buttons
+        # Month selection buttons (one per horizon month, scrollable)
         month_box = QGroupBox("Select Month")
-        mb_layout = QHBoxLayout(month_box)
-        self.month_buttons = [QPushButton(f"Month {i}", checkable=True) for i in (1, 2, 3)]
-        for btn in self.month_buttons:
-            mb_layout.addWidget(btn)
+        mb_outer = QHBoxLayout(month_box)
+        self.month_scroll = QScrollArea()
+        self.month_scroll.setWidgetResizable(True)
+        self.month_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.month_scroll.setFixedHeight(60)
+        self.month_strip = QWidget()
+        self.month_strip_layout = QHBoxLayout(self.month_strip)
+        self.month_strip_layout.setContentsMargins(0, 0, 0, 0)
+        self.month_scroll.setWidget(self.month_strip)
+        mb_outer.addWidget(self.month_scroll, 1)
+
+        # Horizon selector
+        mb_outer.addWidget(QLabel("Horizon:"))
+        self.horizonSpin = QSpinBox(objectName="horizonSpin")
+        self.horizonSpin.setRange(1, MAX_HORIZON)
+        self.horizonSpin.setValue(DEFAULT_HORIZON)
+        self.horizonSpin.setSuffix(" mo")
+        mb_outer.addWidget(self.horizonSpin)
         layout.addWidget(month_box)
 
+        # Buttons live in a group so click handlers survive rebuilds
+        self.month_group = QButtonGroup(self)
+        self.month_group.setExclusive(False)
+        self.month_buttons = []
+        self.set_month_count(DEFAULT_HORIZON)
+
         # Bottom layout: expenses and income input blocks
         bottom = QWidget()
         b_layout = QHBoxLayout(bottom)
@@ -177,8 +199,24 @@ class InputPanel(QGroupBox):
             grid.addWidget(inp, row, 1, alignment=Qt.AlignRight)
             target_list.append(inp)
 
+    # Create one month button per horizon month
+    def set_month_count(self, count: int):
+        enabled = self.month_buttons[0].isEnabled() if self.month_buttons else True
+        for btn in self.month_buttons:
+            self.month_group.removeButton(btn)
+            btn.setParent(None)
+        self.month_buttons = []
+        for i in range(count):
+            btn = QPushButton(f"Month {i + 1}", checkable=True)
+            btn.setEnabled(enabled)
+            self.month_group.addButton(btn)
+            self.month_strip_layout.addWidget(btn)
+            self.month_buttons.append(btn)
+
     # Set labels for month buttons
     def set_month_buttons_labels(self, labels: list[str]):
+        if len(labels) != len(self.month_buttons):
+            self.set_month_count(len(labels))
         for btn, lbl in zip(self.month_buttons, labels):
             btn.setText(lbl)
         if labels:
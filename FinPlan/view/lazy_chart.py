@@ -0,0 +1,72 @@
+"""
+LazyChart is a chart area whose matplotlib Figure and canvas are created
+on first use. Until then it shows a lightweight placeholder label, so
+matplotlib is not imported while the main window starts up.
+"""
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
+from PyQt5.QtCore import Qt
+
+from ..startup_profile import phase
+
+
+class LazyChart(QWidget):
+    def __init__(self, height: int, placeholder: str = "Chart appears after the first refresh",
+                 parent=None):
+        super().__init__(parent)
+        self._height = height
+        self._figure = None
+        self._canvas = None
+        self._series = None
+        self._heatmap = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.placeholder = QLabel(placeholder, objectName="chartPlaceholder")
+        self.placeholder.setAlignment(Qt.AlignCenter)
+        self.placeholder.setFixedHeight(height)
+        self._layout.addWidget(self.placeholder)
+
+    @property
+    def is_created(self) -> bool:
+        return self._canvas is not None
+
+    def _create(self):
+        with phase("matplotlib chart"):
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+            from matplotlib.figure import Figure
+
+            self._figure = Figure()
+            self._canvas = FigureCanvas(self._figure)
+            self._canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self._canvas.setFixedHeight(self._height)
+            self._layout.replaceWidget(self.placeholder, self._canvas)
+            self.placeholder.deleteLater()
+            self.placeholder = None
+
+    @property
+    def figure(self):
+        if self._figure is None:
+            self._create()
+        return self._figure
+
+    @property
+    def canvas(self):
+        if self._canvas is None:
+            self._create()
+        return self._canvas
+
+    @property
+    def series(self):
+        """SeriesChart drawing into this chart's figure (created with it)."""
+        if self._series is None:
+            from .series_chart import SeriesChart
+            self._series = SeriesChart(self.figure, self.canvas)
+        return self._series
+
+    @property
+    def heatmap(self):
+        """HeatmapChart drawing into this chart's figure (created with it)."""
+        if self._heatmap is None:
+            from .heatmap_chart import HeatmapChart
+            self._heatmap = HeatmapChart(self.figure, self.canvas)
+        return self._heatmap
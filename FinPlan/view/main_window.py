@@ -11,6 +11,7 @@ from ..model.constants import (
     DEFAULT_INCOME_EXPECTED_CATEGORIES,
 )
 from ..controller.fin_controller import FinController
+from ..startup_profile import phase
 
 """
 Main application window that combines input and output panels,
@@ -36,8 +37,10 @@ class MainWindow(QWidget):
         layout.setSpacing(30)
 
         # Create main panels
-        self.input_panel = InputPanel(self)
-        self.output_panel = OutputPanel(self)
+        with phase("InputPanel"):
+            self.input_panel = InputPanel(self)
+        with phase("OutputPanel"):
+            self.output_panel = OutputPanel(self)
         layout.addWidget(self.input_panel)
         layout.addWidget(self.output_panel)
 
@@ -50,18 +53,26 @@ class MainWindow(QWidget):
             panel.setGraphicsEffect(shadow)
 
         # Populate panels with category lists from model
-        self.input_panel.set_expense_items(
-            DEFAULT_EXPENSE_CATEGORIES,
-            INPUT_FIELD_WIDTH
-        )
-        self.input_panel.set_income_items(
-            DEFAULT_INCOME_GUARANTEED_CATEGORIES,
-            DEFAULT_INCOME_EXPECTED_CATEGORIES,
-            INPUT_FIELD_WIDTH
-        )
+        with phase("category inputs"):
+            self.input_panel.set_expense_items(
+                DEFAULT_EXPENSE_CATEGORIES,
+                INPUT_FIELD_WIDTH
+            )
+            self.input_panel.set_income_items(
+                DEFAULT_INCOME_GUARANTEED_CATEGORIES,
+                DEFAULT_INCOME_EXPECTED_CATEGORIES,
+                INPUT_FIELD_WIDTH
+            )
 
         # Bind controller to the view
-        self.controller = FinController(self)
+        with phase("FinController (incl. workbook load)"):
+            self.controller = FinController(self)
+
+    def closeEvent(self, event):
+        # Pending background writes must reach the disk before the app quits
+        if self.controller is not None:
+            self.controller.shutdown()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,11 +1,12 @@
 from PyQt5.QtWidgets import (
     QGroupBox, QWidget, QVBoxLayout, QHBoxLayout,
-    QSizePolicy, QTableWidget, QTableWidgetItem, QLayout
+    QSizePolicy, QTableView, QLayout,
+    QPushButton, QLabel, QProgressBar
 )
 from PyQt5.QtCore import Qt
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from .lazy_chart import LazyChart
+from .table_models import EntriesTableModel, MetricsTableModel
 
 """
     OutputPanel displays the right-hand side of the main window UI,
@@ -15,10 +16,13 @@ from matplotlib.figure import Figure
     - A forecast data table showing financial entries (expenses/income)
     - A forecast metrics table with calculated values (net cash flow, closing balance, runway)
     - Two line charts for visualizing net cash flow and runway over time
+    - A sensitivity heatmap of the runway over income / expense factors
 
     Layout structure:
     - Top half: two horizontally aligned tables
-    - Bottom half: two vertically stacked matplotlib charts
+    - Bottom half: two vertically stacked matplotlib charts next to the
+      heatmap, all created on first use (see LazyChart) so matplotlib
+      stays out of startup
 
     Used for displaying all financial results and projections after user input.
 """
@@ -42,7 +46,11 @@ class OutputPanel(QGroupBox):
         self.entries_group = QGroupBox("Forecast Data")
         entries_layout = QVBoxLayout(self.entries_group)
         entries_layout.setContentsMargins(5, 5, 5, 5)
-        self.entries_table = QTableWidget()
+        self.entries_model = EntriesTableModel(self)
+        self.entries_table = QTableView()
+        self.entries_table.setModel(self.entries_model)
+        # Size columns from the visible rows plus a sample, not every category
+        self.entries_table.horizontalHeader().setResizeContentsPrecision(50)
         self.entries_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         entries_layout.addWidget(self.entries_table)
         top_layout.addWidget(self.entries_group, stretch=2)  # 2 out of 4 parts
@@ -50,42 +58,75 @@ class OutputPanel(QGroupBox):
         # Forecast metrics table
         self.forecast_group = QGroupBox("Forecast Metrics")
         forecast_layout = QVBoxLayout(self.forecast_group)
-        self.forecast_table = QTableWidget()
+        self.forecast_model = MetricsTableModel(self)
+        self.forecast_table = QTableView()
+        self.forecast_table.setModel(self.forecast_model)
         self.forecast_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         forecast_layout.addWidget(self.forecast_table)
+
+        # Paging through long forecast horizons
+        pager = QHBoxLayout()
+        self.prevPageBtn = QPushButton("◀", objectName="prevPageBtn")
+        self.nextPageBtn = QPushButton("▶", objectName="nextPageBtn")
+        self.page_label = QLabel("")
+        self.page_label.setAlignment(Qt.AlignCenter)
+        # Busy indicator while the forecast is computed or saved in the background
+        self.busy_bar = QProgressBar(objectName="busyBar")
+        self.busy_bar.setRange(0, 0)  # indeterminate
+        self.busy_bar.setTextVisible(False)
+        self.busy_bar.setFixedSize(80, 10)
+        policy = self.busy_bar.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        self.busy_bar.setSizePolicy(policy)
+        self.busy_bar.hide()
+        pager.addWidget(self.prevPageBtn)
+        pager.addWidget(self.page_label, 1)
+        pager.addWidget(self.busy_bar)
+        pager.addWidget(self.nextPageBtn)
+        forecast_layout.addLayout(pager)
+        self.set_page_info(0, 1)
         top_layout.addWidget(self.forecast_group, stretch=2)  # 2 out of 4 parts
 
         main_layout.addWidget(top_tables)
 
-        # Bottom section
+        # Bottom section: line charts on the left, heatmap on the right
         bottom = QWidget()
-        bottom_layout = QVBoxLayout(bottom)
+        bottom_row = QHBoxLayout(bottom)
+        bottom_row.setContentsMargins(0, 0, 0, 0)
+        bottom_row.setSpacing(10)
+        bottom.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        charts = QWidget()
+        bottom_layout = QVBoxLayout(charts)
         bottom_layout.setContentsMargins(0, 0, 0, 0)
         bottom_layout.setSpacing(5)
-        bottom.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # Limit the height of chart groups
         self.chart_group1 = QGroupBox("Net Cash Flow")
         self.chart_group1.setMaximumHeight(200)
         chart1_layout = QVBoxLayout(self.chart_group1)
         chart1_layout.setContentsMargins(10, 0, 10, 0)
-        self.figure1 = Figure()
-        self.canvas1 = FigureCanvas(self.figure1)
-        self.canvas1.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.canvas1.setFixedHeight(160)
-        chart1_layout.addWidget(self.canvas1)
+        self.chart1 = LazyChart(160)
+        chart1_layout.addWidget(self.chart1)
         bottom_layout.addWidget(self.chart_group1)
 
         self.chart_group2 = QGroupBox("Runway Forecast")
         self.chart_group2.setMaximumHeight(200)
         chart2_layout = QVBoxLayout(self.chart_group2)
         chart2_layout.setContentsMargins(10, 0, 10, 0)
-        self.figure2 = Figure()
-        self.canvas2 = FigureCanvas(self.figure2)
-        self.canvas2.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.canvas2.setFixedHeight(160)
-        chart2_layout.addWidget(self.canvas2)
+        self.chart2 = LazyChart(160)
+        chart2_layout.addWidget(self.chart2)
         bottom_layout.addWidget(self.chart_group2)
+        bottom_row.addWidget(charts, stretch=2)
+
+        # Runway for a grid of scenario factors
+        self.sensitivity_group = QGroupBox("Sensitivity")
+        self.sensitivity_group.setMaximumHeight(405)
+        sensitivity_layout = QVBoxLayout(self.sensitivity_group)
+        sensitivity_layout.setContentsMargins(10, 0, 10, 0)
+        self.sensitivity_chart = LazyChart(365, "Heatmap appears after the first refresh")
+        sensitivity_layout.addWidget(self.sensitivity_chart)
+        bottom_row.addWidget(self.sensitivity_group, stretch=1)
 
         main_layout.addWidget(bottom)
 
@@ -93,28 +134,53 @@ class OutputPanel(QGroupBox):
         main_layout.setStretchFactor(top_tables, 2)
         main_layout.setStretchFactor(bottom, 1)
 
+    # Figures and canvases are created on first access
+    @property
+    def figure1(self):
+        return self.chart1.figure
+
+    @property
+    def canvas1(self):
+        return self.chart1.canvas
+
+    @property
+    def figure2(self):
+        return self.chart2.figure
+
+    @property
+    def canvas2(self):
+        return self.chart2.canvas
+
     def set_entries_data(self, headers: list[str], data: list[list]):
-        self.entries_table.clear()
-        self.entries_table.setColumnCount(len(headers))
-        self.entries_table.setHorizontalHeaderLabels(headers)
-        self.entries_table.setRowCount(len(data))
-        for i, row in enumerate(data):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                self.entries_table.setItem(i, j, item)
-        self.entries_table.resizeColumnsToContents()
+        """
+        Show forecast entries; rows like (group_name,) or (group_name, None)
+        are group headers spanning the table.
+        """
+        changed = self.entries_model.set_grid(headers, data)
+        table = self.entries_table
+        if changed is not None:
+            for column in changed:
+                table.resizeColumnToContents(column)
+            return
+        table.clearSpans()
+        if len(headers) > 1:
+            for row in self.entries_model.group_rows():
+                table.setSpan(row, 0, 1, len(headers))
+        table.resizeColumnsToContents()
 
     def set_forecast_data(self, headers: list[str], data: list[list[str]]):
-        self.forecast_table.clear()
-        self.forecast_table.setColumnCount(len(headers))
-        self.forecast_table.setHorizontalHeaderLabels(headers)
-        self.forecast_table.setRowCount(len(data))
+        changed = self.forecast_model.set_grid(headers, data)
+        if changed is not None:
+            for column in changed:
+                self.forecast_table.resizeColumnToContents(column)
+            return
+        self.forecast_table.resizeColumnsToContents()
+        self.forecast_table.resizeRowsToContents()
 
-        for i, row in enumerate(data):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.forecast_table.setItem(i, j, item)
+    def set_page_info(self, page: int, pages: int):
+        self.page_label.setText(f"Page {page + 1} / {pages}" if pages > 1 else "")
+        self.prevPageBtn.setEnabled(page > 0)
+        self.nextPageBtn.setEnabled(page < pages - 1)
 
-        self.forecast_table.resizeColumnsToContents()
-        self.forecast_table.resizeRowsToContents()
\ No newline at end of file
+    def set_busy(self, busy: bool):
+        self.busy_bar.setVisible(busy)
@@ -0,0 +1,124 @@
+"""
+SeriesChart draws the actual / forecast line chart of one figure and keeps
+its artists between refreshes.
+
+The axes and three Line2D artists (actual, forecast and the dotted
+connector between them) are created once. A refresh only calls set_data()
+on them; when the month labels and y range still fit the current layout
+the lines are blitted over a cached background of the axes, otherwise the
+limits are relaid out and a full redraw is queued with draw_idle(), so
+several refreshes in one event loop pass cost a single draw.
+"""
+
+
+class SeriesChart:
+    Y_MARGIN = 0.1     # padding above/below the data when limits are relaid out
+    MIN_FILL = 0.5     # relayout when the data shrinks below this share of the fitted span
+
+    def __init__(self, figure, canvas):
+        """
+        :param figure: matplotlib Figure owned by this chart
+        :param canvas: FigureCanvas showing the figure
+        """
+        self.figure = figure
+        self.canvas = canvas
+        self.ax = figure.add_subplot(111)
+        self.ax.grid(True)
+        self.ax.set_xlabel("Month")
+
+        # Lines are animated: a full draw renders the axes only, the lines are
+        # drawn on top of the cached background (see _on_draw)
+        self.actual_line, = self.ax.plot([], [], linestyle="-", marker="o", animated=True)
+        self.forecast_line, = self.ax.plot([], [], linestyle="--", marker="x", animated=True)
+        self.connector_line, = self.ax.plot([], [], linestyle=":", linewidth=2, animated=True)
+        self.lines = (self.actual_line, self.forecast_line, self.connector_line)
+
+        self._background = None     # axes pixels without the lines
+        self._draw_pending = False  # full redraw queued with draw_idle
+        self._count = None          # number of months laid out on the x axis
+        self._fitted_span = None    # data span the y limits were fitted to
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def update(self, title: str, data):
+        """
+        Show new series data.
+
+        :param title: chart title
+        :param data: list of (kind, label, value) with kind "actual" or "forecast"
+        """
+        actual = [(i, val) for i, (typ, _, val) in enumerate(data) if typ == "actual"]
+        forecast = [(i, val) for i, (typ, _, val) in enumerate(data) if typ == "forecast"]
+        self._set_line(self.actual_line, actual)
+        self._set_line(self.forecast_line, forecast)
+        if actual and forecast:
+            self._set_line(self.connector_line, [actual[-1], forecast[0]])
+        else:
+            self._set_line(self.connector_line, [])
+
+        relayout = self.ax.get_title() != title
+        relayout |= self._relayout_x(len(data))
+        relayout |= self._relayout_y([float(v) for _, _, v in data])
+        if relayout:
+            self.ax.set_title(title)
+            self.figure.tight_layout()
+            self.redraw()
+        else:
+            self.blit()
+
+    @staticmethod
+    def _set_line(line, points):
+        xs, ys = (list(c) for c in zip(*points)) if points else ([], [])
+        line.set_data(xs, ys)
+
+    def _relayout_x(self, count: int) -> bool:
+        """Set one tick per month if the month count changed."""
+        if count == self._count:
+            return False
+        self._count = count
+        self.ax.set_xticks(list(range(count)))
+        self.ax.set_xlim(-0.5, max(count, 1) - 0.5)
+        return True
+
+    def _relayout_y(self, values: list) -> bool:
+        """
+        Rescale the y axis if the data leaves the view or fills too little of it.
+
+        Small edits inside the current range keep the limits, so they can
+        be blitted without recomputing ticks and layout.
+        """
+        if not values:
+            return False
+        lo, hi = min(values), max(values)
+        bottom, top = self.ax.get_ylim()
+        fitted = self._fitted_span
+        if bottom <= lo and hi <= top and fitted is not None and hi - lo >= self.MIN_FILL * fitted:
+            return False
+        pad = (hi - lo) * self.Y_MARGIN or max(abs(hi), 1.0) * self.Y_MARGIN
+        self.ax.set_ylim(lo - pad, hi + pad)
+        self._fitted_span = hi - lo
+        return True
+
+    def redraw(self):
+        """Queue a full redraw; draws requested in one event loop pass coalesce."""
+        self._draw_pending = True
+        self.canvas.draw_idle()
+
+    def blit(self):
+        """Repaint only the lines over the cached axes background."""
+        if self._draw_pending or self._background is None:
+            # Not drawn yet (or a full draw is queued): that draw shows the lines
+            self.redraw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.ax.bbox)
+
+    def _draw_lines(self):
+        for line in self.lines:
+            self.ax.draw_artist(line)
+
+    def _on_draw(self, event):
+        """After a full draw: cache the background, then paint the lines on it."""
+        self._draw_pending = False
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_lines()
@@ -0,0 +1,122 @@
+"""
+Table models behind the two output tables.
+
+GridTableModel holds the current cell texts of a table. set_grid() compares
+a refresh with what is shown: if the headers and row keys are unchanged
+only the cells whose text differs are reported with dataChanged (one
+signal per changed row span), otherwise the model is reset. The views
+therefore repaint a handful of cells after a typical edit instead of
+rebuilding every item.
+"""
+from typing import Optional
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QBrush, QColor, QFont
+
+
+class GridTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._rows = []    # list of row tuples of str (None for empty cells)
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            col = index.column()
+            return row[col] if col < len(row) else None
+        return self.cell_style(row, index.column(), role)
+
+    def cell_style(self, row: tuple, column: int, role):
+        """Return non-display role data (fonts, alignment, colors) of a cell."""
+        return None
+
+    def row_key(self, row: tuple):
+        """Identity of a row; rows keep their place in the view while keys match."""
+        return row[0] if row else None
+
+    def set_grid(self, headers: list[str], rows: list) -> Optional[list[int]]:
+        """
+        Show new headers and rows, signalling only what changed.
+
+        :param headers: column headers
+        :param rows: sequences of cell texts (None for empty cells)
+        :return: columns whose content changed, or None if the model was
+            reset (callers then resize all columns and restore spans)
+        """
+        rows = [tuple(r) for r in rows]
+        if headers != self._headers or [self.row_key(r) for r in rows] != [self.row_key(r) for r in self._rows]:
+            self.beginResetModel()
+            self._headers = list(headers)
+            self._rows = rows
+            self.endResetModel()
+            return None
+
+        changed_columns = set()
+        old_rows, self._rows = self._rows, rows
+        for i, (old, new) in enumerate(zip(old_rows, rows)):
+            if old == new:
+                continue
+            cols = [j for j in range(max(len(old), len(new)))
+                    if (old[j] if j < len(old) else None) != (new[j] if j < len(new) else None)]
+            changed_columns.update(cols)
+            self.dataChanged.emit(self.index(i, cols[0]), self.index(i, cols[-1]), [Qt.DisplayRole])
+        return sorted(changed_columns)
+
+
+class EntriesTableModel(GridTableModel):
+    """
+    Forecast entries per category and month, grouped under header rows.
+
+    A row with a single cell (or only empty cells after the first) is a
+    group header spanning the whole table.
+    """
+    GROUP_BACKGROUND = QColor(220, 220, 220)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    @staticmethod
+    def is_group(row) -> bool:
+        return len(row) == 1 or all(v is None for v in row[1:])
+
+    def row_key(self, row: tuple):
+        return (row[0], self.is_group(row)) if row else None
+
+    def group_rows(self) -> list[int]:
+        """Indices of the group header rows."""
+        return [i for i, row in enumerate(self._rows) if self.is_group(row)]
+
+    def cell_style(self, row, column, role):
+        if not self.is_group(row):
+            return None
+        if role == Qt.FontRole:
+            return self._bold
+        if role == Qt.BackgroundRole:
+            return QBrush(self.GROUP_BACKGROUND)
+        return None
+
+
+class MetricsTableModel(GridTableModel):
+    """Forecast metrics (net cash flow, closing balance, runway) per month."""
+
+    def cell_style(self, row, column, role):
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
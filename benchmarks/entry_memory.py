@@ -0,0 +1,93 @@
+"""
+Memory benchmark: bytes per Entry before and after the slotted representation.
+
+"Before" replicates the original Entry: a plain dataclass with a per-instance
+__dict__, free-string direction/type and a separately parsed date and Decimal
+for every record. "After" is the current slotted, frozen Entry built through
+Entry.from_dict with a shared cache, as DataStore.load does.
+
+Usage:
+    python benchmarks/entry_memory.py [N ...]     (default: 100000 1000000)
+"""
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+# Allow running as a plain script from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FinPlan.model.category import Category
+from FinPlan.model.entry import Entry
+
+
+@dataclass
+class LegacyEntry:
+    """Original Entry layout: dict-backed dataclass with string fields."""
+    date: date
+    category: Category
+    direction: str
+    amount: Decimal
+    type: str
+
+
+def make_records(n: int) -> list[dict]:
+    """Generate n JSON-style entry dicts resembling a multi-year workbook."""
+    categories = list(Category)
+    records = []
+    for i in range(n):
+        month = i // len(categories)
+        category = categories[i % len(categories)]
+        records.append({
+            "date": date(2000 + month // 12 % 100, month % 12 + 1, 1).isoformat(),
+            "category": category.value,
+            "direction": "expense" if i % len(categories) < 9 else "income",
+            "amount": str((i * 37) % 5000),
+            "type": "actual" if i % 3 else "forecast",
+        })
+    return records
+
+
+def build_legacy(records: list[dict]) -> list:
+    return [
+        LegacyEntry(
+            date=date.fromisoformat(r["date"]),
+            category=Category(r["category"]),
+            direction=r["direction"],
+            amount=Decimal(r["amount"]),
+            type=r["type"],
+        )
+        for r in records
+    ]
+
+
+def build_slotted(records: list[dict]) -> list:
+    shared = {}
+    return [Entry.from_dict(r, shared) for r in records]
+
+
+def measure(builder, records: list[dict]) -> float:
+    """Return bytes allocated per entry by builder(records)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = builder(records)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per_entry = (after - before) / len(result)
+    del result
+    return per_entry
+
+
+def main(sizes: list[int]):
+    print(f"{'entries':>10} {'before B/entry':>15} {'after B/entry':>14} {'saving':>8}")
+    for n in sizes:
+        records = make_records(n)
+        legacy = measure(build_legacy, records)
+        slotted = measure(build_slotted, records)
+        print(f"{n:>10} {legacy:>15.1f} {slotted:>14.1f} {1 - slotted / legacy:>8.1%}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,21 @@
+from datetime import date
+
+import pytest
+
+from FinPlan.model.fin_model import FinModel
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """Path of the JSON workbook used by make_model."""
+    return tmp_path / "w.json"
+
+
+@pytest.fixture
+def make_model(workbook):
+    """Factory for a model on `workbook` with its window starting at period_start."""
+    def make(period_start: date = date(2024, 1, 1)) -> FinModel:
+        model = FinModel(path=workbook)
+        model.set_period_start(period_start)
+        return model
+    return make
@@ -0,0 +1,91 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from FinPlan.model.balance_index import BalanceIndex
+from FinPlan.model.category import Category
+from FinPlan.model.entry import Entry
+from FinPlan.model.metrics import forecast_metrics
+from FinPlan.model.monthly_data import MonthlyData
+from FinPlan.model.scenario import Scenario
+
+MONTHS = [date(2023 + i // 12, i % 12 + 1, 1) for i in range(18)]
+WINDOW = MONTHS[12:15]
+
+
+def workbook() -> dict:
+    """Eighteen months; every third one holds forecasts only, one is empty."""
+    months = {}
+    for i, m in enumerate(MONTHS):
+        if i == 4:
+            months[m] = MonthlyData(m)
+            continue
+        type = "forecast" if i % 3 == 2 or m >= WINDOW[0] else "actual"
+        months[m] = MonthlyData(m, [
+            Entry(m, Category.SubscriptionsPaid, "income", Decimal("1000.10") + i, type),
+            Entry(m, Category.RentAndUtilities, "expense", Decimal("333.33") * (i % 4 + 1), type),
+        ])
+    return months
+
+
+def baseline_opening(months, before: date):
+    """The scan opening balances were computed with before the index."""
+    actual = [md for m, md in months.items()
+              if m < before and any(e.type == "actual" for e in md.entries)]
+    return (sum(md.net_cash_flow for md in actual),
+            sum(md.total_expenses for md in actual), len(actual))
+
+
+def baseline_metrics(months, active_months, scenario):
+    """The original FinModel.generate_forecast_metrics loop over stored months."""
+    forecast_months = []
+    for m in active_months:
+        md = months.get(m)
+        if md:
+            forecast_months.append(scenario.apply(md, preserve_date=True))
+    if not forecast_months:
+        return [], [], [], []
+
+    initial_balance, total_exp_actual, actual_count = baseline_opening(
+        months, forecast_months[0].month)
+    total_weight = actual_count * 2 + len(forecast_months)
+    total_exp_forecast = sum(md.total_expenses for md in forecast_months)
+    weighted_burn = (total_exp_actual * 2 + total_exp_forecast) / total_weight
+
+    headers = [md.month.strftime("%b %Y") for md in forecast_months]
+    net_row, close_row, runway_row = [], [], []
+    balance = initial_balance
+    for fm in forecast_months:
+        balance += fm.net_cash_flow
+        net_row.append(str(fm.net_cash_flow))
+        close_row.append(str(balance))
+        runway_row.append(str(round(balance / weighted_burn, 2)))
+    return headers, net_row, close_row, runway_row
+
+
+def test_prefix_sums_match_a_scan_of_the_months():
+    months = workbook()
+    index = BalanceIndex(months)
+    assert index.last_month == MONTHS[-1]
+    assert index.months == [m for m in MONTHS if months[m].has_actuals]
+    assert len(index.cum_net) == len(index.months) + 1
+    for before in [date(2022, 12, 1)] + MONTHS + [date(2030, 1, 1)]:
+        assert index.opening(before) == baseline_opening(months, before)
+
+    empty = BalanceIndex({})
+    assert empty.last_month is None
+    assert empty.opening(MONTHS[0]) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("name", ["optimistic", "baseline", "pessimistic"])
+def test_forecast_metrics_match_the_baseline_numbers(name):
+    months = workbook()
+    expected = baseline_metrics(months, WINDOW, Scenario(name))
+    assert expected[0] == ["Jan 2024", "Feb 2024", "Mar 2024"]
+    assert forecast_metrics(months, WINDOW, Scenario(name)) == expected
+    assert forecast_metrics(months, WINDOW, Scenario(name), BalanceIndex(months)) == expected
+
+    # Paging only selects columns; balances still run over the whole window
+    page = forecast_metrics(months, WINDOW, Scenario(name), count=1, offset=2)
+    assert page == tuple([row[2]] for row in expected)
@@ -0,0 +1,103 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from FinPlan.model.binary_store import (
+    HEADER, BinaryDataStore, BinaryFormatError, Snapshot, convert, decode_amount, encode_amount, open_store,
+)
+from FinPlan.model.category import Category
+from FinPlan.model.data_store import DataStore
+from FinPlan.model.entry import Entry
+from FinPlan.model.monthly_data import MonthlyData
+
+AMOUNTS = ["0", "12.50", "-3", "1E+3", "0.001", "123456789012345678", "1234567890123456789.5", "-0", "7E-200"]
+
+
+def workbook(amounts=AMOUNTS) -> dict:
+    months = {}
+    for i, text in enumerate(amounts):
+        month = date(2024, i % 12 + 1, 1)
+        md = months.setdefault(month, MonthlyData(month))
+        md.add_entry(Entry(month, list(Category)[i], "income" if i % 2 else "expense",
+                           Decimal(text), "actual" if i % 3 else "forecast"))
+    return months
+
+
+@pytest.mark.parametrize("text", AMOUNTS)
+def test_amount_encoding_is_exact(text):
+    column = []
+    mantissa, exponent = encode_amount(Decimal(text), column)
+    assert str(decode_amount(mantissa, exponent, column)) == text
+
+
+def test_json_binary_json_round_trip(tmp_path):
+    source = tmp_path / "w.json"
+    months = workbook()
+    DataStore(source).write_snapshot(date(2024, 1, 1), 2, months, {"rules": [], "custom": 1})
+
+    convert(source, tmp_path / "w.fpb")
+    convert(tmp_path / "w.fpb", tmp_path / "back.json")
+
+    original, back = json.loads(source.read_text()), json.loads((tmp_path / "back.json").read_text())
+    assert back == original
+    assert back["meta"] == {"period_start": "2024-01-01", "window_offset": 2, "rules": [], "custom": 1}
+    assert not (tmp_path / "back.journal").exists()
+
+
+def test_converting_over_a_journaled_workbook_drops_its_journal(tmp_path):
+    (tmp_path / "w.journal").write_text('{"seq": 1, "op": "meta", "period_start": null, "window_offset": 9}\n')
+    BinaryDataStore(tmp_path / "w.fpb").save(date(2024, 1, 1), 1, workbook())
+    convert(tmp_path / "w.fpb", tmp_path / "w.json")
+    assert not (tmp_path / "w.journal").exists()
+    assert open_store(tmp_path / "w.json").load()[:2] == (date(2024, 1, 1), 1)
+
+
+def test_binary_load_matches_written_months(tmp_path):
+    store = BinaryDataStore(tmp_path / "w.fpb")
+    months = workbook()
+    store.save(date(2024, 1, 1), 1, months, [{"category": "Rent and Utilities"}])
+
+    period_start, window_offset, loaded = store.load()
+    assert (period_start, window_offset) == (date(2024, 1, 1), 1)
+    assert {m: [e.to_dict() for e in md.entries] for m, md in loaded.items()} == \
+           {m: [e.to_dict() for e in md.entries] for m, md in months.items()}
+    assert store.load_rules() == [{"category": "Rent and Utilities"}]
+
+    _, _, lazy = store.load_months()
+    assert lazy.loaded_count == 0
+    assert lazy.records(date(2024, 2, 1)) == [e.to_dict() for e in months[date(2024, 2, 1)].entries]
+
+
+def test_read_meta_reads_only_the_meta_section(tmp_path):
+    store = BinaryDataStore(tmp_path / "w.fpb")
+    store.save(date(2024, 3, 1), 4, workbook())
+    assert store.read_meta() == {"period_start": "2024-03-01", "window_offset": 4}
+
+    data = (tmp_path / "w.fpb").read_bytes()
+    meta_end = 32 + HEADER.unpack_from(data)[5]  # meta starts at the first 8-byte boundary
+    (tmp_path / "w.fpb").write_bytes(data[:meta_end])
+    assert store.read_meta()["window_offset"] == 4
+    with pytest.raises(BinaryFormatError):
+        store.load()
+
+
+def test_snapshot_close_releases_the_map(tmp_path):
+    store = BinaryDataStore(tmp_path / "w.fpb")
+    store.save(None, 0, workbook(AMOUNTS[:5]))
+    with store.open_snapshot() as snapshot:
+        ledger = snapshot.to_ledger()
+    assert snapshot.mantissa is None
+    assert len(ledger.month) == 5
+    assert store.load_ledger().month.tolist() == ledger.month.tolist()
+
+
+@pytest.mark.parametrize("data", [b"", b"FPLB\x01", b"XXXX" + bytes(28)])
+def test_invalid_files_are_rejected(tmp_path, data):
+    path = tmp_path / "bad.fpb"
+    path.write_bytes(data)
+    with pytest.raises(BinaryFormatError):
+        BinaryDataStore(path).load()
+    with pytest.raises(BinaryFormatError):
+        Snapshot(data)
@@ -0,0 +1,101 @@
+import csv
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from FinPlan.model.category import Category
+from FinPlan.model.entry import Entry
+from FinPlan.model.exporter import (
+    LEDGER_FIELDS, ColumnarWriter, export, iter_columnar_rows, read_columnar, read_footer,
+)
+from FinPlan.model.fin_model import FinModel
+
+FIELDS = [("month", "date"), ("label", "str"), ("amount", "decimal"), ("ratio", "float"), ("count", "int")]
+
+
+def rows(n: int) -> list[dict]:
+    return [{
+        "month": date(2020 + i % 7, i % 12 + 1, 1),
+        "label": f"label {i % 5}",
+        "amount": Decimal(i) / 8 - 100,
+        "ratio": i / 3,
+        "count": i * 1000,
+    } for i in range(n)]
+
+
+@pytest.fixture
+def model(make_model) -> FinModel:
+    """Three actual months, two of them closed."""
+    model = make_model()
+    with model.batch():
+        for month in range(1, 4):
+            day = date(2024, month, 1)
+            model.add_entry(Entry(day, Category.PotentialSales, "income", Decimal("1000.10"), "actual"))
+            model.add_entry(Entry(day, Category.RentAndUtilities, "expense", Decimal("250"), "actual"))
+        model.close_period()
+        model.close_period()
+    return model
+
+
+def test_columnar_round_trip_across_row_groups(tmp_path):
+    path = tmp_path / "out.fpc"
+    data = rows(25)
+    with ColumnarWriter(path, FIELDS, {"source": "test"}, row_group_size=10) as writer:
+        assert writer.write_rows(data) == 25
+
+    footer = read_footer(path)
+    assert [g["rows"] for g in footer["row_groups"]] == [10, 10, 5]
+    assert footer["meta"] == {"source": "test"}
+    assert list(iter_columnar_rows(path)) == data
+
+    columns = read_columnar(path, ["month", "amount", "label"])
+    assert set(columns) == {"month", "amount", "label"}
+    assert columns["month"][3] == np.datetime64("2023-04-01")
+    assert columns["amount"].tolist() == [float(r["amount"]) for r in data]
+    assert columns["label"].tolist() == [r["label"] for r in data]
+
+
+def test_decimals_too_large_for_int64_fall_back_to_float(tmp_path):
+    path = tmp_path / "big.fpc"
+    with ColumnarWriter(path, [("amount", "decimal")]) as writer:
+        writer.write_rows([{"amount": Decimal("1E+30")}, {"amount": Decimal("0.5")}])
+    assert [r["amount"] for r in iter_columnar_rows(path)] == [Decimal("1E+30"), Decimal("0.5")]
+
+
+def test_empty_export_and_invalid_files(tmp_path):
+    path = tmp_path / "empty.fpc"
+    with ColumnarWriter(path, LEDGER_FIELDS):
+        pass
+    assert list(iter_columnar_rows(path)) == []
+    assert read_columnar(path)["amount"].size == 0
+
+    (tmp_path / "bad.fpc").write_bytes(b"FPCO not really")
+    with pytest.raises(ValueError):
+        read_footer(tmp_path / "bad.fpc")
+    with pytest.raises(ValueError):
+        ColumnarWriter(tmp_path / "x.fpc", [("when", "time")])
+
+
+def test_ledger_export_matches_in_csv_and_columnar(model, tmp_path):
+    assert export(model, "ledger", tmp_path / "ledger.csv") == 6
+    assert export(model, "ledger", tmp_path / "ledger.fpc") == 6
+
+    with open(tmp_path / "ledger.csv", newline="") as f:
+        from_csv = list(csv.DictReader(f))
+    from_fpc = list(iter_columnar_rows(tmp_path / "ledger.fpc"))
+    assert [Decimal(r["amount"]) for r in from_csv] == [r["amount"] for r in from_fpc]
+    assert from_fpc[0] == {"month": date(2024, 1, 1), "category": "Potential Sales",
+                           "direction": "income", "type": "actual", "amount": Decimal("1000.10")}
+    assert read_footer(tmp_path / "ledger.fpc")["meta"]["window_offset"] == 2
+
+
+def test_forecast_export_follows_the_metrics(model, tmp_path):
+    export(model, "forecast", tmp_path / "forecast.fpc", scenarios=["baseline"])
+    exported = list(iter_columnar_rows(tmp_path / "forecast.fpc"))
+    headers, net_row, close_row, runway_row = model.generate_forecast_metrics("baseline")
+    assert [r["month"] for r in exported] == model.get_active_months()
+    assert [str(r["closing_balance"]) for r in exported] == close_row
+    with pytest.raises(ValueError):
+        export(model, "balances", tmp_path / "x.csv")
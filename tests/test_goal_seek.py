@@ -0,0 +1,71 @@
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from FinPlan.model.goal_seek import DEFAULT_TOLERANCE, seek
+
+MONTHS = [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]
+NO_ACTUALS = (Decimal("0"), Decimal("0"), 0)
+
+
+def window(income=(100, 0), expenses=(150, 0)):
+    """Three identical months; columns are (guaranteed, expected) and (fixed, variable)."""
+    return MONTHS, np.tile(np.array(income, float), (3, 1)), np.tile(np.array(expenses, float), (3, 1))
+
+
+def test_income_factor_is_bracketed_within_tolerance():
+    # 100 * f - 150 >= 0 in every month, so the threshold is f = 1.5
+    result = seek("income", *window(), NO_ACTUALS)
+    assert result.feasible and result.iterations > 1
+    assert 1.5 <= result.value <= 1.5 + DEFAULT_TOLERANCE
+    assert (result.closing >= 0).all()
+
+    coarse = seek("income", *window(), NO_ACTUALS, tolerance=0.1)
+    assert 1.5 <= coarse.value <= 1.6 and coarse.iterations < result.iterations
+
+
+def test_expense_factor_is_the_largest_feasible_one():
+    result = seek("expenses", *window(), NO_ACTUALS)
+    assert 2 / 3 - DEFAULT_TOLERANCE <= result.value <= 2 / 3
+    assert (result.closing >= 0).all()
+
+
+def test_runway_target_and_groups():
+    # Burn is 150 a month, so the first month needs 100 * f - 150 >= 150
+    result = seek("income", *window(), NO_ACTUALS, min_runway=1.0)
+    assert 3.0 <= result.value <= 3.0 + DEFAULT_TOLERANCE
+    assert result.runway.min() >= 1.0
+
+    # Only the expected income scales: 60 + 40 * f >= 150
+    result = seek("income", *window(income=(60, 40)), NO_ACTUALS, groups=("expected",))
+    assert 2.25 <= result.value <= 2.25 + DEFAULT_TOLERANCE
+    with pytest.raises(ValueError):
+        seek("income", *window(), NO_ACTUALS, groups=("fixed",))
+
+
+def test_feasible_bound_and_infeasible_search():
+    rich = (Decimal("1000"), Decimal("0"), 0)
+    result = seek("income", *window(), rich)
+    assert (result.value, result.iterations) == (0.0, 1)
+
+    result = seek("income", *window(), NO_ACTUALS, bounds=(0.0, 1.0))
+    assert not result.feasible and result.value is None
+    # The reported balances are those at the best bound
+    assert result.closing.tolist() == [-50.0, -100.0, -150.0]
+
+
+def test_funding_is_rounded_up_to_cents():
+    result = seek("funding", *window(), (Decimal("-0.001"), Decimal("0"), 0))
+    assert result.value == Decimal("150.01") and result.iterations == 0
+    assert result.closing.min() >= 0
+
+    assert seek("funding", *window(income=(200, 0)), NO_ACTUALS).value == Decimal("0.00")
+
+
+def test_invalid_requests_are_rejected():
+    with pytest.raises(ValueError):
+        seek("profit", *window(), NO_ACTUALS)
+    with pytest.raises(ValueError):
+        seek("income", [], np.zeros((0, 2)), np.zeros((0, 2)), NO_ACTUALS)
@@ -0,0 +1,151 @@
+import zipfile
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from FinPlan.model.category import Category
+from FinPlan.model.entry import Direction, EntryType
+from FinPlan.model.fin_model import FinModel
+from FinPlan.model.importer import LedgerImporter, LedgerImportError
+
+RENT = Category.RentAndUtilities
+SALES = Category.PotentialSales
+NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+
+
+def write_csv(tmp_path, text: str, name: str = "export.csv"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def write_xlsx(tmp_path, rows: list):
+    """Write a minimal one-sheet workbook; numbers become numeric cells."""
+    def cell(ref, value):
+        if isinstance(value, (int, float)):
+            return f'<c r="{ref}"><v>{value}</v></c>'
+        return f'<c r="{ref}" t="inlineStr"><is><t>{value}</t></is></c>'
+
+    sheet = "".join(
+        f'<row r="{r}">' + "".join(cell(f"{'ABCD'[c]}{r}", v) for c, v in enumerate(row)) + "</row>"
+        for r, row in enumerate(rows, 1)
+    )
+    path = tmp_path / "export.xlsx"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("xl/workbook.xml", f'<workbook {NS} xmlns:r="http://schemas.openxmlformats.org/'
+                   'officeDocument/2006/relationships"><sheets><sheet name="Data" sheetId="1" r:id="rId1"/>'
+                   '</sheets></workbook>')
+        z.writestr("xl/_rels/workbook.xml.rels", '<Relationships xmlns="http://schemas.openxmlformats.org/'
+                   'package/2006/relationships"><Relationship Id="rId1" Type="x" Target="worksheets/sheet1.xml"/>'
+                   '</Relationships>')
+        z.writestr("xl/worksheets/sheet1.xml", f"<worksheet {NS}><sheetData>{sheet}</sheetData></worksheet>")
+    return path
+
+
+def total(totals: dict, month: date, category: Category, direction: str, type: str = "actual"):
+    return totals.get((month, category, Direction(direction), EntryType(type)))
+
+
+def test_decimal_comma_and_grouping(tmp_path):
+    path = write_csv(tmp_path, "Date;Category;Amount\n"
+                               "2024-01-05;Potential Sales;1.234,56\n"
+                               "2024-01-20;Potential Sales;0,44\n"
+                               "2024-02-01;Rent and Utilities;-1.000,00\n")
+    totals, result = LedgerImporter(decimal_separator=",").read_totals(path)
+    assert result.errors == 0 and result.imported == 3
+    assert total(totals, date(2024, 1, 1), SALES, "income") == Decimal("1235.00")
+    assert total(totals, date(2024, 2, 1), RENT, "expense") == Decimal("1000.00")
+
+
+def test_accounting_negatives_are_expenses(tmp_path):
+    path = write_csv(tmp_path, "date,category,amount\n"
+                               "2024-03-02,Rent and Utilities,(250.00)\n"
+                               '2024-03-09,Rent and Utilities,"(1,000)"\n')
+    totals, result = LedgerImporter().read_totals(path)
+    assert result.errors == 0
+    assert total(totals, date(2024, 3, 1), RENT, "expense") == Decimal("1250.00")
+
+
+def test_negative_amount_flips_the_direction_column(tmp_path):
+    path = write_csv(tmp_path, "date,category,direction,amount\n"
+                               "2024-01-05,Potential Sales,income,100\n"
+                               "2024-01-06,Potential Sales,expense,-30\n"
+                               "2024-01-07,Rent and Utilities,debit,40\n")
+    totals, result = LedgerImporter().read_totals(path)
+    assert result.errors == 0
+    assert total(totals, date(2024, 1, 1), SALES, "income") == Decimal("130")
+    assert total(totals, date(2024, 1, 1), RENT, "expense") == Decimal("40")
+
+
+def test_direction_must_match_the_category(tmp_path):
+    path = write_csv(tmp_path, "date,category,direction,amount\n"
+                               "2024-01-05,Rent and Utilities,income,100\n"
+                               "2024-01-06,Rent and Utilities,expense,-20\n"
+                               "2024-01-07,Potential Sales,expense,5\n")
+    totals, result = LedgerImporter().read_totals(path)
+    assert totals == {}
+    assert result.errors == 3
+    assert [number for number, _ in result.error_samples] == [2, 3, 4]
+    assert "expense category 'Rent and Utilities'" in result.error_samples[0][1]
+
+
+def test_excel_serial_dates(tmp_path):
+    path = write_xlsx(tmp_path, [
+        ["Date", "Category", "Amount"],
+        [45292, "Potential Sales", 1200.5],       # 2024-01-01
+        [45351.75, "Rent and Utilities", -99.5],  # 2024-02-29 18:00
+        ["2024-03-15", "Rent and Utilities", -10],
+    ])
+    totals, result = LedgerImporter().read_totals(path)
+    assert result.errors == 0
+    assert total(totals, date(2024, 1, 1), SALES, "income") == Decimal("1200.5")
+    assert total(totals, date(2024, 2, 1), RENT, "expense") == Decimal("99.5")
+    assert total(totals, date(2024, 3, 1), RENT, "expense") == Decimal("10")
+
+
+def test_invalid_rows_are_counted_and_skipped(tmp_path):
+    path = write_csv(tmp_path, "date,category,amount\n"
+                               "2024-13-01,Potential Sales,5\n"
+                               "2024-01-01,Bank Fees,-5\n"
+                               "2024-01-01,Potential Sales,abc\n"
+                               "\n"
+                               "2024-01-01,Potential Sales,7\n")
+    totals, result = LedgerImporter().read_totals(path)
+    assert (result.rows, result.imported, result.errors) == (4, 1, 3)
+    assert [number for number, _ in result.error_samples] == [2, 3, 4]
+    assert total(totals, date(2024, 1, 1), SALES, "income") == Decimal("7")
+
+
+def test_max_errors_aborts_without_touching_the_model(tmp_path):
+    path = write_csv(tmp_path, "date,category,amount\n"
+                               "2024-01-01,Potential Sales,7\n"
+                               "2024-01-01,Bank Fees,-5\n"
+                               "2024-01-02,Bank Fees,-5\n")
+    model = FinModel(path=tmp_path / "w.json")
+    LedgerImporter(max_errors=2).import_into(model, path)  # two bad rows are tolerated
+    with pytest.raises(LedgerImportError, match="row 4"):
+        LedgerImporter(max_errors=1).import_into(model, path)
+    assert model.months[date(2024, 1, 1)].get(SALES, "income", "actual").amount == Decimal("7")
+
+
+def test_import_adds_to_existing_totals_or_replaces(tmp_path):
+    path = write_csv(tmp_path, "date,category,amount\n2024-01-01,Bank Fees,-5\n2024-01-09,Bank Fees,-2.5\n")
+    model = FinModel(path=tmp_path / "w.json")
+    importer = LedgerImporter(category_map={"Bank Fees": "Other Expenses"})
+    result = importer.import_into(model, path)
+    importer.import_into(model, path)
+    assert result.entries_written == 1 and result.months == [date(2024, 1, 1)]
+    other = Category.OtherExpenses
+    assert model.months[date(2024, 1, 1)].get(other, "expense", "actual").amount == Decimal("15")
+
+    LedgerImporter(category_map={"Bank Fees": "Other Expenses"}, replace=True).import_into(model, path)
+    reloaded = FinModel(path=tmp_path / "w.json")
+    assert reloaded.months[date(2024, 1, 1)].get(other, "expense", "actual").amount == Decimal("7.5")
+
+
+def test_missing_columns_and_file_types_are_rejected(tmp_path):
+    with pytest.raises(LedgerImportError):
+        LedgerImporter().read_totals(write_csv(tmp_path, "date,amount\n2024-01-01,5\n"))
+    with pytest.raises(LedgerImportError):
+        LedgerImporter().read_totals(write_csv(tmp_path, "", name="export.ods"))
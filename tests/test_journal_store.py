@@ -0,0 +1,86 @@
+from datetime import date
+from decimal import Decimal
+
+from FinPlan.model.binary_store import open_store
+from FinPlan.model.category import Category
+from FinPlan.model.entry import Entry
+from FinPlan.model.fin_model import FinModel
+from FinPlan.model.journal_store import JournalDataStore
+
+
+def rent(month: date, amount: str) -> Entry:
+    return Entry(month, Category.RentAndUtilities, "expense", Decimal(amount), "forecast")
+
+
+def test_json_workbooks_default_to_the_journal_store(workbook):
+    assert type(open_store(workbook)) is JournalDataStore
+    assert type(FinModel(path=workbook).store) is JournalDataStore
+
+
+def test_changes_are_appended_and_replayed(workbook, make_model):
+    model = make_model()
+    model.upsert_entry(rent(date(2024, 1, 1), "100"))
+    model.upsert_entry(rent(date(2024, 1, 1), "120"))
+    model.add_entry(rent(date(2024, 2, 1), "50"))
+    model.close_period()
+
+    assert not workbook.exists()  # nothing compacted yet, only the journal
+    assert len(workbook.with_suffix(".journal").read_text().splitlines()) == 5
+
+    reloaded = FinModel(store=JournalDataStore(workbook))
+    assert reloaded.window_offset == 1
+    assert reloaded.period_start == date(2024, 1, 1)
+    assert reloaded.get_overview() == model.get_overview()
+    assert reloaded.months[date(2024, 1, 1)].get(
+        Category.RentAndUtilities, "expense", "forecast").amount == Decimal("120")
+
+
+def test_replay_loads_only_journaled_months(workbook, make_model):
+    model = make_model()
+    for month in range(1, 13):
+        model.add_entry(rent(date(2024, month, 1), "10"))
+    model.store.save(model.period_start, model.window_offset, model.months)
+    model.upsert_entry(rent(date(2024, 3, 1), "30"))
+
+    reloaded = FinModel(store=JournalDataStore(workbook))
+    assert reloaded.months.loaded_count == 1
+    assert reloaded.months[date(2024, 3, 1)].entries[0].amount == Decimal("30")
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(workbook, make_model, monkeypatch):
+    monkeypatch.setattr(JournalDataStore, "COMPACT_BYTES", 400)
+    model = make_model()
+    for month in range(1, 7):
+        model.add_entry(rent(date(2024, month, 1), str(month)))
+
+    assert workbook.exists()
+    assert workbook.with_suffix(".journal").stat().st_size < 400
+    reloaded = FinModel(store=JournalDataStore(workbook))
+    assert reloaded.get_overview() == model.get_overview()
+    # Records folded into the snapshot are not replayed a second time
+    assert len(reloaded.months[date(2024, 1, 1)].entries) == 1
+
+
+def test_records_older_than_the_snapshot_are_skipped(workbook, make_model):
+    model = make_model()
+    model.add_entry(rent(date(2024, 1, 1), "10"))
+    journal = workbook.with_suffix(".journal").read_text()
+    model.store.save(model.period_start, model.window_offset, model.months)
+    # Crash between writing the snapshot and truncating the journal
+    workbook.with_suffix(".journal").write_text(journal)
+
+    reloaded = FinModel(store=JournalDataStore(workbook))
+    assert reloaded.months[date(2024, 1, 1)].entries[0].amount == Decimal("10")
+
+
+def test_torn_last_record_is_dropped_and_compacted(workbook, make_model):
+    model = make_model()
+    model.add_entry(rent(date(2024, 1, 1), "10"))
+    with open(workbook.with_suffix(".journal"), "a") as f:
+        f.write('{"seq": 99, "op": "add", "ent')
+
+    reloaded = FinModel(store=JournalDataStore(workbook))
+    assert reloaded.get_overview() == model.get_overview()
+    assert workbook.with_suffix(".journal").read_text() == ""
+    reloaded.add_entry(rent(date(2024, 2, 1), "5"))
+    assert len(FinModel(store=JournalDataStore(workbook)).months) == 2
@@ -0,0 +1,78 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from FinPlan.model.category import Category
+from FinPlan.model.data_store import DataStore, JsonMonthSource
+from FinPlan.model.entry import Entry
+from FinPlan.model.lazy_months import LazyMonths
+from FinPlan.model.monthly_data import MonthlyData
+
+RAW = {
+    "2024-01": [
+        {"date": "2024-01-01", "category": "Potential Sales", "direction": "income", "amount": "100", "type": "actual"},
+        {"date": "2024-01-01", "category": "Rent and Utilities", "direction": "expense", "amount": "40", "type": "actual"},
+    ],
+    "2024-02": [
+        {"date": "2024-02-01", "category": "Rent and Utilities", "direction": "expense", "amount": "40", "type": "forecast"},
+    ],
+    "bad-key": [],
+}
+
+
+def lazy() -> LazyMonths:
+    return LazyMonths(source=JsonMonthSource(RAW))
+
+
+def test_keys_and_summaries_do_not_load_months():
+    months = lazy()
+    assert list(months) == [date(2024, 1, 1), date(2024, 2, 1)]
+    assert date(2024, 2, 1) in months and len(months) == 2
+    summaries = months.summaries()
+    assert summaries[date(2024, 1, 1)].net_cash_flow == Decimal("60")
+    assert summaries[date(2024, 2, 1)].total("expense", "forecast") == Decimal("40")
+    assert not summaries[date(2024, 2, 1)].has_actuals
+    assert months.loaded_count == 0
+
+
+def test_reading_a_month_loads_it_once():
+    months = lazy()
+    january = months[date(2024, 1, 1)]
+    assert months.is_loaded(date(2024, 1, 1)) and not months.is_loaded(date(2024, 2, 1))
+    assert months[date(2024, 1, 1)] is january
+    assert january.net_cash_flow == Decimal("60")
+    assert months.get(date(2023, 12, 1)) is None
+    with pytest.raises(KeyError):
+        months[date(2023, 12, 1)]
+
+
+def test_loaded_months_drop_their_raw_records():
+    source = JsonMonthSource(RAW)
+    months = LazyMonths(source=source)
+    months[date(2024, 1, 1)].add_entry(
+        Entry(date(2024, 1, 1), Category.TaxesAndFees, "expense", Decimal("5"), "actual"))
+    assert date(2024, 1, 1) not in source._raw
+    # records() now comes from the loaded (edited) month
+    assert len(months.records(date(2024, 1, 1))) == 3
+    assert months.records(date(2024, 2, 1)) == RAW["2024-02"]
+
+
+def test_writes_and_deletes_stay_in_memory():
+    months = lazy()
+    months[date(2024, 3, 1)] = MonthlyData(date(2024, 3, 1))
+    del months[date(2024, 2, 1)]
+    assert list(months) == [date(2024, 1, 1), date(2024, 3, 1)]
+    assert months.loaded_count == 1
+    months.clear()
+    assert len(months) == 0
+
+
+def test_lazy_save_round_trip_keeps_unloaded_months(tmp_path):
+    store = DataStore(tmp_path / "w.json")
+    store.save(date(2024, 1, 1), 0, lazy())
+    period_start, _, months = store.load_months()
+    assert period_start == date(2024, 1, 1)
+    assert months.loaded_count == 0
+    assert months.records(date(2024, 1, 1)) == RAW["2024-01"]
+    assert dict(store.load()[2])[date(2024, 2, 1)].entries[0].type == "forecast"
@@ -0,0 +1,68 @@
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from FinPlan.model import monte_carlo
+from FinPlan.model.category import Category
+from FinPlan.model.entry import Entry
+from FinPlan.model.ledger import CATEGORIES
+from FinPlan.model.monte_carlo import MonteCarloEngine
+
+# Every category materializes unchanged: the simulation is deterministic
+CERTAIN = {c.value: {"probability": 1.0, "spread": 0.0} for c in CATEGORIES}
+
+
+@pytest.fixture
+def model(make_model):
+    """December actuals before a Jan-Mar window whose forecast is carried forward."""
+    model = make_model()
+    with model.batch():
+        for day, type in ((date(2023, 12, 1), "actual"), (date(2024, 1, 1), "forecast")):
+            model.add_entry(Entry(day, Category.SubscriptionsPaid, "income", Decimal("1200.50"), type))
+            model.add_entry(Entry(day, Category.PotentialSales, "income", Decimal("300"), type))
+            model.add_entry(Entry(day, Category.RentAndUtilities, "expense", Decimal("900.25"), type))
+    return model
+
+
+def test_fixed_seed_does_not_depend_on_the_worker_count(model):
+    # Past PARALLEL_PATHS the batches run in the process pool
+    paths = monte_carlo.PARALLEL_PATHS + 500
+    inline = model.simulate("baseline", paths=paths, seed=11, workers=1)
+    pooled = model.simulate("baseline", paths=paths, seed=11, workers=2)
+    assert inline.paths == pooled.paths == paths
+    assert np.array_equal(inline.closing, pooled.closing)
+    assert np.array_equal(inline.runway, pooled.runway)
+
+    other = model.simulate("baseline", paths=1000, seed=12, workers=1)
+    assert not np.array_equal(inline.closing[:1000], other.closing)
+
+
+@pytest.mark.parametrize("name", ["optimistic", "baseline", "pessimistic"])
+def test_certain_amounts_match_the_forecast_metrics(model, name):
+    _, _, closes, runways = model.generate_forecast_metrics(name)
+    result = model.simulate(name, paths=3, seed=1, workers=1, distributions=CERTAIN)
+    assert result.months == model.get_active_months()
+    for percentile in result.closing_percentiles().values():
+        assert percentile == pytest.approx([float(c) for c in closes])
+    assert result.runway == pytest.approx([float(runways[-1])] * 3, abs=0.005)
+    assert not result.insolvency().any()
+
+
+def test_actuals_in_the_window_are_not_scaled(model):
+    # Unlike forecast_metrics, the simulation keeps realized amounts as they are
+    model.add_entry(Entry(date(2024, 1, 1), Category.OtherExpenses, "expense", Decimal("100"), "actual"))
+    _, _, closes, _ = model.generate_forecast_metrics("pessimistic")
+    result = model.simulate("pessimistic", paths=3, seed=1, workers=1, distributions=CERTAIN)
+    p50 = result.closing_percentiles()[50]
+    # January: the 100 actual costs 100 instead of 120; later months carry it
+    assert p50[0] == pytest.approx(float(closes[0]) + 20)
+    assert p50[-1] == pytest.approx(float(closes[-1]) + 60)
+
+
+def test_engine_validation_and_empty_window():
+    with pytest.raises(ValueError):
+        MonteCarloEngine(paths=0)
+    result = MonteCarloEngine(paths=5, seed=1).simulate([], None, None)
+    assert result.closing.shape == (5, 0) and result.paths == 5
@@ -0,0 +1,141 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from FinPlan.model import recurring
+from FinPlan.model.category import Category
+from FinPlan.model.entry import Entry
+from FinPlan.model.fin_model import FinModel
+from FinPlan.model.monthly_data import MonthlyData
+from FinPlan.model.recurring import RecurringRule, RuleSet
+
+RENT = Category.RentAndUtilities
+SALES = Category.PotentialSales
+
+
+def rent_rule(**kwargs) -> RecurringRule:
+    return RecurringRule(RENT, "expense", Decimal("200"), date(2024, 1, 15), **kwargs)
+
+
+def test_amount_follows_interval_end_and_growth():
+    rule = rent_rule(end=date(2026, 6, 1), every=3, growth=Decimal("0.05"))
+    assert rule.start == date(2024, 1, 1)
+    assert rule.amount_in(date(2023, 12, 1)) is None
+    assert rule.amount_in(date(2024, 1, 1)) == Decimal("200")
+    assert rule.amount_in(date(2024, 2, 1)) is None
+    assert rule.amount_in(date(2024, 10, 1)) == Decimal("200")
+    assert rule.amount_in(date(2025, 1, 1)) == Decimal("210.00")
+    assert rule.amount_in(date(2026, 4, 1)) == Decimal("220.50")
+    assert rule.amount_in(date(2026, 7, 1)) is None
+
+
+def test_invalid_rules_and_dict_round_trip():
+    with pytest.raises(ValueError):
+        rent_rule(end=date(2023, 12, 1))
+    with pytest.raises(ValueError):
+        rent_rule(every=0)
+    rule = rent_rule(end=date(2025, 1, 1), every=12, growth=Decimal("0.1"))
+    assert RecurringRule.from_dict(rule.to_dict()) == rule
+    assert RuleSet.from_list(RuleSet([rule, rent_rule()]).to_list()).rules == [rule, rent_rule()]
+
+
+def test_rules_of_one_category_are_summed_and_stored_entries_win():
+    rules = RuleSet([rent_rule(), rent_rule(every=2)])
+    rules.add(RecurringRule(SALES, "income", Decimal("50"), date(2024, 1, 1)))
+    entries = {(e.category, e.direction): e.amount for e in rules.entries(date(2024, 3, 1))}
+    assert entries == {(RENT, "expense"): Decimal("400"), (SALES, "income"): Decimal("50")}
+    assert all(e.type == "forecast" for e in rules.entries(date(2024, 3, 1)))
+
+    md = MonthlyData(date(2024, 3, 1))
+    md.add_entry(Entry(date(2024, 3, 1), RENT, "expense", Decimal("999"), "actual"))
+    merged = rules.merge(md, date(2024, 3, 1))
+    assert merged is not md and len(md.entries) == 1
+    assert merged.get(RENT, "expense", "actual").amount == Decimal("999")
+    assert merged.get(RENT, "expense", "forecast") is None
+    assert merged.get(SALES, "income", "forecast").amount == Decimal("50")
+    assert RuleSet().merge(md, date(2024, 3, 1)) is md
+
+
+def test_expansion_cache_is_bounded_and_reset_on_change(monkeypatch):
+    monkeypatch.setattr(recurring, "CACHE_MONTHS", 3)
+    rules = RuleSet([rent_rule()])
+    for month in range(1, 6):
+        rules.entries(date(2024, month, 1))
+    assert list(rules._cache) == [date(2024, 3, 1), date(2024, 4, 1), date(2024, 5, 1)]
+    rules.entries(date(2024, 3, 1))
+    rules.entries(date(2024, 6, 1))
+    assert list(rules._cache) == [date(2024, 5, 1), date(2024, 3, 1), date(2024, 6, 1)]
+    rules.remove(0)
+    assert rules.entries(date(2024, 3, 1)) == []
+
+
+def test_window_months_stay_implicit(make_model):
+    model = make_model(date(2024, 3, 1))
+    model.add_rule(RecurringRule(SALES, "income", Decimal("100"), date(2024, 3, 1)))
+    assert date(2024, 3, 1) not in model.months
+    assert model.month_view(date(2024, 3, 1)).get(SALES, "income", "forecast").amount == Decimal("100")
+    assert model.month_view(date(2024, 2, 1)) is None
+
+    model.actualize_month(date(2024, 3, 1))
+    assert model.months[date(2024, 3, 1)].get(SALES, "income", "actual").amount == Decimal("100")
+    model.remove_rule(0)
+    assert model.months[date(2024, 3, 1)].get(SALES, "income", "actual").amount == Decimal("100")
+
+
+def test_months_before_the_window_count_as_actuals(workbook, make_model):
+    model = make_model(date(2024, 3, 1))
+    model.add_entry(Entry(date(2024, 2, 1), RENT, "expense", Decimal("80"), "actual"))
+    model.add_rule(rent_rule())
+
+    # January and February precede the window; February keeps its own entry
+    assert list(model.months) == [date(2024, 2, 1)]
+    assert model.aggregates()[date(2024, 1, 1)].total("expense", "actual") == Decimal("200")
+    assert model.balance_index().opening(date(2024, 3, 1)) == (Decimal("-280"), Decimal("280"), 2)
+
+    # Only the month leaving the window is stored
+    model.close_period()
+    assert model.months[date(2024, 3, 1)].get(RENT, "expense", "actual").amount == Decimal("200")
+    assert list(model.months) == [date(2024, 2, 1), date(2024, 3, 1)]
+
+    reloaded = FinModel(path=workbook)
+    assert reloaded.balance_index().opening(date(2024, 4, 1)) == (Decimal("-480"), Decimal("480"), 3)
+
+    # Removing the rule keeps the closed month only
+    reloaded.remove_rule(0)
+    assert reloaded.balance_index().opening(date(2024, 4, 1)) == (Decimal("-280"), Decimal("280"), 2)
+
+
+def test_old_rules_do_not_store_their_history(workbook, make_model):
+    model = make_model()
+    model.add_rule(RecurringRule(Category.LoanPrincipal, "expense", Decimal("10"), date(2004, 1, 1)))
+    assert len(model.months) == 0
+    assert model.balance_index().opening(date(2024, 1, 1)) == (Decimal("-2400"), Decimal("2400"), 240)
+    assert len(FinModel(path=workbook).months) == 0
+
+
+def test_failed_batch_rolls_back_materialized_months(workbook, make_model):
+    model = make_model(date(2024, 3, 1))
+    with pytest.raises(RuntimeError):
+        with model.batch():
+            model.add_rule(rent_rule())
+            model.close_period()
+            assert date(2024, 3, 1) in model.months
+            raise RuntimeError("abort")
+    assert len(model.months) == 0 and len(model.rules) == 0
+    assert model.window_offset == 0
+    assert len(FinModel(path=workbook).months) == 0
+
+
+def test_rules_add_to_carried_forward_months(make_model):
+    model = make_model()
+    model.add_entry(Entry(date(2024, 1, 1), SALES, "income", Decimal("1000"), "forecast"))
+    model.add_entry(Entry(date(2024, 1, 1), RENT, "expense", Decimal("300"), "forecast"))
+    assert model.generate_forecast_metrics("baseline")[1] == ["700.0", "700.0", "700.0"]
+
+    # February and March repeat January, plus their own rule entries
+    model.add_rule(RecurringRule(Category.LoanPrincipal, "expense", Decimal("10"), date(2024, 1, 1)))
+    model.add_rule(RecurringRule(Category.LoanInterests, "expense", Decimal("5"), date(2024, 2, 1)))
+    assert model.generate_forecast_metrics("baseline")[1] == ["690.0", "685.0", "685.0"]
+    assert model.sweep([1.0], [1.0]).closing.ravel().tolist() == [690.0, 1375.0, 2060.0]
+    assert model.get_overview() == [(date(2024, 1, 1), Decimal("700"))]
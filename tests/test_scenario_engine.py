@@ -0,0 +1,91 @@
+from datetime import date
+from decimal import (
+    Decimal, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN,
+    ROUND_UP, ROUND_DOWN, ROUND_CEILING, ROUND_FLOOR, ROUND_05UP,
+)
+
+import numpy as np
+import pytest
+
+from FinPlan.model.category import Category
+from FinPlan.model.constants import SCENARIO_FACTORS
+from FinPlan.model.entry import Entry
+from FinPlan.model.ledger import Ledger, MonthTotals, from_cents
+from FinPlan.model.monthly_data import MonthlyData
+from FinPlan.model.scenario import Scenario
+from FinPlan.model.scenario_engine import ScenarioEngine, divide_rounded, factor_ratio
+
+CENT = Decimal("0.01")
+ROUNDINGS = [ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN, ROUND_UP,
+             ROUND_DOWN, ROUND_CEILING, ROUND_FLOOR, ROUND_05UP]
+
+
+def test_factor_ratio_is_exact():
+    assert factor_ratio(Decimal("1.3")) == (13, 10)
+    assert factor_ratio("0.125") == (125, 1000)
+    assert factor_ratio(2) == (2, 1)
+    assert factor_ratio(Decimal("-0.7")) == (-7, 10)
+
+
+@pytest.mark.parametrize("rounding", ROUNDINGS)
+def test_divide_rounded_matches_decimal_quantize(rounding):
+    # Every remainder of both signs, including exact halves
+    values = np.arange(-2000, 2001, dtype=np.int64)
+    for denominator in (2, 10, 40, 1000):
+        expected = [int((Decimal(int(v)) / denominator).quantize(Decimal(1), rounding))
+                    for v in values]
+        assert divide_rounded(values, denominator, rounding).tolist() == expected
+
+
+def test_divide_rounded_rejects_unknown_modes():
+    with pytest.raises(ValueError):
+        divide_rounded([5], 2, "ROUND_SIDEWAYS")
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIO_FACTORS))
+@pytest.mark.parametrize("rounding", [ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_FLOOR])
+def test_project_matches_the_decimal_scenario_in_cents(name, rounding):
+    rng = np.random.default_rng(7)
+    months = {}
+    for i in range(24):
+        m = date(2023 + i // 12, i % 12 + 1, 1)
+        md = MonthlyData(m)
+        income, expense = rng.integers(0, 10**9, 2)
+        md.add_entry(Entry(m, Category.PotentialSales, "income", from_cents(income), "forecast"))
+        md.add_entry(Entry(m, Category.RentAndUtilities, "expense", from_cents(expense),
+                           "actual" if i % 2 else "forecast"))
+        months[m] = md
+
+    projected = ScenarioEngine.from_name(name, rounding).project(MonthTotals.from_months(months))
+    scenario = Scenario(name)
+    expected = {}
+    for m, md in months.items():
+        income, expenses = (v.quantize(CENT, rounding) for v in scenario.project(md))
+        expected[m] = (income, expenses, income - expenses)
+    assert projected.as_decimals() == expected
+    assert projected.month_dates() == sorted(months)
+
+
+def test_project_selects_months_and_scales_ledger_rows():
+    months = {
+        date(2024, m, 1): MonthlyData(date(2024, m, 1), [
+            Entry(date(2024, m, 1), Category.PotentialSales, "income", Decimal("0.05"), "forecast"),
+            Entry(date(2024, m, 1), Category.OtherExpenses, "expense", Decimal("0.15"), "actual"),
+        ])
+        for m in (1, 2, 3)
+    }
+    engine = ScenarioEngine.from_name("pessimistic")
+    projected = engine.project(MonthTotals.from_months(months), [date(2024, 2, 1)])
+    # 0.05 * 0.7 = 0.035 -> 0.04 and 0.15 * 1.2 = 0.18 (half-even)
+    assert projected.as_decimals() == {
+        date(2024, 2, 1): (Decimal("0.04"), Decimal("0.18"), Decimal("-0.14"))
+    }
+
+    # Ledger rows are rounded one by one, like Scenario.apply() per entry
+    rows = engine.project_ledger(Ledger.from_months(months))
+    expected = [e.amount.quantize(CENT, ROUND_HALF_EVEN)
+                for md in months.values() for e in Scenario("pessimistic").apply(md).entries]
+    assert [e.amount for e in rows.entries()] == expected
+    assert {e.type for e in rows.entries()} == {"forecast"}
+    with pytest.raises(ValueError):
+        ScenarioEngine.from_name("unknown")